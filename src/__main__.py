@@ -0,0 +1,12 @@
+# __main__.py
+# 包入口：python src 或 python -m src 时启动主游戏
+import sys
+import os
+
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from main import main
+
+main()
@@ -1,8 +1,12 @@
 # settings.py
 import pygame
+import os
 
 # Debug 配置
-DEBUG_COMBAT_LOG = True  # 是否打印战斗日志（攻击、伤害、格挡、闪避等）
+DEBUG_COMBAT_LOG = True  # 是否记录战斗日志（攻击、伤害、格挡、闪避等，由后台线程写入文件）
+COMBAT_LOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs", "combat.jsonl")
+COMBAT_LOG_FLUSH_INTERVAL = 0.5  # 秒，后台线程整批写入的间隔
+DEBUG_STARTUP_TIMING = True  # 是否打印启动耗时报告
 
 # I. 核心配置与初始化 (来自设计说明)
 SCREEN_WIDTH = 1200
@@ -78,10 +82,17 @@ GHOUL_DASH_ACCEL_TIME = 0.5  # 加速到最高速的时间
 
 # 铁桶圆环参数
 BUCKET_RING_THICKNESS = 2  # 圆环粗细
+BUCKET_RING_FRAMES = 50  # 每种圆环（配色 × 攻击范围）扩散过程的预渲染帧数（200px 步长 4px，庞然 400px 步长 8px）
 
 # 尸爆参数
 CORPSE_EXPLOSION_DELAY = 0.5  # 尸爆延迟（秒）
 CORPSE_EXPLOSION_RANGE = 300  # 尸爆范围（像素）
+CORPSE_EXPLOSION_FRAMES = 30  # 扩散动画预渲染帧数（0.5秒扩散 × 60 FPS，每个显示帧都不同）
+CORPSE_EXPLOSION_SIZE_STEP = 25  # 最大半径按此步长分档共享帧（像素）
+
+# 尸爆预渲染帧缓存上限（总像素数，约 4 字节/像素）
+# 可同时容纳普通尸爆（300px，约 3.6M）与庞然尸爆（500px，约 10M）的全部帧
+CORPSE_EXPLOSION_CACHE_MAX_PIXELS = 16000000
 
 # 调试绘制开关：是否绘制碰撞形状（调试用）
 DEBUG_DRAW_COLLISIONS = False
\ No newline at end of file
@@ -0,0 +1,224 @@
+# assets.py
+# 进程级资源管理：贴图 / 精灵只解码并 convert 一次（按路径、尺寸、修改时间缓存），
+# 解析后的 CityMap 及其派生的墙体碰撞器也在重新开始游戏时复用。
+# 批量加载时图像在线程池中解码（SDL_image 解码期间释放 GIL），主线程只做 convert。
+
+import pygame
+import time
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+# 添加父目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import config
+from systems.citymap.citymap import CityMap
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif')
+MAX_DECODE_WORKERS = 8
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _decode_image(path, size):
+    """工作线程：解码（并缩放）为未转换像素格式的 Surface，不涉及显示设备"""
+    image = pygame.image.load(path)
+    if size is not None:
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+class StartupReport:
+    """启动耗时统计：记录各阶段用时并打印报告"""
+    def __init__(self):
+        self.entries = []  # [(阶段名称, 秒), ...]
+
+    @contextmanager
+    def phase(self, label):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.entries.append((label, time.perf_counter() - start))
+
+    def add(self, label, seconds):
+        self.entries.append((label, seconds))
+
+    def clear(self):
+        self.entries.clear()
+
+    def print_report(self):
+        total = sum(seconds for label, seconds in self.entries if not label.startswith('  '))
+        print("--- 启动耗时 ---")
+        for label, seconds in self.entries:
+            print(f"{label:<28}{seconds * 1000:8.1f} ms")
+        print(f"{'合计':<28}{total * 1000:8.1f} ms")
+
+
+class AssetManager:
+    """
+    资源缓存。所有接口在文件未修改时直接返回缓存对象，调用方不得修改返回的 Surface。
+    """
+    def __init__(self):
+        self._images = {}   # {(path, size, alpha): (mtime, Surface)}
+        self._dirs = {}     # {directory: (mtime, [文件名, ...])}
+        self._memo = {}     # {key: (依赖文件的 mtime 元组, 值)}
+        self._maps = {}     # {map_string: CityMap}
+        self._walls = {}    # {id(CityMap): (CityMap, Group)}
+
+    def clear(self):
+        self._images.clear()
+        self._dirs.clear()
+        self._memo.clear()
+        self._maps.clear()
+        self._walls.clear()
+
+    # --- 图像 ---
+
+    def load_image(self, path, size=None, alpha=True):
+        """
+        加载并转换图像（alpha=True 使用 convert_alpha，否则 convert）。
+        size 不为 None 时缩放到 (w, h)。文件修改后自动重新加载；加载失败抛出异常。
+        """
+        path = os.path.normpath(path)
+        key = (path, size, alpha)
+        mtime = _mtime(path)
+        entry = self._images.get(key)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        image = _decode_image(path, size)
+        image = image.convert_alpha() if alpha else image.convert()
+        self._images[key] = (mtime, image)
+        return image
+
+    def preload_images(self, requests, workers=None):
+        """
+        并行解码 requests = [(path, size, alpha), ...] 中尚未缓存（或已修改）的图像。
+        解码在线程池中完成，convert 在调用线程（主线程）完成；失败的文件跳过，
+        之后由 load_image 重新加载并报告错误。返回本次解码的图像数量。
+        """
+        pending = []
+        for path, size, alpha in requests:
+            path = os.path.normpath(path)
+            key = (path, size, alpha)
+            mtime = _mtime(path)
+            if mtime is None:
+                continue
+            entry = self._images.get(key)
+            if entry is None or entry[0] != mtime:
+                pending.append((key, mtime))
+        if not pending:
+            return 0
+
+        start = time.perf_counter()
+        workers = workers or min(MAX_DECODE_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [(key, mtime, pool.submit(_decode_image, key[0], key[1]))
+                       for key, mtime in pending]
+            decoded = 0
+            for key, mtime, future in futures:
+                try:
+                    image = future.result()
+                except Exception:
+                    continue
+                image = image.convert_alpha() if key[2] else image.convert()
+                self._images[key] = (mtime, image)
+                decoded += 1
+        startup_report.add(f"  解码 {decoded} 张图像", time.perf_counter() - start)
+        return decoded
+
+    def list_dir(self, directory):
+        """目录下的文件名列表（按目录修改时间缓存）；目录不存在返回 None"""
+        directory = os.path.normpath(directory)
+        mtime = _mtime(directory)
+        if mtime is None:
+            return None
+        entry = self._dirs.get(directory)
+        if entry is None or entry[0] != mtime:
+            entry = (mtime, sorted(os.listdir(directory)))
+            self._dirs[directory] = entry
+        return entry[1]
+
+    def load_images_in_dir(self, directory, alpha=True):
+        """
+        加载目录下的全部图像，返回 {文件名(不含扩展名): Surface}。
+        目录不存在返回 None；单个文件加载失败时打印警告并跳过。
+        """
+        names = self.list_dir(directory)
+        if names is None:
+            return None
+        names = [fname for fname in names if fname.lower().endswith(IMAGE_EXTENSIONS)]
+        self.preload_images([(os.path.join(directory, fname), None, alpha) for fname in names])
+        images = {}
+        for fname in names:
+            path = os.path.join(directory, fname)
+            try:
+                images[os.path.splitext(fname)[0]] = self.load_image(path, alpha=alpha)
+            except Exception as e:
+                print(f"Warning: failed to load sprite '{path}': {e}")
+        return images
+
+    def memo(self, key, builder, *paths):
+        """
+        通用派生资源缓存：paths 中任一文件的修改时间变化时重新调用 builder()。
+        """
+        stamp = tuple(_mtime(p) for p in paths)
+        entry = self._memo.get(key)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, builder())
+            self._memo[key] = entry
+        return entry[1]
+
+    # --- 地图 ---
+
+    def get_city_map(self, map_string=None):
+        """
+        返回 map_string 对应的 CityMap（None 表示默认地图）。
+        命中缓存时重新随机玩家起点，与新建地图的行为一致。
+        """
+        city_map = self._maps.get(map_string)
+        if city_map is None:
+            city_map = CityMap(map_string)
+            self._maps[map_string] = city_map
+        else:
+            city_map.reset_player_position()
+        return city_map
+
+    def get_wall_colliders(self, city_map):
+        """(Spec IV) 地图中 '#' 和 '~' 对应的碰撞 Sprite 组（每张地图只创建一次）"""
+        entry = self._walls.get(id(city_map))
+        if entry is not None and entry[0] is city_map:
+            return entry[1]
+
+        walls = pygame.sprite.Group()
+        W, H = city_map.get_dimensions()
+        for r in range(H):
+            for c in range(W):
+                tile = city_map.get_tile(r, c)
+                # (Spec IV) 玩家不可穿过 # 和 ~
+                if tile == '#' or tile == '~':
+                    wall_sprite = pygame.sprite.Sprite()
+                    wall_sprite.rect = pygame.Rect(
+                        c * config.TILE_SIZE,
+                        r * config.TILE_SIZE,
+                        config.TILE_SIZE,
+                        config.TILE_SIZE
+                    )
+                    # (用于怪物 AI 区分)
+                    wall_sprite.tile_type = tile
+                    walls.add(wall_sprite)
+        self._walls[id(city_map)] = (city_map, walls)
+        return walls
+
+
+# 全局资源管理器与启动耗时统计
+asset_manager = AssetManager()
+startup_report = StartupReport()
@@ -0,0 +1,161 @@
+# atlas.py
+# 纹理图集：把地图贴图、精灵的预缩放版本以及小地图地形打包进少数几张大 Surface，
+# 通过 (页面, 子矩形) 查找表绘制。不透明贴图与带透明通道的精灵分页存放。
+# 打包使用货架（shelf）算法，支持运行时按需追加新条目。
+
+import pygame
+import sys
+import os
+
+# 添加父目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import config
+
+DEFAULT_PAGE_SIZE = 512
+_PADDING = 1  # 条目之间留 1 像素间隔，避免旋转 / 缩放采样越界
+
+
+class _Page:
+    """一张图集页面及其货架状态"""
+    def __init__(self, width, height, alpha):
+        if alpha:
+            self.surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        else:
+            self.surface = pygame.Surface((width, height)).convert()
+        self.surface.fill((0, 0, 0, 0))
+        self.width = width
+        self.height = height
+        self.shelves = []  # [[y, 高度, 下一个 x], ...]
+        self.next_y = 0
+
+    def allocate(self, w, h):
+        """在页面中为 w x h 的条目分配位置，返回 (x, y)；空间不足返回 None"""
+        w += _PADDING
+        h += _PADDING
+        for shelf in self.shelves:
+            y, shelf_h, x = shelf
+            if h <= shelf_h and x + w <= self.width:
+                shelf[2] = x + w
+                return x, y
+        if self.next_y + h <= self.height and w <= self.width:
+            shelf = [self.next_y, h, w]
+            self.shelves.append(shelf)
+            self.next_y += h
+            return 0, shelf[0]
+        return None
+
+
+class TextureAtlas:
+    """
+    纹理图集。条目以任意可哈希对象为键（通常是源 Surface 本身或 (源 Surface, 尺寸)），
+    源图像重新加载后键自然失效，不会返回过期像素。
+    """
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE):
+        self.page_size = page_size
+        self._pages = {True: [], False: []}  # {是否带透明通道: [_Page, ...]}
+        self._regions = {}      # {key: (页面 Surface, Rect)}
+        self._subsurfaces = {}  # {key: 子 Surface}
+
+    def clear(self):
+        self._pages = {True: [], False: []}
+        self._regions.clear()
+        self._subsurfaces.clear()
+
+    def __contains__(self, key):
+        return key in self._regions
+
+    def add(self, key, image, alpha=True):
+        """把 image 复制进图集（已存在则直接返回），返回 (页面 Surface, Rect)"""
+        region = self._regions.get(key)
+        if region is not None:
+            return region
+
+        w, h = image.get_size()
+        pages = self._pages[alpha]
+        pos = None
+        for page in pages:
+            pos = page.allocate(w, h)
+            if pos is not None:
+                break
+        if pos is None:
+            # 新开一页（超大条目独占一页）
+            page = _Page(max(self.page_size, w + _PADDING), max(self.page_size, h + _PADDING), alpha)
+            pages.append(page)
+            pos = page.allocate(w, h)
+
+        if alpha:
+            # 页面初始全透明，加法混合等价于逐像素拷贝（保留原始 alpha）
+            page.surface.blit(image, pos, special_flags=pygame.BLEND_RGBA_ADD)
+        else:
+            page.surface.blit(image, pos)
+        region = (page.surface, pygame.Rect(pos[0], pos[1], w, h))
+        self._regions[key] = region
+        return region
+
+    def region(self, key):
+        """返回 (页面 Surface, Rect)；未收录返回 None"""
+        return self._regions.get(key)
+
+    def subsurface(self, key):
+        """条目对应的子 Surface（共享页面像素，只读使用）"""
+        sub = self._subsurfaces.get(key)
+        if sub is None:
+            page, rect = self._regions[key]
+            sub = page.subsurface(rect)
+            self._subsurfaces[key] = sub
+        return sub
+
+    def get_scaled(self, image, size):
+        """image 缩放到 size 后的版本（首次使用时缩放并收录），返回子 Surface"""
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        key = (image, size)
+        if key not in self._regions:
+            self.add(key, pygame.transform.scale(image, size), alpha=True)
+        return self.subsurface(key)
+
+    def get_or_build(self, key, builder, alpha=True):
+        """返回 key 对应的 (页面 Surface, Rect)，不存在时用 builder() 生成并收录"""
+        region = self._regions.get(key)
+        if region is None:
+            region = self.add(key, builder(), alpha)
+        return region
+
+    def memory_bytes(self):
+        """图集页面占用的像素内存（字节）"""
+        return sum(page.surface.get_bytesize() * page.width * page.height
+                   for pages in self._pages.values() for page in pages)
+
+    def page_count(self):
+        return sum(len(pages) for pages in self._pages.values())
+
+
+def _sprite_sizes(name):
+    """根据精灵名称给出游戏中会用到的绘制尺寸（与 draw_player / draw_monster 一致）"""
+    if name.startswith('player'):
+        d = config.PLAYER_RADIUS * 2
+        return [(d, d)]
+    if name.startswith('wanderer'):
+        return [(r * 2, r * 2) for r in (config.WANDERER_RADIUS, config.WANDERER_ELITE_RADIUS)]
+    if name.startswith('bucket'):
+        return [(r * 2, r * 2) for r in (config.BUCKET_RADIUS, config.BUCKET_ELITE_RADIUS)]
+    if name.startswith('ghoul'):
+        return [config.GHOUL_SIZE, config.GHOUL_ELITE_SIZE, config.GHOUL_ELITE_FLYING_SIZE]
+    return []
+
+def build_game_atlas(tile_images, sprite_images, atlas=None):
+    """
+    启动时预先收录地图贴图（不透明页）与精灵的常用预缩放版本（透明页）。
+    其余尺寸在绘制时由 get_scaled 按需追加。
+    """
+    atlas = atlas if atlas is not None else texture_atlas
+    for image in tile_images.values():
+        atlas.add(image, image, alpha=False)
+    for name, image in sprite_images.items():
+        for size in _sprite_sizes(name):
+            atlas.get_scaled(image, size)
+    return atlas
+
+
+# 全局纹理图集
+texture_atlas = TextureAtlas()
@@ -3,48 +3,61 @@ import pygame
 import math
 import sys
 import os
+from collections import OrderedDict
 
 # 添加父目录到路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import config
+from systems.fonts import get_font, get_sys_font, render_static, get_faded
+from core.assets import asset_manager
+from core.atlas import texture_atlas
 
 # --- 1. 地图与贴图加载 ---
 
+# 地图符号与贴图文件名的映射关系
+TILE_MAPPING = {
+    '.': ('road.png', config.COLOR_BROWN),      # 道路
+    '~': ('river.png', config.COLOR_DARK_BLUE), # 河流
+    '#': ('house.png', config.COLOR_DARK_GREY), # 建筑
+    'T': ('tree.png', config.COLOR_DARK_GREEN), # 树木
+    'S': ('pipe.png', config.COLOR_LIGHT_GREY), # 下水道
+}
+
+def _tiles_dir():
+    current_file = os.path.abspath(__file__)
+    src_dir = os.path.dirname(os.path.dirname(current_file))  # 到src目录
+    project_root = os.path.dirname(src_dir)  # 到项目根目录
+    return os.path.join(project_root, "assets", "tiles")
+
 def load_tile_images():
     """
     (Spec V) 加载地图图块。
     优先加载 assets/tiles/ 下的 PNG 文件，如果不存在则使用彩色占位符。
+    结果由 asset_manager 缓存，贴图文件未修改时直接复用。
     """
+    tiles_dir = _tiles_dir()
+    paths = [os.path.join(tiles_dir, filename) for filename, _ in TILE_MAPPING.values()]
+    return asset_manager.memo(('tile_images', config.TILE_SIZE), _build_tile_images, *paths)
+
+def _build_tile_images():
     tiles = {}
     TS = (config.TILE_SIZE, config.TILE_SIZE)
+    tiles_dir = _tiles_dir()
     
-    # 获取assets/tiles目录的路径
-    current_file = os.path.abspath(__file__)
-    src_dir = os.path.dirname(os.path.dirname(current_file))  # 到src目录
-    project_root = os.path.dirname(src_dir)  # 到项目根目录
-    tiles_dir = os.path.join(project_root, "assets", "tiles")
-    
-    # 定义地图符号与文件名的映射关系
-    tile_mapping = {
-        '.': ('road.png', config.COLOR_BROWN),      # 道路
-        '~': ('river.png', config.COLOR_DARK_BLUE), # 河流
-        '#': ('house.png', config.COLOR_DARK_GREY), # 建筑
-        'T': ('tree.png', config.COLOR_DARK_GREEN), # 树木
-        'S': ('pipe.png', config.COLOR_LIGHT_GREY), # 下水道
-    }
-    
-    for symbol, (filename, fallback_color) in tile_mapping.items():
+    # 所有贴图并行解码
+    asset_manager.preload_images([(os.path.join(tiles_dir, filename), TS, False)
+                                  for filename, _ in TILE_MAPPING.values()])
+    
+    for symbol, (filename, fallback_color) in TILE_MAPPING.items():
         tile_path = os.path.join(tiles_dir, filename)
         
         # 尝试加载PNG文件
         if os.path.exists(tile_path):
             try:
-                image = pygame.image.load(tile_path)
                 # 缩放到指定的瓷砖大小，使用SCALE算法确保像素完美对齐
-                tiles[symbol] = pygame.transform.scale(image, TS)
-                # 确保图像完全不透明（如果需要的话）
-                tiles[symbol] = tiles[symbol].convert()
+                # 确保图像完全不透明（convert）
+                tiles[symbol] = asset_manager.load_image(tile_path, TS, alpha=False)
                 print(f"[OK] Loaded tile image: {filename}")
             except Exception as e:
                 print(f"[WARN] Failed to load {filename}: {e}, using solid color")
@@ -57,6 +70,14 @@ def load_tile_images():
     
     return tiles
 
+def _tile_sources(tile_images):
+    """{地图符号: (源 Surface, 子矩形)}：已收录进图集的贴图从图集页面绘制"""
+    sources = {}
+    for symbol, image in tile_images.items():
+        region = texture_atlas.region(image)
+        sources[symbol] = region if region is not None else (image, None)
+    return sources
+
 def draw_trees(surface, city_map, camera, tile_images):
     """
     新增函数：专门绘制树木 ('T')，用于实现树木遮挡效果。
@@ -74,7 +95,9 @@ def draw_trees(surface, city_map, camera, tile_images):
     tree_image = tile_images.get('T')
     if not tree_image:
         return # 如果没有树木贴图，则不绘制
-        
+    source, area = _tile_sources({'T': tree_image})['T']
+    
+    batch = []
     for r in range(start_row, end_row):
         for c in range(start_col, end_col):
             tile_symbol = city_map.get_tile(r, c)
@@ -86,7 +109,8 @@ def draw_trees(surface, city_map, camera, tile_images):
                 world_y = r * TS
                 screen_x, screen_y = camera.apply_to_coords(world_x, world_y)
                 # 确保整数像素对齐，避免缝隙
-                surface.blit(tree_image, (int(screen_x), int(screen_y)))
+                batch.append((source, (int(screen_x), int(screen_y)), area))
+    surface.blits(batch, False)
 
 def draw_map(surface, city_map, camera, tile_images):
     """(Spec V) 高效绘制可见区域的地图"""
@@ -113,11 +137,13 @@ def draw_map(surface, city_map, camera, tile_images):
     # count = 0
     # tiles_by_type = {}
     
+    sources = _tile_sources(tile_images)
+    batch = []
     for r in range(start_row, end_row):
         for c in range(start_col, end_col):
             tile_symbol = city_map.get_tile(r, c)
-            if tile_symbol in tile_images and tile_symbol != 'T':
-                image = tile_images[tile_symbol]
+            if tile_symbol in sources and tile_symbol != 'T':
+                source, area = sources[tile_symbol]
                 
                 # (Spec II) 转换世界坐标到屏幕坐标
                 # 世界坐标 = 网格坐标 * 瓷砖大小
@@ -125,12 +151,14 @@ def draw_map(surface, city_map, camera, tile_images):
                 world_y = r * TS
                 screen_x, screen_y = camera.apply_to_coords(world_x, world_y)
                 # 确保整数像素对齐，避免缝隙
-                surface.blit(image, (int(screen_x), int(screen_y)))
+                batch.append((source, (int(screen_x), int(screen_y)), area))
                 
                 # # 统计瓷砖类型
                 # tiles_by_type[tile_symbol] = tiles_by_type.get(tile_symbol, 0) + 1
                 # count += 1
     
+    surface.blits(batch, False)
+    
     # print(f"实际绘制瓷砖数: {count}")
     # print(f"瓷砖类型统计: {tiles_by_type}")
     # print(f"{'='*60}\n")
@@ -146,9 +174,9 @@ def draw_player(surface, player, camera, sprite_images=None):
     # 使用图像绘制
     if sprite_images and 'player' in sprite_images:
         image = sprite_images['player']
-        # 缩放到玩家大小（直径）
+        # 缩放到玩家大小（直径），预缩放版本取自图集
         size = player.radius * 2
-        scaled_image = pygame.transform.scale(image, (int(size), int(size)))
+        scaled_image = texture_atlas.get_scaled(image, (int(size), int(size)))
         # 旋转图像（图像朝向正右，需要旋转到angle_rad）
         angle_deg = -math.degrees(player.angle_rad)  # Pygame旋转是顺时针，所以取负
         rotated_image = pygame.transform.rotate(scaled_image, angle_deg)
@@ -163,8 +191,39 @@ def draw_player(surface, player, camera, sprite_images=None):
         end_y = int(screen_pos[1] + player.radius * math.sin(player.angle_rad))
         pygame.draw.line(surface, player.facing_line_color, screen_pos, (end_x, end_y), 2)
 
-def draw_monster(surface, monster_sprite, camera, sprite_images=None):
-    """(Spec III) 根据怪物类型和精英状态绘制图案"""
+def draw_monsters(surface, monsters, camera, sprite_images=None):
+    """
+    批量绘制怪物：图像收集为 (surface, dest) 列表后一次 Surface.blits 提交，
+    头顶标记（DEATH）在所有怪物之后统一提交。
+    """
+    batch = []
+    overlays = []
+    for monster in monsters:
+        draw_monster(surface, monster, camera, sprite_images, batch, overlays)
+    surface.blits(batch, False)
+    if overlays:
+        surface.blits(overlays, False)
+
+def draw_bullets(surface, bullets, camera):
+    """批量绘制子弹（BulletManager 共享子弹图像）"""
+    surface.blits(bullets.blit_sequence(camera.camera_rect.x, camera.camera_rect.y), False)
+
+def draw_floating_texts(surface, texts, camera):
+    """批量绘制浮动文字；淡出使用按透明度缓存的副本，不修改共享的文字 Surface"""
+    offset_x = camera.camera_rect.x
+    offset_y = camera.camera_rect.y
+    batch = []
+    for text in texts:
+        image = get_faded(text.surface, text.get_alpha())
+        w, h = text.rect.size
+        batch.append((image, (text.pos.x - offset_x - w // 2, text.pos.y - offset_y - h // 2)))
+    surface.blits(batch, False)
+
+def draw_monster(surface, monster_sprite, camera, sprite_images=None, batch=None, overlays=None):
+    """
+    (Spec III) 根据怪物类型和精英状态绘制图案
+    传入 batch / overlays 列表时，图像与头顶标记追加为 (surface, dest) 而不是立即绘制。
+    """
     logic = monster_sprite.logic
     
     # 只有非游荡者在复活时才跳过渲染
@@ -213,14 +272,14 @@ def draw_monster(surface, monster_sprite, camera, sprite_images=None):
     if image_key:
         image = sprite_images[image_key]
         
-        # 根据怪物类型计算尺寸
+        # 根据怪物类型计算尺寸（预缩放版本取自图集）
         if t in ['Wanderer', 'Bucket']:
             # 圆形怪物：图像直径 = 2×半径
             size = monster_sprite.radius * 2 * size_multiplier
-            scaled_image = pygame.transform.scale(image, (int(size), int(size)))
+            scaled_image = texture_atlas.get_scaled(image, (int(size), int(size)))
         else:  # Ghoul
             # 三角形怪物：使用width和height
-            scaled_image = pygame.transform.scale(image, (int(monster_sprite.width * size_multiplier), int(monster_sprite.height * size_multiplier)))
+            scaled_image = texture_atlas.get_scaled(image, (int(monster_sprite.width * size_multiplier), int(monster_sprite.height * size_multiplier)))
         
         # 旋转图像
         angle_deg = -math.degrees(angle_rad)
@@ -231,9 +290,13 @@ def draw_monster(surface, monster_sprite, camera, sprite_images=None):
             rotated_image = rotated_image.copy()
             rotated_image.set_alpha(128)  # 50%透明度
         
-        # 绘制
-        rect = rotated_image.get_rect(center=screen_pos)
-        surface.blit(rotated_image, rect)
+        # 绘制（左上角 = 中心 - 尺寸 // 2，与 get_rect(center=...) 一致）
+        w, h = rotated_image.get_size()
+        dest = (screen_pos[0] - w // 2, screen_pos[1] - h // 2)
+        if batch is not None:
+            batch.append((rotated_image, dest))
+        else:
+            surface.blit(rotated_image, dest)
     else:
         # 降级方案：使用原来的几何图形绘制
         if t == 'Wanderer':
@@ -269,10 +332,13 @@ def draw_monster(surface, monster_sprite, camera, sprite_images=None):
     # 绘制不死者残躯标记
     if hasattr(logic, 'undying_active') and logic.undying_active:
         # 在怪物头顶显示红色"DEATH"文字
-        font = pygame.font.Font(None, 24)
-        text_surface = font.render("DEATH", True, (255, 0, 0))
-        text_rect = text_surface.get_rect(center=(screen_pos[0], screen_pos[1] - int(monster_sprite.radius * size_multiplier) - 20))
-        surface.blit(text_surface, text_rect)
+        text_surface = render_static("DEATH", (255, 0, 0), 24)
+        w, h = text_surface.get_size()
+        dest = (screen_pos[0] - w // 2, screen_pos[1] - int(monster_sprite.radius * size_multiplier) - 20 - h // 2)
+        if overlays is not None:
+            overlays.append((text_surface, dest))
+        else:
+            surface.blit(text_surface, dest)
 
 def _draw_rotated_triangle(surface, color, center, size, angle_rad, aspect_ratio=1.0):
     """辅助函数：绘制一个旋转的等腰三角形 (尖端朝向 angle_rad)"""
@@ -334,18 +400,11 @@ def draw_ui(surface, player_logic, current_day, font):
     surface.blit(text_surf, text_rect)
 
 
-def draw_minimap(surface, city_map, player, monsters_group, camera, minimap_font):
-    """(Spec V) 绘制小地图和威胁指示器"""
-    
-    # 1. 绘制小地图背景
-    MM_RECT = pygame.Rect(config.MINIMAP_POS, (config.MINIMAP_SIZE, config.MINIMAP_SIZE))
-    surface.fill(config.COLOR_BLACK, MM_RECT)
-    pygame.draw.rect(surface, config.COLOR_WHITE, MM_RECT, 1)
-
+def _render_minimap_terrain(city_map):
+    """小地图静态地形：每个地格 MINIMAP_TILE_SIZE 像素，无颜色的地格保持透明"""
     TS = config.MINIMAP_TILE_SIZE
     W, H = city_map.get_dimensions()
-
-    # 2. 绘制地格颜色
+    terrain = pygame.Surface((W * TS, H * TS), pygame.SRCALPHA)
     for r in range(H):
         for c in range(W):
             tile = city_map.get_tile(r, c)
@@ -355,9 +414,22 @@ def draw_minimap(surface, city_map, player, monsters_group, camera, minimap_font
             elif tile == '~': color = config.COLOR_BLUE
             
             if color:
-                mini_x = MM_RECT.x + c * TS
-                mini_y = MM_RECT.y + r * TS
-                pygame.draw.rect(surface, color, (mini_x, mini_y, TS, TS))
+                pygame.draw.rect(terrain, color, (c * TS, r * TS, TS, TS))
+    return terrain
+
+def draw_minimap(surface, city_map, player, monsters_group, camera, minimap_font):
+    """(Spec V) 绘制小地图和威胁指示器"""
+    
+    # 1. 绘制小地图背景
+    MM_RECT = pygame.Rect(config.MINIMAP_POS, (config.MINIMAP_SIZE, config.MINIMAP_SIZE))
+    surface.fill(config.COLOR_BLACK, MM_RECT)
+    pygame.draw.rect(surface, config.COLOR_WHITE, MM_RECT, 1)
+
+    TS = config.MINIMAP_TILE_SIZE
+
+    # 2. 绘制地格颜色（静态地形预先烘焙进图集）
+    page, area = texture_atlas.get_or_build(('minimap', city_map), lambda: _render_minimap_terrain(city_map))
+    surface.blit(page, MM_RECT.topleft, area)
 
     # 3. 绘制玩家 (亮绿)
     player_map_c = player.pos.x / config.TILE_SIZE
@@ -433,93 +505,161 @@ def draw_minimap(surface, city_map, player, monsters_group, camera, minimap_font
         # 我们使用 angle_rad (dy, dx) 来确定方向
         _draw_rotated_triangle(surface, config.COLOR_RED, (arrow_pos_x, arrow_pos_y), 5, angle_rad)
 
+class _SurfaceCache:
+    """按总像素数限制大小的 LRU Surface 缓存（用于预渲染的特效帧）"""
+    def __init__(self, max_pixels):
+        self.max_pixels = max_pixels
+        self.pixels = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+        return surface
+
+    def put(self, key, surface):
+        w, h = surface.get_size()
+        self._entries[key] = surface
+        self.pixels += w * h
+        # 淘汰最久未使用的帧（至少保留刚放入的一帧）
+        while self.pixels > self.max_pixels and len(self._entries) > 1:
+            _, old = self._entries.popitem(last=False)
+            ow, oh = old.get_size()
+            self.pixels -= ow * oh
+        return surface
+
+    def clear(self):
+        self._entries.clear()
+        self.pixels = 0
+
+# 尸爆帧缓存（独立预算，不与其它特效共享）
+_explosion_frames = _SurfaceCache(config.CORPSE_EXPLOSION_CACHE_MAX_PIXELS)
+
+
+def _render_bucket_ring(radius, elite):
+    """渲染半径为 radius 的铁桶圆环（半透明圆盘 + 3 层光晕），尺寸 (2r+20)²"""
+    ring_surface = pygame.Surface((radius*2+20, radius*2+20), pygame.SRCALPHA)
+    
+    # 填充半透明圆盘（主体）
+    fill_alpha = int(80)  # 约30%透明度
+    if elite:
+        fill_color = (255, 200, 150, fill_alpha)
+    else:
+        fill_color = (180, 180, 180, fill_alpha)
+    pygame.draw.circle(ring_surface, fill_color, 
+                     (radius+10, radius+10), radius)
+    
+    # 绘制外圈光晕效果（3层渐变）
+    for i in range(3):
+        # 从内到外，透明度递减
+        alpha = int(60 * (1 - i * 0.3))
+        offset = i * 6
+        
+        # 浅橙色/浅灰色
+        if elite:
+            color = (255, 220, 180, alpha)
+        else:
+            color = (200, 200, 200, alpha)
+        
+        if radius + offset > 0:
+            pygame.draw.circle(ring_surface, color, 
+                             (radius+10, radius+10), 
+                             radius + offset, 6)
+    return ring_surface
+
+# 铁桶圆环帧表：{(精英配色, 最大半径, 帧序号): surface}
+# 不进入 LRU：每种 (配色, 攻击范围) 组合固定 BUCKET_RING_FRAMES 帧，攻击范围只有少数几种，总量有上限，
+# 庞然的大圆环扩散一次也不会挤掉其它特效帧
+_ring_frames = {}
+
+def get_bucket_ring_frame(radius, elite, max_radius):
+    """
+    返回最接近 radius 的预渲染圆环帧及其量化半径 (surface, radius)。
+    从 0 扩散到 max_radius 的圆环量化为 BUCKET_RING_FRAMES 帧（步长随最大半径放大），
+    普通 / 精英配色分别缓存。
+    """
+    n = config.BUCKET_RING_FRAMES
+    max_radius = max(1, int(max_radius))
+    index = min(max(1, int(round(radius * n / max_radius))), n)
+    key = (elite, max_radius, index)
+    frame_radius = max(1, int(round(max_radius * index / n)))
+    frame = _ring_frames.get(key)
+    if frame is None:
+        frame = _ring_frames[key] = _render_bucket_ring(frame_radius, elite)
+    return frame, frame_radius
+
 def draw_monster_attack_effects(surface, monsters, camera):
     """
-    绘制怪物攻击特效（铁桶圆环）
+    绘制怪物攻击特效（铁桶圆环）：使用预渲染帧，整批提交
     """
+    batch = []
     for monster in monsters:
         if monster.logic.type == 'Bucket' and monster.ring_radius > 0:
             center_screen = camera.apply_to_coords(monster.pos.x, monster.pos.y)
             radius = int(monster.ring_radius)
             
             if radius > 0:
-                # 铁桶的颜色（根据是否精英）
-                if monster.logic.is_elite:
-                    base_color = config.COLOR_ORANGE
-                else:
-                    base_color = config.COLOR_GREY
-                
-                # 创建半透明表面
-                ring_surface = pygame.Surface((radius*2+20, radius*2+20), pygame.SRCALPHA)
-                
-                # 填充半透明圆盘（主体）
-                fill_alpha = int(80)  # 约30%透明度
-                if monster.logic.is_elite:
-                    fill_color = (255, 200, 150, fill_alpha)
-                else:
-                    fill_color = (180, 180, 180, fill_alpha)
-                pygame.draw.circle(ring_surface, fill_color, 
-                                 (radius+10, radius+10), radius)
-                
-                # 绘制外圈光晕效果（3层渐变）
-                for i in range(3):
-                    # 从内到外，透明度递减
-                    alpha = int(60 * (1 - i * 0.3))
-                    offset = i * 6
-                    
-                    # 浅橙色/浅灰色
-                    if monster.logic.is_elite:
-                        color = (255, 220, 180, alpha)
-                    else:
-                        color = (200, 200, 200, alpha)
-                    
-                    if radius + offset > 0:
-                        pygame.draw.circle(ring_surface, color, 
-                                         (radius+10, radius+10), 
-                                         radius + offset, 6)
-                
-                # Blit到屏幕
+                # 铁桶的配色（根据是否精英）
+                ring_surface, radius = get_bucket_ring_frame(radius, monster.logic.is_elite,
+                                                             monster.logic.attack_range)
                 blit_pos = (center_screen[0] - radius - 10, center_screen[1] - radius - 10)
-                surface.blit(ring_surface, blit_pos)
+                batch.append((ring_surface, blit_pos))
+    if batch:
+        surface.blits(batch, False)
+
+def _explosion_frame_spec(max_radius, progress):
+    """将 (最大半径, 进度) 映射到 (尺寸分档, 帧序号, 帧半径, 帧透明度)"""
+    step = config.CORPSE_EXPLOSION_SIZE_STEP
+    n = config.CORPSE_EXPLOSION_FRAMES
+    size_class = max(1, int(round(max_radius / step))) * step
+    index = min(int(progress * n), n - 1)
+    frame_progress = (index + 0.5) / n  # 取帧区间中点
+    radius = max(1, int(size_class * frame_progress))
+    alpha = int(255 * (1.0 - frame_progress))
+    return size_class, index, radius, alpha
+
+def get_corpse_explosion_frame(image, max_radius, progress):
+    """
+    返回尸爆扩散动画在 progress 时刻的预缩放帧 (surface, radius)。
+    帧按 (源图像, 尺寸分档, 帧序号) 在首次使用时生成，并被所有尸爆共享。
+    image 为 None 时使用红色爆炸圈。
+    """
+    size_class, index, radius, alpha = _explosion_frame_spec(max_radius, progress)
+    key = (image, size_class, index)
+    frame = _explosion_frames.get(key)
+    if frame is None:
+        if image is not None:
+            # 图像尺寸随爆炸半径放大，透明度随爆炸进度逐渐消失
+            frame = pygame.transform.scale(image, (radius * 2, radius * 2))
+            frame.set_alpha(alpha)
+        else:
+            # 降级方案：红色爆炸圈
+            frame = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+            pygame.draw.circle(frame, (255, 100, 0, alpha), (radius, radius), radius, 3)
+        _explosion_frames.put(key, frame)
+    return frame, radius
 
 def draw_corpse_explosions(surface, explosions, camera, sprite_images=None):
     """
-    绘制尸爆效果：铁桶图像从当前尺寸放大到最大半径
+    绘制尸爆效果：铁桶图像从当前尺寸放大到最大半径（使用共享的预缩放帧）
     """
+    image = sprite_images.get('bucket') if sprite_images else None
+    batch = []
     for explosion in explosions:
         center_screen = camera.apply_to_coords(explosion.pos.x, explosion.pos.y)
         
         if explosion.is_exploding:
-            # 爆炸阶段：绘制放大的铁桶图像
-            radius = int(explosion.current_radius)
-            
-            if radius > 0 and sprite_images and 'bucket' in sprite_images:
-                # 使用铁桶图像
-                image = sprite_images['bucket']
-                # 图像尺寸随爆炸半径放大
-                size = radius * 2
-                scaled_image = pygame.transform.scale(image, (int(size), int(size)))
-                
-                # 设置透明度（随爆炸进度逐渐消失）
-                alpha = int(255 * (1.0 - explosion.explosion_progress))
-                scaled_image.set_alpha(alpha)
-                
-                # 绘制
-                rect = scaled_image.get_rect(center=center_screen)
-                surface.blit(scaled_image, rect)
-            else:
-                # 降级方案：红色爆炸圈
-                explosion_surface = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-                alpha = int(255 * (1.0 - explosion.explosion_progress))
-                color_with_alpha = (255, 100, 0, alpha)
-                pygame.draw.circle(explosion_surface, color_with_alpha, (radius, radius), radius, 3)
-                
-                blit_pos = (center_screen[0] - radius, center_screen[1] - radius)
-                surface.blit(explosion_surface, blit_pos)
+            if int(explosion.current_radius) > 0:
+                frame, radius = get_corpse_explosion_frame(image, explosion.max_radius,
+                                                           explosion.explosion_progress)
+                batch.append((frame, (center_screen[0] - radius, center_screen[1] - radius)))
         else:
             # 延迟阶段：在尸体位置闪烁警告
             if int(explosion.timer * 4) % 2 == 0:  # 每0.25秒闪烁
                 pygame.draw.circle(surface, (255, 200, 0), center_screen, 10, 2)
+    if batch:
+        surface.blits(batch, False)
 
 
 def draw_collision_shapes(surface, player, monsters_group, bullets_group, camera):
@@ -539,7 +679,7 @@ def draw_collision_shapes(surface, player, monsters_group, bullets_group, camera
 
     # 简单字体用于绘制标签
     try:
-        font = pygame.font.Font(None, 14)
+        font = get_font(14)
     except:
         font = None
 
@@ -608,11 +748,12 @@ def draw_collision_shapes(surface, player, monsters_group, bullets_group, camera
                     surface.blit(txt, (m_screen[0] + 6, m_screen[1] - 6))
 
     # 子弹
-    for b in bullets_group:
-        b_screen = camera.apply_to_coords(b.pos.x, b.pos.y)
-        pygame.draw.circle(surface, bullet_color, (int(b_screen[0]), int(b_screen[1])), int(getattr(b, 'radius', 2)), 1)
+    n = len(bullets_group)
+    for (bx, by), br in zip(bullets_group.pos[:n].tolist(), bullets_group.radius[:n].tolist()):
+        b_screen = camera.apply_to_coords(bx, by)
+        pygame.draw.circle(surface, bullet_color, (int(b_screen[0]), int(b_screen[1])), int(br), 1)
         if font:
-            txt = font.render(f"b r={getattr(b, 'radius', 0)}", True, outline_color)
+            txt = font.render(f"b r={br:g}", True, outline_color)
             surface.blit(txt, (b_screen[0] + 4, b_screen[1] - 4))
 
 def draw_game_over_ui(surface, game):
@@ -626,12 +767,8 @@ def draw_game_over_ui(surface, game):
     surface.blit(overlay, (0, 0))
     
     # Game Over 文字（使用系统字体支持中文）
-    try:
-        font_large = pygame.font.SysFont('microsoftyahei,simsun,simhei,arial', 72, bold=True)
-        font_medium = pygame.font.SysFont('microsoftyahei,simsun,simhei,arial', 36)
-    except:
-        font_large = pygame.font.Font(None, 72)
-        font_medium = pygame.font.Font(None, 36)
+    font_large = get_sys_font('microsoftyahei,simsun,simhei,arial', 72, bold=True)
+    font_medium = get_sys_font('microsoftyahei,simsun,simhei,arial', 36)
     
     text = font_large.render("GAME OVER", True, config.COLOR_RED)
     text_rect = text.get_rect(center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 3))
@@ -13,19 +13,27 @@ import config
 from core import drawing
 from systems.citymap.citymap import CityMap
 from entities.player import Player
-from entities.bullet import Bullet
+from entities.bullet_manager import BulletManager
 from entities.monster_sprite import MonsterSprite
-from entities.floating_text import FloatingText
+from entities.floating_text import floating_text_pool, prerender_popups
 from systems.monsters.monster_logic import generate_monsters
+from systems.monsters.monster_factory import create_monster
+from systems.monsters import config as mcfg
 from core.camera import Camera
+from systems.fonts import get_font
+from core.assets import asset_manager, startup_report
+from core.atlas import build_game_atlas
+from systems.combat_log import combat_log, REVIVE, SUMMON, LIFESTEAL, CORPSE_EXPLOSION
+from systems import combat_events
+from systems.combat_events import CombatEventBus, CombatTelemetry
+from systems.scheduler import Scheduler
 
 class CorpseExplosion:
-    """铁桶死亡尸爆效果"""
-    def __init__(self, pos, max_radius, delay, damage, monster_name):
+    """铁桶死亡尸爆效果（延迟阶段由 scheduler 计时，到期后开始扩散）"""
+    def __init__(self, pos, max_radius, delay, damage, monster_name, scheduler):
         self.pos = pos  # 爆炸位置
         self.max_radius = max_radius  # 最大半径
         self.delay = delay  # 延迟时间
-        self.timer = delay  # 倒计时
         self.damage = damage  # 伤害值
         self.monster_name = monster_name  # 怪物名称
         self.is_exploding = False  # 是否正在爆炸
@@ -33,37 +41,45 @@ class CorpseExplosion:
         self.current_radius = 0  # 当前半径
         self.finished = False  # 是否完成
         self.has_damaged = False  # 是否已造成伤害
+        self._scheduler = scheduler
+        self._detonate_timer = scheduler.schedule(delay, self._detonate)
+    
+    @property
+    def timer(self):
+        """延迟阶段剩余时间（绘制闪烁警告用）"""
+        return self._scheduler.time_left(self._detonate_timer)
+    
+    def _detonate(self):
+        """延迟结束，开始爆炸"""
+        self.is_exploding = True
+        self.explosion_progress = 0
+        if config.DEBUG_COMBAT_LOG:
+            combat_log.emit(CORPSE_EXPLOSION, self.monster_name)
     
     def update(self, dt):
-        """更新尸爆状态"""
-        if self.finished:
+        """更新尸爆扩散"""
+        if self.finished or not self.is_exploding:
             return
         
-        if not self.is_exploding:
-            # 延迟阶段
-            self.timer -= dt
-            if self.timer <= 0:
-                self.is_exploding = True
-                self.explosion_progress = 0
-                print(f"{self.monster_name} 的尸体爆炸了！")
-        else:
-            # 爆炸扩散阶段（假设0.5秒扩散完成）
-            self.explosion_progress += dt / 0.5
-            if self.explosion_progress >= 1.0:
-                self.explosion_progress = 1.0
-                self.finished = True
-            self.current_radius = self.max_radius * self.explosion_progress
+        # 爆炸扩散阶段（假设0.5秒扩散完成）
+        self.explosion_progress += dt / 0.5
+        if self.explosion_progress >= 1.0:
+            self.explosion_progress = 1.0
+            self.finished = True
+        self.current_radius = self.max_radius * self.explosion_progress
 
 class Game:
     """
     主游戏类，负责管理游戏循环、状态、实体和渲染。
     """
     def __init__(self, custom_map=None, monster_generator=None):
-        pygame.init()
-        pygame.font.init()
-        
-        self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
-        pygame.display.set_caption("Zombie Survival")
+        startup_report.clear()
+        with startup_report.phase("pygame 初始化 / 窗口"):
+            pygame.init()
+            pygame.font.init()
+            
+            self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+            pygame.display.set_caption("Zombie Survival")
         self.clock = pygame.time.Clock()
         self.is_running = True
         
@@ -71,11 +87,14 @@ class Game:
         pygame.key.stop_text_input()
         
         # (Spec V) 加载字体
-        self.font_main = pygame.font.Font(None, 24) # 用于 UI
-        self.font_minimap = pygame.font.Font(None, 16) # 用于小地图
+        with startup_report.phase("字体 / 提示文字"):
+            self.font_main = get_font(24) # 用于 UI
+            self.font_minimap = get_font(16) # 用于小地图
+            prerender_popups()
         
         # 加载精灵图像
-        self.sprite_images = self._load_sprite_images()
+        with startup_report.phase("精灵图像"):
+            self.sprite_images = self._load_sprite_images()
         
         # 游戏状态
         self.current_day = 1
@@ -84,6 +103,18 @@ class Game:
         self.active_bucket_rings = []  # 活跃的铁桶圆环列表（性能优化）
         self.floating_texts = []  # 浮动文字列表（BLOCK、MISS等）
         
+        # 游戏内定时器：复活、残躯结束、召唤冷却、尸爆延迟登记回调，每帧只执行到期的部分
+        self.scheduler = Scheduler()
+        
+        # 每帧战斗事件总线：碰撞阶段记录，帧末整批交给特效与统计
+        self.combat_events = CombatEventBus()
+        self.combat_events.subscribe(combat_events.REFLECT, self._on_reflect_events)
+        self.combat_events.subscribe(combat_events.BLOCK, self._on_block_events)
+        self.combat_events.subscribe(combat_events.EVADE, self._on_evade_events)
+        self.combat_events.subscribe(combat_events.DIED, self._on_died_events)
+        self.combat_events.subscribe(combat_events.UNDYING, self._on_undying_events)
+        self.combat_stats = CombatTelemetry(self.combat_events)
+        
         # 保存自定义地图和怪物生成函数
         self.custom_map = custom_map
         self.monster_generator = monster_generator if monster_generator else generate_monsters
@@ -93,50 +124,46 @@ class Game:
         # self.paused = False
         
         self.load_data()
+        if config.DEBUG_STARTUP_TIMING:
+            startup_report.print_report()
 
     def _load_sprite_images(self):
         """加载精灵图片资源，返回名称->Surface字典（如果找不到文件则返回空字典）
 
         加载目录: project_root/assets/sprites
         键使用文件名（不含扩展名），例如 'player', 'wanderer', 'bucket-烈爆'。
+        图像由 asset_manager 缓存，重复创建 Game 不会重新解码。
         """
-        sprites = {}
         # assets 位于工程根目录下（src/core -> src -> project root），因此向上两级到达项目根
         sprites_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'sprites')
         sprites_dir = os.path.normpath(sprites_dir)
 
-        if os.path.isdir(sprites_dir):
-            for fname in os.listdir(sprites_dir):
-                if not fname.lower().endswith(('.png', '.jpg', '.jpeg', '.gif')):
-                    continue
-                key = os.path.splitext(fname)[0]
-                path = os.path.join(sprites_dir, fname)
-                try:
-                    img = pygame.image.load(path).convert_alpha()
-                    sprites[key] = img
-                except Exception as e:
-                    print(f"Warning: failed to load sprite '{path}': {e}")
-        else:
+        sprites = asset_manager.load_images_in_dir(sprites_dir)
+        if sprites is None:
             print(f"Warning: sprites directory not found: {sprites_dir}")
-
+            return {}
         return sprites
 
     def load_data(self):
         """加载所有游戏资源和初始状态"""
         
-        # 1. 地图
-        self.city_map = CityMap(self.custom_map)
+        # 1. 地图（解析结果与贴图由 asset_manager 缓存，重新开始时不再读盘）
+        with startup_report.phase("地图解析"):
+            self.city_map = asset_manager.get_city_map(self.custom_map)
         # (Spec V) 加载地图贴图
-        self.tile_images = drawing.load_tile_images()
+        with startup_report.phase("地图贴图"):
+            self.tile_images = drawing.load_tile_images()
+        # 贴图与精灵的常用尺寸收录进纹理图集（已收录的条目直接复用）
+        with startup_report.phase("纹理图集"):
+            build_game_atlas(self.tile_images, self.sprite_images)
         
         # 2. 实体组
         self.all_sprites = pygame.sprite.Group()
         self.monsters = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.walls = pygame.sprite.Group() # (Spec IV) 碰撞组
-
+        self.bullets = BulletManager()  # 数组化子弹系统
         # 3. 创建墙体碰撞器 (Spec IV)
-        self.create_wall_colliders()
+        with startup_report.phase("墙体碰撞器"):
+            self.create_wall_colliders() # (Spec IV) 碰撞组 self.walls
 
         # 4. 创建玩家
         start_r, start_c = self.city_map.get_player_position()
@@ -151,26 +178,12 @@ class Game:
         self.camera = Camera(config.WORLD_WIDTH, config.WORLD_HEIGHT)
 
         # 6. 生成第一波怪物
-        self.spawn_wave()
+        with startup_report.phase("第一波怪物"):
+            self.spawn_wave()
 
     def create_wall_colliders(self):
-        """(Spec IV) 遍历地图，为 '#' 和 '~' 创建碰撞 Sprite"""
-        W, H = self.city_map.get_dimensions()
-        for r in range(H):
-            for c in range(W):
-                tile = self.city_map.get_tile(r, c)
-                # (Spec IV) 玩家不可穿过 # 和 ~
-                if tile == '#' or tile == '~':
-                    wall_sprite = pygame.sprite.Sprite()
-                    wall_sprite.rect = pygame.Rect(
-                        c * config.TILE_SIZE, 
-                        r * config.TILE_SIZE, 
-                        config.TILE_SIZE, 
-                        config.TILE_SIZE
-                    )
-                    # (用于怪物 AI 区分)
-                    wall_sprite.tile_type = tile 
-                    self.walls.add(wall_sprite)
+        """(Spec IV) 为 '#' 和 '~' 创建碰撞 Sprite（同一地图的碰撞组由 asset_manager 复用）"""
+        self.walls = asset_manager.get_wall_colliders(self.city_map)
 
     def spawn_wave(self):
         """(Spec IV) 生成新一波怪物"""
@@ -203,6 +216,10 @@ class Game:
             m.rect.center = m.pos
             self.all_sprites.add(m)
             self.monsters.add(m)
+            
+            # 呼唤者：登记召唤检查（只在生成时判断一次精英类型）
+            if getattr(m.logic, 'elite_type', None) == 'summoner':
+                self.scheduler.schedule(0, self._summoner_tick, m)
 
     def run(self):
         """主游戏循环"""
@@ -260,10 +277,9 @@ class Game:
             if event.type == pygame.MOUSEBUTTONDOWN and not self.game_over:
                 if event.button == 1: # 左键点击
                     # print("检测到鼠标左键点击")
-                    bullet = self.player.shoot(mouse_world_pos)
-                    if bullet:
-                        self.all_sprites.add(bullet)
-                        self.bullets.add(bullet)
+                    shot = self.player.fire(mouse_world_pos)
+                    if shot:
+                        self.bullets.spawn(*shot)
     
     def _restart_game(self):
         """重新开始游戏"""
@@ -271,11 +287,17 @@ class Game:
         self.current_day = 1
         self.game_over = False
         self.corpse_explosions.clear()
+        for text in self.floating_texts:
+            floating_text_pool.release(text)
+        self.floating_texts.clear()
+        self.combat_events.clear()
+        self.combat_stats.reset()
+        self.scheduler.clear()
         
-        # 清空所有精灵组
+        # 清空所有精灵组和子弹
         self.all_sprites.empty()
         self.monsters.empty()
-        self.bullets.empty()
+        self.bullets.clear()
         
         # 重新加载游戏数据
         self.load_data()
@@ -299,63 +321,20 @@ class Game:
         self.bullets.update(self.dt)
         
         # 2.5. 更新浮动文字
-        from entities.floating_text import FloatingText
-        for text in self.floating_texts[:]:
+        # 原地压缩列表，结束的文字归还对象池
+        texts = self.floating_texts
+        keep = 0
+        for text in texts:
             text.update(self.dt)
             if text.finished:
-                self.floating_texts.remove(text)
+                floating_text_pool.release(text)
+            else:
+                texts[keep] = text
+                keep += 1
+        del texts[keep:]
         
-        # 2.6. 更新游荡者复活倒计时
-        for monster in self.monsters:
-            if monster.logic.is_reviving:
-                monster.logic.revive_timer -= self.dt
-                if monster.logic.revive_timer <= 0:
-                    # 复活！
-                    monster.logic.is_reviving = False
-                    monster.logic.is_alive = True
-                    monster.logic.current_hp = monster.logic.max_hp
-                    if config.DEBUG_COMBAT_LOG:
-                        print(f"[COMBAT] {monster.logic.name} 复活了！HP: {monster.logic.current_hp:.1f}/{monster.logic.max_hp}", flush=True)
-        
-        # 2.7. 更新精英技能状态
-        current_time = pygame.time.get_ticks() / 1000.0
-        for monster in self.monsters:
-            # 呼唤者：检查是否可以召唤
-            if hasattr(monster.logic, 'elite_type') and monster.logic.elite_type == 'summoner':
-                if monster.logic.can_summon(current_time) and len(self.monsters) < 500:
-                    # 检查玩家是否在威胁范围内
-                    from systems.monsters import config as mcfg
-                    threat_range = mcfg.MONSTER_SKILL_PARAMS['Wanderer_Summoner_Range']
-                    dist = monster.pos.distance_to(self.player.pos)
-                    if dist <= threat_range:
-                        summon_count = monster.logic.perform_summon(current_time)
-                        # 在呼唤者附近随机生成小怪
-                        for _ in range(summon_count):
-                            if len(self.monsters) >= 500:
-                                break
-                            # 随机偏移位置，确保不超出地图边界
-                            import random
-                            offset_x = random.randint(-50, 50)
-                            offset_y = random.randint(-50, 50)
-                            spawn_x = max(50, min(monster.pos.x + offset_x, config.WORLD_WIDTH - 50))
-                            spawn_y = max(50, min(monster.pos.y + offset_y, config.WORLD_HEIGHT - 50))
-                            spawn_pos = pygame.Vector2(spawn_x, spawn_y)
-                            
-                            # 创建普通游荡者
-                            from systems.monsters.monster_factory import create_monster
-                            from entities.monster_sprite import MonsterSprite
-                            new_monster_logic = create_monster("Wanderer", monster.logic.level - 20, False, (0, 0))
-                            new_monster = MonsterSprite(new_monster_logic, spawn_pos)
-                            self.monsters.add(new_monster)
-                            
-                            if config.DEBUG_COMBAT_LOG:
-                                print(f"[COMBAT] {monster.logic.name} 召唤了 {new_monster_logic.name}！", flush=True)
-            
-            # 不死者：更新残躯状态
-            if hasattr(monster.logic, 'elite_type') and monster.logic.elite_type == 'undying':
-                if monster.logic.update_undying(current_time):
-                    # 残躯结束，真正死亡
-                    monster.kill()
+        # 2.6. 推进游戏时间，执行到期的定时器（复活、残躯结束、召唤、尸爆开始）
+        self.scheduler.advance(self.dt)
         
         # 3. 更新摄像机 (Spec II)
         self.camera.update(self.player)
@@ -419,136 +398,180 @@ class Game:
         # 6. 碰撞检测 (Spec IV)
         
         # 子弹 vs 怪物 (使用穿透机制)
-        from entities.floating_text import FloatingText
-
-        # 使用圆形碰撞检测：避免细长的食尸鬼在未旋转 rect 时产生不自然的视觉
-        def _monster_bullet_collide(monster_sprite, bullet_sprite):
-            # 使用 monster_sprite.collision_radius（已在 MonsterSprite._set_dimensions 中设置）
-            br = getattr(bullet_sprite, 'radius', None)
-            if getattr(monster_sprite.logic, 'type', None) == 'Ghoul' and br is not None:
-                # 对于 Ghoul 使用旋转矩形检测：将子弹点旋转到怪物局部坐标系后做 AABB + 半径检测
-                # 交换 width/height 保证短边朝向前方
-                w = getattr(monster_sprite, 'height', 0)
-                h = getattr(monster_sprite, 'width', 0)
-                angle = monster_sprite.angle_rad
-                # 将子弹相对于怪物中心的向量旋转 -angle
-                dx = bullet_sprite.pos.x - monster_sprite.pos.x
-                dy = bullet_sprite.pos.y - monster_sprite.pos.y
-                ca = math.cos(-angle)
-                sa = math.sin(-angle)
-                lx = dx * ca - dy * sa
-                ly = dx * sa + dy * ca
-                # AABB 检查：最近点
-                half_w = w / 2.0
-                half_h = h / 2.0
-                nearest_x = max(-half_w, min(lx, half_w))
-                nearest_y = max(-half_h, min(ly, half_h))
-                ddx = lx - nearest_x
-                ddy = ly - nearest_y
-                return (ddx*ddx + ddy*ddy) <= (br * br)
-            else:
-                mr = getattr(monster_sprite, 'collision_radius', None)
-                if mr is None or br is None:
-                    # 回退到 rect 碰撞
-                    return monster_sprite.rect.colliderect(bullet_sprite.rect)
-                dx = monster_sprite.pos.x - bullet_sprite.pos.x
-                dy = monster_sprite.pos.y - bullet_sprite.pos.y
-                return (dx*dx + dy*dy) <= (mr + br) * (mr + br)
-
-        hits = pygame.sprite.groupcollide(self.monsters, self.bullets, False, False, collided=_monster_bullet_collide)
-        
-        for monster_hit, bullets in hits.items():
+        # 使用圆形碰撞检测：避免细长的食尸鬼在未旋转 rect 时产生不自然的视觉（食尸鬼使用旋转矩形）
+        # 子弹按本帧移动线段做扫掠检测，大 dt 时也不会穿过目标
+        bullets = self.bullets
+        for monster_hit in self.monsters.sprites():
+            if len(bullets) == 0:
+                break
             # 跳过正在复活的游荡者
             if monster_hit.logic.is_reviving:
                 continue
             
-            for bullet in bullets:
-                # 检查这个子弹是否已经命中过这个怪物（跨帧检查）
-                if monster_hit in bullet.hit_monsters:
+            hit_indices = bullets.query_monster(monster_hit)
+            
+            for bullet in hit_indices.tolist():
+                # 检查这个子弹是否已经命中过这个怪物（跨帧检查），并记录命中
+                if not bullets.register_hit(bullet, monster_hit):
                     continue  # 已经命中过，跳过
                 
-                # 记录命中
-                bullet.hit_monsters.add(monster_hit)
-                
                 # 获取玩家攻击力
                 damage = self.player.logic.total_stats.get("攻击力", 10)
                 
-                # 调用怪物受伤方法
+                # 调用怪物受伤方法，后果记录到事件总线（帧末统一处理）
                 result = monster_hit.logic.take_damage(damage, "玩家")
-                
-                # 处理荆棘守卫反弹
-                if result.get('reflected_damage', 0) > 0:
-                    # 反弹伤害给玩家
-                    self.player.take_damage(result['reflected_damage'], f"{monster_hit.logic.name}的荆棘反弹")
-                    # 添加反弹文字提示
-                    text_pos = (monster_hit.pos.x, monster_hit.pos.y - 50)
-                    text = FloatingText("REFLECT", text_pos, (255, 100, 100), 1.0, 24)
-                    self.floating_texts.append(text)
-                
-                # 处理格挡
-                if result['blocked']:
-                    text_pos = (monster_hit.pos.x, monster_hit.pos.y - 30)
-                    text = FloatingText("BLOCK", text_pos, (255, 255, 0), 1.0, 24)  # 黄色
-                    self.floating_texts.append(text)
-                
-                # 处理闪避
-                if result['evaded']:
-                    text_pos = (monster_hit.pos.x, monster_hit.pos.y - 30)
-                    text = FloatingText("MISS", text_pos, (255, 255, 255), 1.0, 24)  # 白色
-                    self.floating_texts.append(text)
-                
-                # 处理死亡
-                if result['died']:
-                    # 铁桶死亡触发尸爆
-                    if monster_hit.logic.type == 'Bucket':
-                        from systems.monsters import config as mcfg
-                        explosion_damage = monster_hit.logic.max_hp * mcfg.MONSTER_SKILL_PARAMS['Bucket_Corpse_Explosion_HP_Dmg']
-                        
-                        # 庞然：尸爆范围增加
-                        explosion_range = config.CORPSE_EXPLOSION_RANGE
-                        if hasattr(monster_hit.logic, 'get_range_bonus'):
-                            explosion_range += monster_hit.logic.get_range_bonus()
-                        
-                        explosion = CorpseExplosion(
-                            monster_hit.pos.copy(),
-                            explosion_range,
-                            config.CORPSE_EXPLOSION_DELAY,
-                            explosion_damage,
-                            monster_hit.logic.name
-                        )
-                        self.corpse_explosions.append(explosion)
-                    
-                    # 游荡者复活：不立即移除
-                    if not result['will_revive']:
-                        monster_hit.kill()  # 从所有组中移除
+                events = self.combat_events
+                if result.reflected_damage > 0:
+                    events.emit(combat_events.REFLECT, monster_hit, result.reflected_damage)
+                if result.blocked:
+                    events.emit(combat_events.BLOCK, monster_hit, result.actual_damage)
+                elif result.evaded:
+                    events.emit(combat_events.EVADE, monster_hit)
+                elif result.actual_damage > 0:
+                    events.emit(combat_events.HIT, monster_hit, result.actual_damage)
+                if result.died:
+                    events.emit(combat_events.DIED, monster_hit, flag=result.will_revive)
+                elif result.undying_triggered:
+                    events.emit(combat_events.UNDYING, monster_hit)
                 
                 # 处理子弹命中计数
-                if result['evaded']:
-                    # 闪避：不消耗命中次数，子弹继续飞行
-                    pass
-                elif result['blocked']:
-                    # 格挡：不消耗命中次数，子弹继续飞行
-                    pass
-                else:
+                # 闪避 / 格挡：不消耗命中次数，子弹继续飞行
+                if not (result.evaded or result.blocked):
                     # 实际命中：消耗1次命中次数
-                    bullet.hit_count -= 1
-                    if bullet.hit_count <= 0:
-                        bullet.kill()  # 命中次数耗尽，销毁子弹
+                    bullets.consume_hit(bullet)  # 命中次数耗尽的子弹不再参与碰撞
+        
+        # 移除命中次数耗尽或本帧超出射程的子弹
+        bullets.compact()
+        
+        # 6.5. 分发本帧战斗事件（反弹伤害、提示文字、尸爆、移除死亡怪物、统计）
+        self.combat_events.dispatch()
         
         # 7. 检查玩家死亡
         if self.player.is_dead and not self.game_over:
             self.game_over = True
             print("\n=== GAME OVER ===")
+            print(f"本局战斗统计：{self.combat_stats.summary()}")
 
         # 8. 游戏循环 (Spec IV)
         if not self.monsters: # 如果怪物组为空
             self.current_day += 1
             self.spawn_wave()
     
+    # --- 战斗事件订阅者 ---
+    
+    def _on_reflect_events(self, events):
+        """荆棘守卫反弹：伤害玩家并显示 REFLECT"""
+        for event in events:
+            monster = event.monster
+            self.player.take_damage(event.amount, f"{monster.logic.name}的荆棘反弹")
+            text_pos = (monster.pos.x, monster.pos.y - 50)
+            self.floating_texts.append(floating_text_pool.acquire("REFLECT", text_pos, (255, 100, 100), 1.0, 24))
+    
+    def _on_block_events(self, events):
+        for event in events:
+            text_pos = (event.monster.pos.x, event.monster.pos.y - 30)
+            self.floating_texts.append(floating_text_pool.acquire("BLOCK", text_pos, (255, 255, 0), 1.0, 24))  # 黄色
+    
+    def _on_evade_events(self, events):
+        for event in events:
+            text_pos = (event.monster.pos.x, event.monster.pos.y - 30)
+            self.floating_texts.append(floating_text_pool.acquire("MISS", text_pos, (255, 255, 255), 1.0, 24))  # 白色
+    
+    def _on_died_events(self, events):
+        """铁桶死亡触发尸爆；不会复活的怪物从所有组中移除"""
+        for event in events:
+            monster = event.monster
+            if monster.logic.type == 'Bucket':
+                explosion_damage = monster.logic.max_hp * mcfg.MONSTER_SKILL_PARAMS['Bucket_Corpse_Explosion_HP_Dmg']
+                
+                # 庞然：尸爆范围增加
+                explosion_range = config.CORPSE_EXPLOSION_RANGE
+                if hasattr(monster.logic, 'get_range_bonus'):
+                    explosion_range += monster.logic.get_range_bonus()
+                
+                self.corpse_explosions.append(CorpseExplosion(
+                    monster.pos.copy(),
+                    explosion_range,
+                    config.CORPSE_EXPLOSION_DELAY,
+                    explosion_damage,
+                    monster.logic.name,
+                    self.scheduler
+                ))
+            
+            # 游荡者复活：不立即移除，登记复活时间
+            if event.flag:
+                self.scheduler.schedule(monster.logic.revive_timer, self._revive_monster, monster)
+            else:
+                monster.kill()
+    
+    def _on_undying_events(self, events):
+        """不死者进入残躯：登记残躯结束时间"""
+        for event in events:
+            monster = event.monster
+            self.scheduler.schedule(monster.logic.undying_duration, self._end_undying, monster)
+    
+    # --- 定时器回调 ---
+    
+    def _revive_monster(self, monster):
+        """游荡者复活"""
+        logic = monster.logic
+        if not monster.alive() or not logic.is_reviving:
+            return
+        logic.is_reviving = False
+        logic.is_alive = True
+        logic.current_hp = logic.max_hp
+        if config.DEBUG_COMBAT_LOG:
+            combat_log.emit(REVIVE, logic.name, logic.current_hp, logic.max_hp)
+    
+    def _end_undying(self, monster):
+        """残躯结束，真正死亡"""
+        if monster.alive() and monster.logic.end_undying():
+            monster.kill()
+    
+    def _summoner_tick(self, monster):
+        """
+        呼唤者召唤检查：冷却中则登记到冷却结束，玩家不在威胁范围内（或怪物已达上限）
+        则每 Wanderer_Summoner_Check_Interval 秒复查一次，
+        召唤后登记下一次冷却结束。怪物被移除后不再登记。
+        """
+        if not monster.alive():
+            return
+        logic = monster.logic
+        now = self.scheduler.now
+        if not logic.can_summon(now):
+            self.scheduler.schedule_at(logic.last_summon_time + logic.summon_cooldown, self._summoner_tick, monster)
+            return
+        
+        threat_range = mcfg.MONSTER_SKILL_PARAMS['Wanderer_Summoner_Range']
+        if len(self.monsters) >= 500 or monster.pos.distance_to(self.player.pos) > threat_range:
+            self.scheduler.schedule(mcfg.MONSTER_SKILL_PARAMS['Wanderer_Summoner_Check_Interval'],
+                                    self._summoner_tick, monster)
+            return
+        
+        summon_count = logic.perform_summon(now)
+        # 在呼唤者附近随机生成小怪
+        for _ in range(summon_count):
+            if len(self.monsters) >= 500:
+                break
+            # 随机偏移位置，确保不超出地图边界
+            offset_x = random.randint(-50, 50)
+            offset_y = random.randint(-50, 50)
+            spawn_x = max(50, min(monster.pos.x + offset_x, config.WORLD_WIDTH - 50))
+            spawn_y = max(50, min(monster.pos.y + offset_y, config.WORLD_HEIGHT - 50))
+            spawn_pos = pygame.Vector2(spawn_x, spawn_y)
+            
+            # 创建普通游荡者
+            new_monster_logic = create_monster("Wanderer", logic.level - 20, False, (0, 0))
+            new_monster = MonsterSprite(new_monster_logic, spawn_pos)
+            self.monsters.add(new_monster)
+            
+            if config.DEBUG_COMBAT_LOG:
+                combat_log.emit(SUMMON, logic.name, new_monster_logic.name)
+        
+        self.scheduler.schedule(logic.summon_cooldown, self._summoner_tick, monster)
+    
     def _precalculate_auras(self):
         """性能优化：预计算所有怪物的光环加成（每帧一次）"""
-        from systems.monsters import config as mcfg
-        
         # 为每个怪物计算光环加成
         for monster in self.monsters:
             if not monster.logic.is_alive:
@@ -608,7 +631,7 @@ class Game:
                 for monster in self.monsters:
                     if monster.logic.name == attack_info['attacker_name']:
                         text_pos = (monster.pos.x, monster.pos.y - 40)
-                        text = FloatingText("CRIT!", text_pos, (255, 50, 50), 1.2, 28)
+                        text = floating_text_pool.acquire("CRIT!", text_pos, (255, 50, 50), 1.2, 28)
                         self.floating_texts.append(text)
                         break
             
@@ -623,7 +646,7 @@ class Game:
                         monster.logic.current_hp = min(monster.logic.current_hp + heal_amount, monster.logic.max_hp)
                         healed = monster.logic.current_hp - old_hp
                         if healed > 0 and config.DEBUG_COMBAT_LOG:
-                            print(f"[COMBAT] {monster.logic.name} 吸血回复 {healed:.1f} HP！", flush=True)
+                            combat_log.emit(LIFESTEAL, monster.logic.name, healed)
                         break
         
         elif attack_info['type'] == 'aoe':
@@ -643,24 +666,18 @@ class Game:
         # 2. 绘制实体 (Spec III)
         # 按照特定顺序绘制
         
-        # 绘制所有怪物
-        for monster in self.monsters:
-            drawing.draw_monster(self.screen, monster, self.camera, self.sprite_images)
+        # 绘制所有怪物（整批提交）
+        drawing.draw_monsters(self.screen, self.monsters, self.camera, self.sprite_images)
             
         # 绘制玩家
         drawing.draw_player(self.screen, self.player, self.camera, self.sprite_images)
         
         # 绘制子弹 (覆盖在其他实体之上)
-        for bullet in self.bullets:
-            # 子弹有自己的 image，可以直接 blit
-            self.screen.blit(bullet.image, self.camera.apply_to_rect(bullet.rect))
+        # 共享子弹图像，整批提交
+        drawing.draw_bullets(self.screen, self.bullets, self.camera)
 
         # 绘制碰撞调试图形（玩家/怪物/子弹） - 通过 config.DEBUG_DRAW_COLLISIONS 控制
-        try:
-            import config as game_config
-        except Exception:
-            game_config = config
-        if getattr(game_config, 'DEBUG_DRAW_COLLISIONS', False):
+        if getattr(config, 'DEBUG_DRAW_COLLISIONS', False):
             drawing.draw_collision_shapes(self.screen, self.player, self.monsters, self.bullets, self.camera)
 
         # 绘制树木 (覆盖在实体之上，实现遮挡效果)
@@ -673,13 +690,7 @@ class Game:
         drawing.draw_corpse_explosions(self.screen, self.corpse_explosions, self.camera, self.sprite_images)
         
         # 绘制浮动文字（BLOCK、MISS等）
-        for text in self.floating_texts:
-            screen_x, screen_y = self.camera.apply_to_coords(text.pos.x, text.pos.y)
-            # 应用透明度
-            alpha = text.get_alpha()
-            if alpha < 255:
-                text.surface.set_alpha(alpha)
-            self.screen.blit(text.surface, (screen_x - text.rect.width // 2, screen_y - text.rect.height // 2))
+        drawing.draw_floating_texts(self.screen, self.floating_texts, self.camera)
 
         # 3. 绘制 UI (Spec V) - (不跟随摄像机)
         drawing.draw_ui(self.screen, self.player.logic, self.current_day, self.font_main)
@@ -695,5 +706,6 @@ class Game:
         pygame.display.flip()
 
     def quit(self):
+        combat_log.close()
         pygame.quit()
         sys.exit()
\ No newline at end of file
@@ -1,6 +1,6 @@
 # Game entity modules
 from .player import Player
-from .bullet import Bullet
+from .bullet_manager import BulletManager
 from .monster_sprite import MonsterSprite
 
-__all__ = ['Player', 'Bullet', 'MonsterSprite']
+__all__ = ['Player', 'BulletManager', 'MonsterSprite']
@@ -0,0 +1,250 @@
+# bullet_manager.py
+# 数组化子弹系统：位置、速度、飞行距离、剩余命中次数、半径存放在 NumPy 数组中，
+# 每帧一次向量化完成移动与射程剔除；碰撞查询与绘制列表也按整批计算。
+# 碰撞为连续检测：使用子弹本帧的移动线段（上一位置 -> 当前位置）做扫掠测试，
+# 低帧率或大 dt 时高速子弹也不会穿过细小的目标。
+
+import math
+import numpy as np
+import sys
+import os
+
+# 添加父目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import config
+from entities.bullet import get_bullet_image
+
+
+class BulletManager:
+    """
+    所有飞行中子弹的集合。前 count 个槽位为存活子弹，移除时整体压缩以保持发射顺序。
+    hit_monsters[i] 记录第 i 个子弹已命中过的怪物（防止同一怪物被命中多次）。
+    """
+    def __init__(self, capacity=256):
+        self.count = 0
+        self._allocate(capacity)
+        self.color = config.BULLET_COLOR
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2))
+        self.prev_pos = np.zeros((capacity, 2))  # 本帧移动前的位置
+        self.vel = np.zeros((capacity, 2))
+        self.speed = np.zeros(capacity)
+        self.distance = np.zeros(capacity)
+        self.max_range = np.zeros(capacity)
+        self.hits = np.zeros(capacity, dtype=np.int32)
+        self.radius = np.zeros(capacity)
+        self.hit_monsters = [set() for _ in range(capacity)]
+        self._step = np.zeros((capacity, 2))  # 积分用的临时缓冲
+
+    def _grow(self):
+        """容量翻倍，保留现有子弹"""
+        n = self.count
+        old = (self.pos, self.prev_pos, self.vel, self.speed, self.distance, self.max_range, self.hits, self.radius)
+        old_sets = self.hit_monsters
+        self._allocate(self.capacity * 2)
+        for dst, src in zip((self.pos, self.prev_pos, self.vel, self.speed, self.distance,
+                             self.max_range, self.hits, self.radius), old):
+            dst[:n] = src[:n]
+        self.hit_monsters[:len(old_sets)] = old_sets
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        for i in range(self.count):
+            self.hit_monsters[i].clear()
+        self.count = 0
+
+    def spawn(self, start_pos, direction, max_range, hit_count=2, radius=None):
+        """发射一颗子弹（direction 为单位向量），返回其槽位"""
+        if self.count >= self.capacity:
+            self._grow()
+        i = self.count
+        self.pos[i] = (start_pos[0], start_pos[1])
+        self.prev_pos[i] = self.pos[i]
+        self.vel[i] = (direction[0] * config.BULLET_SPEED, direction[1] * config.BULLET_SPEED)
+        self.speed[i] = math.hypot(self.vel[i, 0], self.vel[i, 1])
+        self.distance[i] = 0.0
+        self.max_range[i] = max_range
+        self.hits[i] = hit_count
+        self.radius[i] = config.BULLET_RADIUS if radius is None else radius
+        self.hit_monsters[i].clear()
+        self.count += 1
+        return i
+
+    def update(self, dt):
+        """
+        整批移动所有子弹。本帧超出射程的子弹停在射程终点，
+        仍参与本帧的扫掠碰撞，随后由 compact 移除（碰撞检测后调用）。
+        """
+        n = self.count
+        if n == 0:
+            return
+        self.prev_pos[:n] = self.pos[:n]
+        step = self._step[:n]
+        np.multiply(self.vel[:n], dt, out=step)
+        self.pos[:n] += step
+        distance = self.distance[:n]
+        distance += self.speed[:n] * dt
+
+        # 截断超射程部分：pos = prev + step * (剩余射程 / 本帧位移)
+        over = distance - self.max_range[:n]
+        expired = np.flatnonzero(over > 0)
+        if len(expired):
+            travelled = self.speed[expired] * dt
+            keep = np.clip(1.0 - over[expired] / np.maximum(travelled, 1e-9), 0.0, 1.0)
+            self.pos[expired] = self.prev_pos[expired] + step[expired] * keep[:, None]
+
+    def compact(self):
+        """移除超射程或命中次数耗尽的子弹，存活子弹保持原有顺序"""
+        n = self.count
+        if n == 0:
+            return
+        alive = (self.distance[:n] <= self.max_range[:n]) & (self.hits[:n] > 0)
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        if k == n:
+            return
+        for arr in (self.pos, self.prev_pos, self.vel, self.speed, self.distance, self.max_range, self.hits, self.radius):
+            arr[:k] = arr[keep]
+        sets = self.hit_monsters
+        dead = [sets[i] for i in np.flatnonzero(~alive)]
+        sets[:k] = [sets[i] for i in keep]
+        for j, hit_set in enumerate(dead):
+            hit_set.clear()  # 不再持有怪物引用
+            sets[k + j] = hit_set
+        self.count = k
+
+    # --- 碰撞查询 ---
+
+    def _segments(self):
+        """本帧移动线段：起点 (x0, y0) 与位移 (dx, dy)"""
+        n = self.count
+        x0 = self.prev_pos[:n, 0]
+        y0 = self.prev_pos[:n, 1]
+        return x0, y0, self.pos[:n, 0] - x0, self.pos[:n, 1] - y0
+
+    def query_circle(self, cx, cy, r):
+        """移动线段扫过的胶囊体与圆 (cx, cy, r) 相交且仍可命中的子弹槽位（升序）"""
+        n = self.count
+        x0, y0, dx, dy = self._segments()
+        # 圆心到线段的最近点参数 t ∈ [0, 1]
+        fx = cx - x0
+        fy = cy - y0
+        length_sq = dx * dx + dy * dy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(length_sq > 0, (fx * dx + fy * dy) / length_sq, 0.0)
+        np.clip(t, 0.0, 1.0, out=t)
+        ex = fx - t * dx
+        ey = fy - t * dy
+        reach = self.radius[:n] + r
+        mask = (ex * ex + ey * ey <= reach * reach) & (self.hits[:n] > 0)
+        return np.flatnonzero(mask)
+
+    def _query_box(self, cx, cy, half_w, half_h, angle):
+        """移动线段扫过的胶囊体与中心 (cx, cy)、旋转 angle 的矩形相交的布尔掩码"""
+        n = self.count
+        x0, y0, dx, dy = self._segments()
+        # 线段转换到矩形局部坐标系（旋转 -angle）
+        ca = math.cos(-angle)
+        sa = math.sin(-angle)
+        rx = x0 - cx
+        ry = y0 - cy
+        px = rx * ca - ry * sa
+        py = rx * sa + ry * ca
+        qx = dx * ca - dy * sa
+        qy = dx * sa + dy * ca
+
+        # 1. 线段与矩形相交（Liang-Barsky 裁剪）
+        t_lo = np.zeros(n)
+        t_hi = np.ones(n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for p, q, h in ((px, qx, half_w), (py, qy, half_h)):
+                moving = q != 0
+                t1 = np.where(moving, (-h - p) / q, -np.inf)
+                t2 = np.where(moving, (h - p) / q, np.inf)
+                # 平行于该轴且在板外：不可能相交
+                outside = ~moving & (np.abs(p) > h)
+                np.maximum(t_lo, np.minimum(t1, t2), out=t_lo)
+                np.minimum(t_hi, np.maximum(t1, t2), out=t_hi)
+                t_hi[outside] = -1.0
+        crossing = t_lo <= t_hi
+
+        # 2. 不相交时，距离由线段端点到矩形、或矩形顶点到线段的最小值给出
+        r = self.radius[:n]
+        r_sq = r * r
+
+        def point_box_sq(x, y):
+            ddx = x - np.clip(x, -half_w, half_w)
+            ddy = y - np.clip(y, -half_h, half_h)
+            return ddx * ddx + ddy * ddy
+
+        near = (point_box_sq(px, py) <= r_sq) | (point_box_sq(px + qx, py + qy) <= r_sq)
+        length_sq = qx * qx + qy * qy
+        for kx, ky in ((-half_w, -half_h), (half_w, -half_h), (-half_w, half_h), (half_w, half_h)):
+            fx = kx - px
+            fy = ky - py
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = np.where(length_sq > 0, (fx * qx + fy * qy) / length_sq, 0.0)
+            np.clip(t, 0.0, 1.0, out=t)
+            ex = fx - t * qx
+            ey = fy - t * qy
+            near |= ex * ex + ey * ey <= r_sq
+
+        return (crossing | near) & (self.hits[:n] > 0)
+
+    def query_oriented_rect(self, cx, cy, half_w, half_h, angle):
+        """移动线段扫过的胶囊体与旋转矩形相交且仍可命中的子弹槽位（升序）"""
+        return np.flatnonzero(self._query_box(cx, cy, half_w, half_h, angle))
+
+    def query_rect(self, rect):
+        """移动线段扫过的胶囊体与 rect 相交且仍可命中的子弹槽位（升序）"""
+        cx, cy = rect.center
+        return np.flatnonzero(self._query_box(cx, cy, rect.width / 2.0, rect.height / 2.0, 0.0))
+
+    def query_monster(self, monster_sprite):
+        """
+        与怪物碰撞的子弹槽位。
+        食尸鬼使用旋转矩形（交换 width/height 保证短边朝向前方），其余使用圆形。
+        """
+        if getattr(monster_sprite.logic, 'type', None) == 'Ghoul':
+            half_w = getattr(monster_sprite, 'height', 0) / 2.0
+            half_h = getattr(monster_sprite, 'width', 0) / 2.0
+            return self.query_oriented_rect(monster_sprite.pos.x, monster_sprite.pos.y,
+                                            half_w, half_h, monster_sprite.angle_rad)
+        mr = getattr(monster_sprite, 'collision_radius', None)
+        if mr is None:
+            # 回退到 rect 碰撞
+            return self.query_rect(monster_sprite.rect)
+        return self.query_circle(monster_sprite.pos.x, monster_sprite.pos.y, mr)
+
+    def register_hit(self, i, monster):
+        """记录子弹 i 命中 monster；该子弹已命中过此怪物时返回 False"""
+        hit_set = self.hit_monsters[i]
+        if monster in hit_set:
+            return False
+        hit_set.add(monster)
+        return True
+
+    def consume_hit(self, i):
+        """实际命中：消耗 1 次命中次数（耗尽的子弹在 compact 时移除）"""
+        self.hits[i] -= 1
+
+    # --- 绘制 ---
+
+    def blit_sequence(self, offset_x, offset_y):
+        """
+        生成供 Surface.blits 使用的 [(image, (x, y)), ...]。
+        offset 为摄像机左上角的世界坐标。
+        """
+        n = self.count
+        if n == 0:
+            return []
+        r = self.radius[:n]
+        xs = (self.pos[:n, 0] - r - offset_x).astype(np.int32).tolist()
+        ys = (self.pos[:n, 1] - r - offset_y).astype(np.int32).tolist()
+        images = [get_bullet_image(self.color, int(radius)) for radius in r.tolist()]
+        return list(zip(images, zip(xs, ys)))
@@ -1,8 +1,30 @@
 # floating_text.py
 import pygame
+import sys
+import os
+
+# 添加父目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from systems.fonts import render_static
+
+# 游戏中使用的固定提示文字：(文字, 颜色, 字号)，启动时预渲染
+POPUP_STYLES = (
+    ("REFLECT", (255, 100, 100), 24),
+    ("BLOCK", (255, 255, 0), 24),
+    ("MISS", (255, 255, 255), 24),
+    ("CRIT!", (255, 50, 50), 28),
+)
+
+def prerender_popups():
+    """预渲染所有固定提示文字（需在 pygame.font 初始化之后调用）"""
+    for text, color, size in POPUP_STYLES:
+        render_static(text, color, size)
+
 
 class FloatingText:
     """浮动文字效果，用于显示BLOCK、MISS等提示"""
+    __slots__ = ('pos', 'duration', 'timer', 'finished', 'velocity_y', 'surface', 'rect')
     
     def __init__(self, text, pos, color, duration=1.0, font_size=20):
         """
@@ -13,9 +35,13 @@ class FloatingText:
             duration: 持续时间（秒）
             font_size: 字体大小
         """
-        self.text = text
-        self.pos = pygame.math.Vector2(pos[0], pos[1])
-        self.color = color
+        self.pos = pygame.math.Vector2()
+        self.rect = None
+        self.reset(text, pos, color, duration, font_size)
+    
+    def reset(self, text, pos, color, duration=1.0, font_size=20):
+        """（重新）初始化浮动文字，复用已有的位置向量与 Rect"""
+        self.pos.update(pos[0], pos[1])
         self.duration = duration
         self.timer = 0
         self.finished = False
@@ -23,10 +49,13 @@ class FloatingText:
         # 向上飘动
         self.velocity_y = -50  # 向上50px/s
         
-        # 渲染文字
-        self.font = pygame.font.Font(None, font_size)
-        self.surface = self.font.render(text, True, color)
-        self.rect = self.surface.get_rect(center=(self.pos.x, self.pos.y))
+        # 共享的预渲染文字（不可修改，淡出由绘制时的 get_faded 处理）
+        self.surface = render_static(text, color, font_size)
+        if self.rect is None:
+            self.rect = self.surface.get_rect()
+        else:
+            self.rect.size = self.surface.get_size()
+        self.rect.center = (self.pos.x, self.pos.y)
     
     def update(self, dt):
         """更新浮动文字状态"""
@@ -51,3 +80,28 @@ class FloatingText:
             fade_progress = (self.timer - fade_start) / 0.3
             return int(255 * (1.0 - fade_progress))
         return 255
+
+
+class FloatingTextPool:
+    """浮动文字对象池：结束的文字归还后在下次提示时复用"""
+    def __init__(self):
+        self._free = []
+
+    def acquire(self, text, pos, color, duration=1.0, font_size=20):
+        """取出一个浮动文字并初始化；池为空时新建"""
+        if self._free:
+            floating = self._free.pop()
+            floating.reset(text, pos, color, duration, font_size)
+            return floating
+        return FloatingText(text, pos, color, duration, font_size)
+
+    def release(self, floating):
+        """归还已结束的浮动文字"""
+        self._free.append(floating)
+
+    def __len__(self):
+        return len(self._free)
+
+
+# 全局浮动文字池
+floating_text_pool = FloatingTextPool()
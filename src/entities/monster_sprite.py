@@ -1,6 +1,7 @@
 # monster_sprite.py
 import pygame
 import math
+import random
 import sys
 import os
 
@@ -9,6 +10,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import config
 from systems.monsters.monster_factory import Monster
+from systems.combat_log import combat_log, MONSTER_ATTACK
 
 class MonsterSprite(pygame.sprite.Sprite):
     """
@@ -180,8 +182,6 @@ class MonsterSprite(pygame.sprite.Sprite):
 
     def update(self, dt, player_pos, wall_sprites):
         """更新怪物AI和位置"""
-        import random
-        
         # 游荡者复活期间不移动
         if self.logic.is_reviving:
             return
@@ -503,12 +503,8 @@ class MonsterSprite(pygame.sprite.Sprite):
         attack_info['damage'] = self.logic.calculate_damage_with_cache(self.cached_aura_bonus)
         
         # Debug日志
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        import config
         if config.DEBUG_COMBAT_LOG:
-            print(f"[COMBAT] {self.logic.name} 发动攻击！伤害: {attack_info['damage']:.1f}", flush=True)
+            combat_log.emit(MONSTER_ATTACK, self.logic.name, attack_info['damage'])
         
         # 根据怪物类型处理攻击后动作
         if self.logic.type == 'Bucket':
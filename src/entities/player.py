@@ -1,6 +1,7 @@
 # player.py
 import pygame
 import math
+import random
 import sys
 import os
 
@@ -8,8 +9,9 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 import config
+from systems.inventory import config as inv_cfg
 from systems.inventory.player_stats import PlayerLogic
-from entities.bullet import Bullet
+from systems.combat_log import combat_log, PLAYER_HIT
 
 class Player(pygame.sprite.Sprite):
     """
@@ -117,8 +119,11 @@ class Player(pygame.sprite.Sprite):
                     self.rect.top = hits[0].rect.bottom
                 self.pos.y = self.rect.centery
 
-    def shoot(self, mouse_world_pos):
-        """(Spec IV) 射击，生成子弹对象"""
+    def fire(self, mouse_world_pos):
+        """
+        (Spec IV) 射击：检查射速冷却并计算出手位置与方向。
+        返回 (start_pos, dir_vec, max_range, hit_count)；冷却中返回 None。
+        """
         
         # 射速检查
         now = pygame.time.get_ticks()
@@ -139,7 +144,6 @@ class Player(pygame.sprite.Sprite):
         max_range = self.logic.total_stats.get("射程", 500) # 默认射程
         
         # 随机选择左手或右手（50%概率）
-        import random
         use_left_hand = random.random() < 0.5
         
         # 计算左右手的偏移（相对朝向±30度，距离为玩家半径）
@@ -156,7 +160,7 @@ class Player(pygame.sprite.Sprite):
         # TODO: 测试用可命中目标数为2，正式游戏从属性获取：self.logic.total_stats.get("穿透", 1) + 1
         hit_count = 2  # 测试用（可以穿透击中2个目标）
 
-        return Bullet(start_pos, dir_vec, max_range, hit_count)
+        return start_pos, dir_vec, max_range, hit_count
     
     def take_damage(self, damage, damage_source="未知", armor_ignore=0):
         """
@@ -179,11 +183,7 @@ class Player(pygame.sprite.Sprite):
         # 应用护甲穿透：实际护甲 = 基础护甲 × (1 - 穿透比例)
         effective_armor = base_armor * (1 - armor_ignore)
         
-        # 从player_stats.py导入护甲常数
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'systems', 'inventory'))
-        from systems.inventory import config as inv_cfg
+        # 护甲常数（与 player_stats.py 一致）
         armor_const = getattr(inv_cfg, 'ARMOR_CONSTANT', 100)
         
         # 计算伤害减免：DR = Armor / (Armor + K)
@@ -196,16 +196,9 @@ class Player(pygame.sprite.Sprite):
         self.logic.current_health -= actual_damage
         
         # Debug日志输出
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-        import config as game_config
-        if game_config.DEBUG_COMBAT_LOG:
-            if armor_ignore > 0:
-                print(f"[COMBAT] 玩家受到 {actual_damage:.1f} 点伤害（原始伤害：{damage:.1f}，护甲：{base_armor:.0f}→{effective_armor:.0f}（穿透{armor_ignore*100:.0f}%），减伤：{dr*100:.1f}%）- 来源：{damage_source}", flush=True)
-            else:
-                print(f"[COMBAT] 玩家受到 {actual_damage:.1f} 点伤害（原始伤害：{damage:.1f}，护甲减伤：{dr*100:.1f}%）- 来源：{damage_source}", flush=True)
-            print(f"[COMBAT] 玩家当前生命值：{self.logic.current_health:.1f} / {self.logic.total_stats.get('生命', 0):.1f}", flush=True)
+        if config.DEBUG_COMBAT_LOG:
+            combat_log.emit(PLAYER_HIT, actual_damage, damage, base_armor, effective_armor, armor_ignore,
+                            dr, damage_source, self.logic.current_health, self.logic.total_stats.get('生命', 0))
         
         # 检查死亡
         if self.logic.current_health <= 0:
@@ -0,0 +1,24 @@
+# main.py
+# 主游戏入口：python main.py（在 src 目录下）或 python src / python -m src（在项目根目录下）
+# 入口在这里设置导入路径；其余模块顶层的 sys.path.insert 只在首次导入时执行一次（供单独运行），
+# 所有导入都位于模块顶层，运行期间不再修改 sys.path
+import sys
+import os
+
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+from core.game import Game
+
+
+def main():
+    game = Game()
+    try:
+        game.run()
+    finally:
+        game.quit()
+
+
+if __name__ == "__main__":
+    main()
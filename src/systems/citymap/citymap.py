@@ -12,6 +12,7 @@ class CityMap:
         self._height = 0
         self._map_string = map_string  # 保存自定义地图字符串
         self._parse_map()
+        self._spawn_cache = {}  # 地图不可变，出生点列表只计算一次
         
         # 2. 玩家位置 (初始为 None，待 _initialize_player_position 初始化)
         self._player_pos = None
@@ -53,6 +54,10 @@ class CityMap:
         else:
             raise RuntimeError("地图上没有可供玩家站立的可通行地格。")
 
+    def reset_player_position(self):
+        """重新随机玩家起点（复用已解析的地图重新开始游戏时调用）。"""
+        self._initialize_player_position()
+
     # --- 玩家位置管理 ---
 
     def get_player_position(self):
@@ -114,11 +119,36 @@ class CityMap:
 
     # --- 僵尸出生点获取 ---
 
+    def _cached_spawn_points(self, kind, compute):
+        """出生点只计算一次，返回副本以免调用方修改缓存"""
+        points = self._spawn_cache.get(kind)
+        if points is None:
+            points = compute()
+            self._spawn_cache[kind] = points
+        return list(points)
+
     def get_ghoul_spawn_points(self):
         """
         返回所有食尸鬼 (Ghoul) 的出生点列表 (S 地格)。
         (保持原样，逻辑不变)
         """
+        return self._cached_spawn_points('Ghoul', self._compute_ghoul_spawn_points)
+
+    def get_wanderer_spawn_points(self):
+        """
+        返回所有游荡者 (Wanderer) 的合法出生点。
+        合法出生点: 十字相邻的网格存在墙壁的空地网格。
+        """
+        return self._cached_spawn_points('Wanderer', self._compute_wanderer_spawn_points)
+
+    def get_bucket_spawn_points(self):
+        """
+        返回铁桶 (Bucket) 的合法出生点。
+        合法出生点: 九宫格内有至少三格是墙壁的空地网格。
+        """
+        return self._cached_spawn_points('Bucket', self._compute_bucket_spawn_points)
+
+    def _compute_ghoul_spawn_points(self):
         spawn_points = []
         for r in range(self._height):
             for c in range(self._width):
@@ -126,11 +156,7 @@ class CityMap:
                     spawn_points.append((r, c))
         return spawn_points
 
-    def get_wanderer_spawn_points(self):
-        """
-        返回所有游荡者 (Wanderer) 的合法出生点。
-        合法出生点: 十字相邻的网格存在墙壁的空地网格。
-        """
+    def _compute_wanderer_spawn_points(self):
         spawn_points = []
         # 十字相邻方向 (上, 下, 左, 右)
         directions = [(-1, 0), (1, 0), (0, -1), (0, 1)] 
@@ -154,11 +180,7 @@ class CityMap:
                         
         return spawn_points
 
-    def get_bucket_spawn_points(self):
-        """
-        返回铁桶 (Bucket) 的合法出生点。
-        合法出生点: 九宫格内有至少三格是墙壁的空地网格。
-        """
+    def _compute_bucket_spawn_points(self):
         spawn_points = []
         
         for r in range(self._height):
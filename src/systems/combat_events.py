@@ -0,0 +1,119 @@
+# combat_events.py
+# 每帧战斗事件总线：碰撞阶段只记录事件（类型、怪物精灵、数值），
+# 帧末按类型整批分发给订阅者（浮动文字 / 尸爆等特效、遥测统计），
+# Game.update 不再直接调用各个子系统。事件记录为 __slots__ 对象，在总线内部复用。
+
+# 事件类型（分发顺序即此顺序）
+HIT = "hit"          # 造成伤害：amount = 实际伤害
+BLOCK = "block"      # 被格挡：amount = 实际伤害
+EVADE = "evade"      # 被闪避
+REFLECT = "reflect"  # 荆棘反弹：amount = 反弹伤害
+DIED = "died"        # 死亡：flag = 是否会复活
+UNDYING = "undying"  # 不死者进入残躯状态
+
+EVENT_KINDS = (HIT, BLOCK, EVADE, REFLECT, DIED, UNDYING)
+
+
+class CombatEvent:
+    """一条战斗事件（由 CombatEventBus 复用，订阅者不得在回调之外保存引用）"""
+    __slots__ = ("kind", "monster", "amount", "flag")
+
+    def __init__(self):
+        self.kind = None
+        self.monster = None
+        self.amount = 0
+        self.flag = False
+
+
+class CombatEventBus:
+    """
+    按帧收集、按类型批量分发的事件总线。
+    订阅者签名为 handler(events)，events 为本帧该类型的全部事件（按发生顺序）。
+    分发期间新发出的事件留到下一次 dispatch。
+    """
+    def __init__(self):
+        self._handlers = {kind: [] for kind in EVENT_KINDS}
+        self._batches = {kind: [] for kind in EVENT_KINDS}
+        self._free = []
+
+    def subscribe(self, kind, handler):
+        self._handlers[kind].append(handler)
+
+    def emit(self, kind, monster, amount=0, flag=False):
+        event = self._free.pop() if self._free else CombatEvent()
+        event.kind = kind
+        event.monster = monster
+        event.amount = amount
+        event.flag = flag
+        self._batches[kind].append(event)
+
+    def dispatch(self):
+        """把本帧收集的事件按类型整批交给订阅者，然后回收事件对象"""
+        batches = self._batches
+        for kind in EVENT_KINDS:
+            batch = batches[kind]
+            if not batch:
+                continue
+            batches[kind] = []
+            for handler in self._handlers[kind]:
+                handler(batch)
+            self._release(batch)
+
+    def clear(self):
+        """丢弃尚未分发的事件（重新开始游戏时调用）"""
+        for kind in EVENT_KINDS:
+            self._release(self._batches[kind])
+            self._batches[kind] = []
+
+    def pending(self):
+        return sum(len(batch) for batch in self._batches.values())
+
+    def _release(self, batch):
+        for event in batch:
+            event.monster = None  # 不再持有精灵引用
+        self._free.extend(batch)
+
+
+class CombatTelemetry:
+    """战斗统计：订阅全部事件类型，按批累计命中、伤害、格挡、闪避、反弹与击杀"""
+    def __init__(self, bus=None):
+        self.reset()
+        if bus is not None:
+            self.attach(bus)
+
+    def attach(self, bus):
+        bus.subscribe(HIT, self._on_hit)
+        bus.subscribe(BLOCK, self._on_block)
+        bus.subscribe(EVADE, self._on_evade)
+        bus.subscribe(REFLECT, self._on_reflect)
+        bus.subscribe(DIED, self._on_died)
+
+    def reset(self):
+        self.hits = 0
+        self.damage_dealt = 0.0
+        self.blocks = 0
+        self.evades = 0
+        self.reflected_damage = 0.0
+        self.kills = 0
+
+    def _on_hit(self, events):
+        self.hits += len(events)
+        self.damage_dealt += sum(event.amount for event in events)
+
+    def _on_block(self, events):
+        self.blocks += len(events)
+        self.damage_dealt += sum(event.amount for event in events)
+
+    def _on_evade(self, events):
+        self.evades += len(events)
+
+    def _on_reflect(self, events):
+        self.reflected_damage += sum(event.amount for event in events)
+
+    def _on_died(self, events):
+        self.kills += sum(1 for event in events if not event.flag)
+
+    def summary(self):
+        return (f"命中 {self.hits} 次，造成伤害 {self.damage_dealt:.0f}，"
+                f"被格挡 {self.blocks} 次，被闪避 {self.evades} 次，"
+                f"受到反弹 {self.reflected_damage:.0f}，击杀 {self.kills}")
@@ -0,0 +1,159 @@
+# combat_log.py
+# 结构化战斗日志：热路径只把 (时间, 事件类型, 原始数值) 元组追加进队列，
+# 后台线程定期整批取出、格式化为 JSON Lines 并写入文件，帧循环中不做格式化也不刷终端。
+# collections.deque 的 append / popleft 是原子操作，生产者无需加锁。
+#
+# 查看日志：python src/systems/combat_log.py [日志文件]
+
+import atexit
+import json
+import threading
+import time
+import sys
+import os
+from collections import deque
+
+# 添加父目录到路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import config
+
+# 事件类型
+MONSTER_ATTACK = "monster_attack"
+MONSTER_HIT = "monster_hit"
+MONSTER_BLOCK = "monster_block"
+MONSTER_EVADE = "monster_evade"
+PLAYER_HIT = "player_hit"
+REFLECT = "reflect"
+UNDYING = "undying"
+UNDYING_END = "undying_end"
+REVIVE = "revive"
+SUMMON = "summon"
+LIFESTEAL = "lifesteal"
+CORPSE_EXPLOSION = "corpse_explosion"
+
+# {事件类型: 字段名}，emit 的位置参数按此顺序给出
+EVENT_FIELDS = {
+    MONSTER_ATTACK: ("monster", "damage"),
+    MONSTER_HIT: ("monster", "damage", "hp", "max_hp"),
+    MONSTER_BLOCK: ("monster", "damage", "raw_damage", "hp", "max_hp"),
+    MONSTER_EVADE: ("monster", "hp", "max_hp"),
+    PLAYER_HIT: ("damage", "raw_damage", "armor", "effective_armor", "armor_ignore",
+                 "damage_reduction", "source", "hp", "max_hp"),
+    REFLECT: ("monster", "damage"),
+    UNDYING: ("monster", "duration"),
+    UNDYING_END: ("monster",),
+    REVIVE: ("monster", "hp", "max_hp"),
+    SUMMON: ("monster", "summoned"),
+    LIFESTEAL: ("monster", "healed"),
+    CORPSE_EXPLOSION: ("monster",),
+}
+
+# 供查看工具使用的可读格式（与原先的终端输出一致）
+EVENT_FORMATS = {
+    MONSTER_ATTACK: "{monster} 发动攻击！伤害: {damage:.1f}",
+    MONSTER_HIT: "{monster} 受到 {damage:.1f} 伤害 - HP: {hp:.1f}/{max_hp}",
+    MONSTER_BLOCK: "{monster} 格挡！受到 {damage:.1f} 伤害（原始：{raw_damage:.1f}，减免90%）- HP: {hp:.1f}/{max_hp}",
+    MONSTER_EVADE: "{monster} 闪避！完全躲开攻击 - HP: {hp:.1f}/{max_hp}",
+    PLAYER_HIT: "玩家受到 {damage:.1f} 点伤害（原始伤害：{raw_damage:.1f}，护甲：{armor:.0f}→{effective_armor:.0f}，"
+                "减伤：{damage_reduction:.1%}）- 来源：{source}，生命值：{hp:.1f} / {max_hp:.1f}",
+    REFLECT: "{monster} 荆棘守卫反弹 {damage:.1f} 伤害！",
+    UNDYING: "{monster} 触发不死者！进入残躯状态 {duration}秒",
+    UNDYING_END: "{monster} 残躯时间结束，真正死亡",
+    REVIVE: "{monster} 复活了！HP: {hp:.1f}/{max_hp}",
+    SUMMON: "{monster} 召唤了 {summoned}！",
+    LIFESTEAL: "{monster} 吸血回复 {healed:.1f} HP！",
+    CORPSE_EXPLOSION: "{monster} 的尸体爆炸了！",
+}
+
+
+class CombatLog:
+    """
+    战斗事件队列 + 后台写入线程。
+    调用方负责用 config.DEBUG_COMBAT_LOG 判断是否记录（关闭时只有这一次分支开销）。
+    """
+    def __init__(self, path=None, flush_interval=None):
+        self.path = path or config.COMBAT_LOG_PATH
+        self.flush_interval = flush_interval or config.COMBAT_LOG_FLUSH_INTERVAL
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._thread = None
+        self._file = None
+        self._opened = False  # 同一进程内重新启动时追加而不是覆盖
+        self._start_time = time.perf_counter()
+        self.written = 0
+
+    def emit(self, kind, *values):
+        """记录一条事件（values 按 EVENT_FIELDS[kind] 的顺序给出），不做任何格式化"""
+        self._queue.append((time.perf_counter(), kind, values))
+        if self._thread is None:
+            self.start()
+
+    def start(self):
+        """打开日志文件并启动写入线程（emit 首次调用时自动启动）"""
+        if self._thread is not None:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a" if self._opened else "w", encoding="utf-8")
+        self._opened = True
+        self._wake.clear()
+        self._thread = threading.Thread(target=self._run, name="combat-log-writer", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """停止写入线程，写出剩余事件并关闭文件"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._thread = None
+        self._wake.set()
+        thread.join()
+        self._drain()
+        self._file.close()
+        self._file = None
+
+    def _run(self):
+        # close() 置空 _thread 并唤醒后退出，剩余事件由 close() 写出
+        while self._thread is not None:
+            self._wake.wait(self.flush_interval)
+            self._drain()
+
+    def _drain(self):
+        """取出当前队列中的全部事件，整批格式化并写入"""
+        queue = self._queue
+        lines = []
+        try:
+            while True:
+                t, kind, values = queue.popleft()
+                record = {"t": round(t - self._start_time, 4), "event": kind}
+                record.update(zip(EVENT_FIELDS[kind], values))
+                lines.append(json.dumps(record, ensure_ascii=False, default=str))
+        except IndexError:
+            pass
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            self.written += len(lines)
+
+
+def format_event(record):
+    """把一条 JSON 记录格式化为可读文本"""
+    template = EVENT_FORMATS.get(record.get("event"))
+    if template is None:
+        return json.dumps(record, ensure_ascii=False)
+    return f"[{record['t']:9.3f}] " + template.format(**record)
+
+
+# 全局战斗日志；进程退出时写出剩余事件
+combat_log = CombatLog()
+atexit.register(combat_log.close)
+
+
+if __name__ == "__main__":
+    log_path = sys.argv[1] if len(sys.argv) > 1 else config.COMBAT_LOG_PATH
+    with open(log_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                print(format_event(json.loads(line)))
@@ -0,0 +1,95 @@
+# fonts.py
+# 进程级字体管理：按 (字体路径, 字号) 缓存 pygame.font.Font，避免每帧 / 每个对象重复加载字体。
+# 同时缓存固定提示文字（BLOCK、MISS、CRIT! 等）的预渲染 Surface，供浮动文字共享。
+
+import io
+import pygame
+
+# {(path, size): Font}，path 为 None 表示 pygame 默认字体
+_fonts = {}
+# {path: 字体文件内容}，同一字体文件的多个字号只读盘一次
+_font_data = {}
+# {(names, size, bold): Font}
+_sys_fonts = {}
+# {(text, color, size): Surface}
+_text_surfaces = {}
+# {(Surface, alpha 档位): Surface}
+_faded_surfaces = {}
+
+# 淡出透明度的量化步长：相同档位共享一份带透明度的副本
+ALPHA_STEP = 16
+
+
+def get_font(size, path=None):
+    """返回 (path, size) 对应的共享字体对象（首次调用时创建）"""
+    key = (path, size)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if path is None:
+            font = pygame.font.Font(None, size)
+        else:
+            data = _font_data.get(path)
+            if data is None:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                _font_data[path] = data
+            font = pygame.font.Font(io.BytesIO(data), size)
+        _fonts[key] = font
+    return font
+
+
+def get_sys_font(names, size, bold=False):
+    """
+    返回系统字体（names 为逗号分隔的候选字体名）。
+    系统字体不可用时回退到同字号的默认字体。
+    """
+    key = (names, size, bold)
+    font = _sys_fonts.get(key)
+    if font is None:
+        try:
+            font = pygame.font.SysFont(names, size, bold=bold)
+        except Exception:
+            font = get_font(size)
+        _sys_fonts[key] = font
+    return font
+
+
+def render_static(text, color, size, path=None):
+    """
+    返回固定文字的预渲染 Surface（相同文字 / 颜色 / 字号共享同一实例）。
+    调用方不得修改返回的 Surface；需要透明度时使用 get_faded。
+    """
+    key = (text, tuple(color), size, path)
+    surface = _text_surfaces.get(key)
+    if surface is None:
+        surface = get_font(size, path).render(text, True, color)
+        _text_surfaces[key] = surface
+    return surface
+
+
+def get_faded(surface, alpha):
+    """
+    返回 surface 按 alpha 淡化后的只读副本（alpha 量化到 ALPHA_STEP 档位并缓存）。
+    共享 Surface 可以在同一批 blits 中以不同透明度出现，而无需修改原 Surface。
+    """
+    if alpha >= 255:
+        return surface
+    level = max(0, int(alpha)) // ALPHA_STEP * ALPHA_STEP
+    key = (surface, level)
+    faded = _faded_surfaces.get(key)
+    if faded is None:
+        faded = surface.copy()
+        faded.set_alpha(level)
+        _faded_surfaces[key] = faded
+    return faded
+
+
+def clear_cache():
+    """清空字体与文字缓存（例如 pygame.quit 之后重新初始化时）"""
+    _fonts.clear()
+    _font_data.clear()
+    _sys_fonts.clear()
+    _text_surfaces.clear()
+    _faded_surfaces.clear()
@@ -0,0 +1,158 @@
+# bitboard.py
+# 网格占用的位板表示：每行一个整数位掩码（第 c 位表示第 c 列）。
+# 物品形状预编译为逐行掩码，放置检查只需少量移位与按位与运算。
+
+from functools import lru_cache
+
+
+class CompiledShape:
+    """预编译的形状：相对 (min_r, min_c) 的逐行掩码及每行占用的列偏移。"""
+    def __init__(self, cells):
+        self.cells = cells
+        self.min_r = min(r for r, c in cells)
+        self.min_c = min(c for r, c in cells)
+        self.height = max(r for r, c in cells) - self.min_r + 1
+        self.width = max(c for r, c in cells) - self.min_c + 1
+
+        masks = [0] * self.height
+        for r, c in cells:
+            masks[r - self.min_r] |= 1 << (c - self.min_c)
+        self.row_masks = tuple(masks)
+
+        # 每行被占用的列偏移，用于按行批量计算冲突位置
+        self.row_bits = tuple(
+            tuple(b for b in range(self.width) if mask >> b & 1) for mask in self.row_masks
+        )
+        self.area = len(cells)
+
+
+@lru_cache(maxsize=4096)
+def _compile_frozen(cells):
+    return CompiledShape(cells)
+
+def compile_shape(cells):
+    """返回形状的 CompiledShape（相同形状共享同一实例）。"""
+    return _compile_frozen(frozenset(cells))
+
+def rotate_cells(cells):
+    """顺时针旋转 90 度并归一化到 (0, 0)，与 ModItem.rotate 一致。"""
+    rotated = [(c, -r) for r, c in cells]
+    min_r = min(r for r, c in rotated)
+    min_c = min(c for r, c in rotated)
+    return frozenset((r - min_r, c - min_c) for r, c in rotated)
+
+@lru_cache(maxsize=4096)
+def _compile_rotations_frozen(cells):
+    rotations = []
+    seen = set()
+    current = cells
+    for turns in range(4):
+        if current not in seen:
+            seen.add(current)
+            rotations.append((turns, _compile_frozen(current)))
+        current = rotate_cells(current)
+    return tuple(rotations)
+
+def compile_rotations(cells):
+    """
+    返回形状所有不同朝向的 ((顺时针旋转次数, CompiledShape), ...)。
+    旋转次数可直接用于重复调用 ModItem.rotate。
+    """
+    return _compile_rotations_frozen(frozenset(cells))
+
+
+class Bitboard:
+    """rows x cols 的占用位板。"""
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.row_masks = [0] * rows
+
+    def clear(self):
+        self.row_masks = [0] * self.rows
+
+    def copy(self):
+        board = Bitboard(self.rows, self.cols)
+        board.row_masks = list(self.row_masks)
+        return board
+
+    def in_bounds(self, shape, row, col):
+        """检查形状放在 (row, col) 时是否完全位于网格内。"""
+        top = row + shape.min_r
+        left = col + shape.min_c
+        return (top >= 0 and left >= 0 and
+                top + shape.height <= self.rows and left + shape.width <= self.cols)
+
+    def fits(self, shape, row, col):
+        """检查形状能否放在 (row, col)（越界或重叠返回 False）。"""
+        if not self.in_bounds(shape, row, col):
+            return False
+        top = row + shape.min_r
+        left = col + shape.min_c
+        masks = self.row_masks
+        for i, mask in enumerate(shape.row_masks):
+            if masks[top + i] & (mask << left):
+                return False
+        return True
+
+    def place(self, shape, row, col):
+        """占用形状所在格子（调用方需先确认 fits）。"""
+        top = row + shape.min_r
+        left = col + shape.min_c
+        for i, mask in enumerate(shape.row_masks):
+            self.row_masks[top + i] |= mask << left
+
+    def remove(self, shape, row, col):
+        """释放形状所在格子。"""
+        top = row + shape.min_r
+        left = col + shape.min_c
+        for i, mask in enumerate(shape.row_masks):
+            if 0 <= top + i < self.rows:
+                self.row_masks[top + i] &= ~(mask << left)
+
+    def fit_columns(self, shape, top):
+        """
+        返回形状顶边位于第 top 行时所有可放置的左边界列组成的位掩码（第 c 位 = 列 c）。
+        对每个被占用的 (行偏移 i, 列偏移 b)，occ[top+i] >> b 给出冲突的左边界集合。
+        """
+        span = self.cols - shape.width + 1
+        if span <= 0 or top < 0 or top + shape.height > self.rows:
+            return 0
+        blocked = 0
+        masks = self.row_masks
+        for i, bits in enumerate(shape.row_bits):
+            occ = masks[top + i]
+            if not occ:
+                continue
+            for b in bits:
+                blocked |= occ >> b
+        return ~blocked & ((1 << span) - 1)
+
+    def iter_fits(self, shape, start_row=0):
+        """
+        按行优先顺序逐个给出所有可放置位置 (row, col)。
+        start_row 之前的行视为已满，可跳过。
+        """
+        for row in range(start_row, self.rows):
+            top = row + shape.min_r
+            if top < 0:
+                continue
+            if top + shape.height > self.rows:
+                break
+            # 将“左边界列”位掩码转换为“物品原点列”位掩码（原点列 = 左边界 - min_c，需 >= 0）
+            valid = self.fit_columns(shape, top)
+            if shape.min_c > 0:
+                valid >>= shape.min_c
+            elif shape.min_c < 0:
+                valid = (valid << -shape.min_c) & ((1 << self.cols) - 1)
+            while valid:
+                low = valid & -valid
+                yield (row, low.bit_length() - 1)
+                valid ^= low
+
+    def find_first_fit(self, shape, start_row=0):
+        """
+        按行优先顺序返回第一个可放置位置 (row, col)，与逐格扫描结果一致；没有则返回 None。
+        start_row 之前的行视为已满，可跳过。
+        """
+        return next(self.iter_fits(shape, start_row), None)
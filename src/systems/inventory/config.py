@@ -27,6 +27,12 @@ FONT_SIZE_AFFIX_MAIN = 17 # 主词条
 FONT_SIZE_AFFIX_OTHER = 15 # 其他词条
 FONT_SIZE_BUTTON = 16
 
+# 预栅格化字形图集的磁盘缓存目录（见 glyph_atlas.py）
+GLYPH_CACHE_DIR = os.path.join(_project_root, "cache", "glyphs")
+
+# 文本渲染缓存容量（LRU，按 字体/文本/颜色/样式 缓存已渲染的 Surface）
+TEXT_CACHE_SIZE = 512
+
 # --- 颜色定义 ---
 COLOR_BACKGROUND = (20, 20, 30)
 COLOR_GRID = (50, 50, 70)
@@ -0,0 +1,343 @@
+# glyph_atlas.py
+# 背包界面字形图集：界面文字、词缀名称、数字等固定字符集按字号预先栅格化为一张
+# 白色字形表（常规 + 粗体），并缓存到磁盘。运行时按字拼接，只有字符集之外的字符
+# 才打开 TTF 用 FreeType 渲染。
+#
+# 预构建：python src/systems/inventory/glyph_atlas.py
+
+import ast
+import json
+import string
+from functools import lru_cache
+import pygame
+import sys
+import os
+
+# 添加路径以便导入
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+try:
+    from systems.inventory import config as cfg
+except ImportError as e:
+    print(f"错误：glyph_atlas.py 导入失败: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit()
+
+# 用于收集界面字符串的模块（只取字符串字面量，不含注释与文档字符串）
+_CHARSET_SOURCES = ("config.py", "player_stats.py", "ui_elements.py",
+                    "inventory_gui.py", "main.py", "item_generator.py")
+
+# {字体键: 字号}，与 main.py 中的字体表一致
+UI_FONT_SIZES = {
+    "main": cfg.FONT_SIZE_MAIN,
+    "small": cfg.FONT_SIZE_SMALL,
+    "affix_main": cfg.FONT_SIZE_AFFIX_MAIN,
+    "affix_other": cfg.FONT_SIZE_AFFIX_OTHER,
+    "button": cfg.FONT_SIZE_BUTTON,
+}
+
+FALLBACK_SYS_FONT = "SimHei"
+_CACHE_VERSION = 2  # 字形表布局变化时递增，使旧缓存失效
+_SHEET_WIDTH = 1024
+_WHITE = (255, 255, 255)
+
+
+def _string_literals(path):
+    """源文件中的全部字符串字面量（含 f-string 的常量部分，跳过文档字符串）"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    docstrings = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            body = node.body
+            if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+                docstrings.add(id(body[0].value))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and id(node) not in docstrings:
+            yield node.value
+
+
+@lru_cache(maxsize=1)
+def collect_ui_charset():
+    """界面固定字符集：ASCII 可打印字符 + 背包模块字符串字面量中出现的全部字符"""
+    chars = set(string.printable) - set("\t\n\r\x0b\x0c")
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    for name in _CHARSET_SOURCES:
+        path = os.path.join(base_dir, name)
+        if os.path.exists(path):
+            for text in _string_literals(path):
+                chars.update(ch for ch in text if ch.isprintable())
+    return "".join(sorted(chars))
+
+
+class GlyphFont:
+    """
+    基于字形图集的字体，提供 pygame.font.Font 在界面中用到的接口
+    （render / size / set_bold / set_italic / get_height / get_linesize），可直接放入字体表。
+    图集外的字符、斜体或关闭抗锯齿时回退到 TTF（首次需要时才打开字体文件）。
+    """
+    def __init__(self, font_path, size, sheet, glyphs, metrics):
+        self.font_path = font_path
+        self.size_px = size
+        self.sheet = sheet
+        self.glyphs = glyphs      # {粗体: {字符: (字形表中的 Rect, 步进宽度)}}
+        self.metrics = metrics    # {"height", "glyph_height", "linesize", "ascent", "descent"}
+        self._extra = {False: {}, True: {}}  # 运行时补充的字形 {粗体: {字符: (Surface, 步进宽度)}}
+        self._font = None
+        self.bold = False
+        self.italic = False
+
+    # --- pygame.font.Font 兼容接口 ---
+
+    def set_bold(self, value):
+        self.bold = bool(value)
+
+    def set_italic(self, value):
+        self.italic = bool(value)
+
+    def get_height(self):
+        return self.metrics["height"]
+
+    def get_linesize(self):
+        return self.metrics["linesize"]
+
+    def get_ascent(self):
+        return self.metrics["ascent"]
+
+    def get_descent(self):
+        return self.metrics["descent"]
+
+    def size(self, text):
+        if self.italic:
+            return self._styled_font().size(text)
+        width = 0
+        overhang = 0
+        height = self.metrics["height"]
+        for ch in text:
+            image, area, advance = self._glyph(ch)
+            if area is None:
+                area = image.get_rect()
+            width += advance
+            overhang = area.width - advance
+            # 与 Font.render 一致：带下伸部的字形（g j p ( ) 等）高于字体高度时按实际高度
+            if area.height > height:
+                height = area.height
+        return width + max(0, overhang), height
+
+    def render(self, text, antialias, color, background=None):
+        if self.italic or not antialias or background is not None:
+            return self._styled_font().render(text, antialias, color, background)
+
+        surface = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        seq = []
+        x = 0
+        for ch in text:
+            image, area, advance = self._glyph(ch)
+            seq.append((image, (x, 0), area))
+            x += advance
+        surface.blits(seq, doreturn=False)
+        # 白色字形乘以目标颜色，alpha 保持抗锯齿覆盖率
+        surface.fill(tuple(color)[:3] + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+        return surface
+
+    # --- 内部 ---
+
+    def _glyph(self, ch):
+        """返回 (源 Surface, 源区域或 None, 步进宽度)"""
+        entry = self.glyphs[self.bold].get(ch)
+        if entry is not None:
+            return self.sheet, entry[0], entry[1]
+        entry = self._extra[self.bold].get(ch)
+        if entry is None:
+            entry = self._render_missing(ch)
+        return entry[0], None, entry[1]
+
+    def _styled_font(self):
+        font = self._ttf()
+        font.set_bold(self.bold)
+        font.set_italic(self.italic)
+        return font
+
+    def _render_missing(self, ch):
+        """图集外的字符：用 TTF 渲染并记入运行时字形表"""
+        font = self._ttf()
+        font.set_bold(self.bold)
+        font.set_italic(False)
+        entry = (font.render(ch, True, _WHITE), _advance(font, ch))
+        self._extra[self.bold][ch] = entry
+        return entry
+
+    def _ttf(self):
+        if self._font is None:
+            self._font = _open_font(self.font_path, self.size_px)
+        return self._font
+
+
+def _open_font(font_path, size):
+    if font_path:
+        return pygame.font.Font(font_path, size)
+    return pygame.font.SysFont(FALLBACK_SYS_FONT, size)
+
+
+def _advance(font, ch):
+    """字符的步进宽度。粗体只在整串末尾多出描边宽度，逐字拼接时按常规字宽步进"""
+    if font.get_bold():
+        font.set_bold(False)
+        width = font.size(ch)[0]
+        font.set_bold(True)
+        return width
+    return font.size(ch)[0]
+
+
+def _cache_paths(cache_dir, font_path, size):
+    name = os.path.splitext(os.path.basename(font_path))[0] if font_path else FALLBACK_SYS_FONT
+    base = os.path.join(cache_dir, f"{name}_{size}")
+    return base + ".png", base + ".json"
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _source_stamp(font_path, size):
+    """
+    缓存有效性标记：字体文件及其修改时间、字号，以及字符集来源模块的修改时间
+    （只比较修改时间，读取缓存时不必重新收集字符集）。
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    return {
+        "version": _CACHE_VERSION,
+        "font": os.path.basename(font_path) if font_path else FALLBACK_SYS_FONT,
+        "mtime": _mtime(font_path) if font_path else None,
+        "size": size,
+        "sources": {name: _mtime(os.path.join(base_dir, name)) for name in _CHARSET_SOURCES},
+    }
+
+
+def bake_glyph_font(font_path, size, charset):
+    """用 TTF 把 charset 栅格化为字形表（常规与粗体各一份），返回 GlyphFont"""
+    font = _open_font(font_path, size)
+    metrics = {
+        "height": font.get_height(),
+        "glyph_height": font.get_height(),  # 最高字形的渲染高度（含下伸部），栅格化后更新
+        "linesize": font.get_linesize(),
+        "ascent": font.get_ascent(),
+        "descent": font.get_descent(),
+    }
+    rendered = []
+    for bold in (False, True):
+        font.set_bold(bold)
+        for ch in charset:
+            rendered.append((bold, ch, font.render(ch, True, _WHITE), _advance(font, ch)))
+    font.set_bold(False)
+    h = max([metrics["height"]] + [glyph.get_height() for _, _, glyph, _ in rendered])
+    metrics["glyph_height"] = h
+
+    # 逐行排布，行高取最高字形的高度，下伸部不会压到下一行
+    placements = []
+    x = y = 0
+    for bold, ch, glyph, advance in rendered:
+        w = glyph.get_width()
+        if x + w > _SHEET_WIDTH:
+            x = 0
+            y += h
+        placements.append((bold, ch, glyph, advance, pygame.Rect(x, y, w, glyph.get_height())))
+        x += w
+    sheet = pygame.Surface((_SHEET_WIDTH, max(1, y + h)), pygame.SRCALPHA)
+    glyphs = {False: {}, True: {}}
+    for bold, ch, glyph, advance, rect in placements:
+        sheet.blit(glyph, rect.topleft)
+        glyphs[bold][ch] = (rect, advance)
+
+    glyph_font = GlyphFont(font_path, size, sheet, glyphs, metrics)
+    glyph_font._font = font
+    return glyph_font
+
+
+def save_glyph_font(glyph_font, png_path, json_path, stamp):
+    os.makedirs(os.path.dirname(png_path), exist_ok=True)
+    pygame.image.save(glyph_font.sheet, png_path)
+    index = {
+        "source": stamp,
+        "metrics": glyph_font.metrics,
+        "glyphs": {
+            "regular" if not bold else "bold": {ch: list(rect) + [advance] for ch, (rect, advance) in table.items()}
+            for bold, table in glyph_font.glyphs.items()
+        },
+    }
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False)
+
+
+def load_glyph_font(font_path, size, png_path, json_path, stamp):
+    """读取磁盘缓存；缓存缺失或与 stamp 不一致时返回 None"""
+    try:
+        with open(json_path, encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("source") != stamp:
+            return None
+        sheet = pygame.image.load(png_path)
+    except (OSError, ValueError, pygame.error):
+        return None
+    if pygame.display.get_surface() is not None:
+        sheet = sheet.convert_alpha()
+    glyphs = {
+        bold: {ch: (pygame.Rect(entry[:4]), entry[4])
+               for ch, entry in index["glyphs"]["bold" if bold else "regular"].items()}
+        for bold in (False, True)
+    }
+    return GlyphFont(font_path, size, sheet, glyphs, index["metrics"])
+
+
+def get_glyph_font(font_path, size, cache_dir=None):
+    """字号 size 的 GlyphFont：优先读取磁盘缓存，否则收集字符集、栅格化并写入缓存"""
+    cache_dir = cache_dir or cfg.GLYPH_CACHE_DIR
+    png_path, json_path = _cache_paths(cache_dir, font_path, size)
+    stamp = _source_stamp(font_path, size)
+
+    glyph_font = load_glyph_font(font_path, size, png_path, json_path, stamp)
+    if glyph_font is None:
+        glyph_font = bake_glyph_font(font_path, size, collect_ui_charset())
+        try:
+            save_glyph_font(glyph_font, png_path, json_path, stamp)
+        except (OSError, pygame.error) as e:
+            print(f"警告：字形图集缓存写入失败: {e}")
+    return glyph_font
+
+
+def load_ui_fonts(font_path=None, cache_dir=None):
+    """
+    背包界面字体表 {字体键: GlyphFont}。font_path 默认为 cfg.FONT_PATH，
+    字体文件不存在时使用系统字体 SimHei（找不到时为 pygame 默认字体）。
+    """
+    font_path = font_path or cfg.FONT_PATH
+    if not os.path.exists(font_path):
+        print(f"警告：字体文件 {font_path} 不存在，尝试使用系统默认字体。")
+        font_path = None
+    fonts = {}
+    by_size = {}
+    for key, size in UI_FONT_SIZES.items():
+        if size not in by_size:
+            by_size[size] = get_glyph_font(font_path, size, cache_dir)
+        fonts[key] = by_size[size]
+    return fonts
+
+
+if __name__ == "__main__":
+    # 构建步骤：重新栅格化全部字号并写入缓存
+    import time
+    pygame.init()
+    font_path = cfg.FONT_PATH if os.path.exists(cfg.FONT_PATH) else None
+    charset = collect_ui_charset()
+    print(f"字符集: {len(charset)} 个字符")
+    for size in sorted(set(UI_FONT_SIZES.values())):
+        start = time.perf_counter()
+        glyph_font = bake_glyph_font(font_path, size, charset)
+        png_path, json_path = _cache_paths(cfg.GLYPH_CACHE_DIR, font_path, size)
+        save_glyph_font(glyph_font, png_path, json_path, _source_stamp(font_path, size))
+        w, h = glyph_font.sheet.get_size()
+        print(f"字号 {size}: {w}x{h} -> {png_path} ({(time.perf_counter() - start) * 1000:.1f} ms)")
@@ -11,6 +11,8 @@ try:
     from systems.inventory import config as cfg
     from systems.inventory.ui_elements import GridPanel, Button, render_text, draw_tooltip, draw_context_menu
     from systems.inventory.player_stats import StatsPanelRenderer
+    from systems.inventory.packing import tidy_panel
+    from systems.inventory.loadout import equip_best_loadout
 except ImportError as e:
     print(f"错误：inventory_gui.py 导入失败: {e}")
     import traceback
@@ -37,6 +39,8 @@ class InventoryScreen:
         
         self.back_button = Button((0,0,1,1), "返回", self.fonts["button"], "back",
                                   cfg.COLOR_BUTTON_BACK, cfg.COLOR_BUTTON_BACK_HOVER)
+        self.tidy_button = Button((0,0,1,1), "整理背包", self.fonts["button"], "tidy")
+        self.loadout_button = Button((0,0,1,1), "最优配装", self.fonts["button"], "loadout")
         
         self._calculate_layout(self.screen_width, self.screen_height)
 
@@ -116,6 +120,14 @@ class InventoryScreen:
         # --- 设置 返回按钮 ---
         btn_rect = (width - 100 - cfg.PANEL_GAP, height - 40 - cfg.PANEL_GAP, 100, 40)
         self.back_button.update_rect(btn_rect)
+        
+        # --- 设置 整理背包按钮（背包面板右下角下方） ---
+        tidy_rect = (inv_x + inv_w - 120, inv_y + inv_h + 5, 120, 36)
+        self.tidy_button.update_rect(tidy_rect)
+        
+        # --- 设置 最优配装按钮（整理背包按钮左侧） ---
+        loadout_rect = (inv_x + inv_w - 250, inv_y + inv_h + 5, 120, 36)
+        self.loadout_button.update_rect(loadout_rect)
 
     def run(self):
         """主循环"""
@@ -142,6 +154,12 @@ class InventoryScreen:
             if self.back_button.handle_event(event, (mouse_x, mouse_y)) == "back":
                 self.running = False
 
+            if self.tidy_button.handle_event(event, (mouse_x, mouse_y)) == "tidy":
+                self.handle_tidy()
+
+            if self.loadout_button.handle_event(event, (mouse_x, mouse_y)) == "loadout":
+                self.handle_loadout()
+
             # --- 键盘事件处理：拖动中按空格旋转 ---
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
@@ -175,9 +193,9 @@ class InventoryScreen:
                         self.drag_original_shape = item.shape
                         
                         panel.remove_item(item)
-                        # 属性实时更新
+                        # 属性实时更新（增量卸下）
                         if panel == self.mod_panel:
-                            self.player_logic.calculate_stats(self.mod_panel.items.keys())
+                            self.player_logic.unequip_item(item)
                 
                 # 右键
                 if event.button == 3:
@@ -231,6 +249,20 @@ class InventoryScreen:
             
         return None, None, None
 
+    def get_drag_preview_stats(self, mouse_pos):
+        """拖动中的物品若可放入强化面板当前位置，返回装备后的属性预览，否则返回 None"""
+        if not self.dragging_item:
+            return None
+        item, offset_x, offset_y = self.dragging_item
+        grid_pos = self.mod_panel.screen_to_grid(*mouse_pos)
+        if not grid_pos:
+            return None
+        drop_r = grid_pos[0] - (offset_y // self.mod_panel.cell_size)
+        drop_c = grid_pos[1] - (offset_x // self.mod_panel.cell_size)
+        if not self.mod_panel.is_valid_placement(item, drop_r, drop_c):
+            return None
+        return self.player_logic.preview_equip(item)
+
     def handle_drop(self, mouse_x, mouse_y):
         item, offset = self.dragging_item[0], self.dragging_item[1:]
         placed = False
@@ -242,7 +274,7 @@ class InventoryScreen:
             drop_c = grid_pos[1] - (offset[0] // self.mod_panel.cell_size)
             if self.mod_panel.add_item(item, drop_r, drop_c):
                 placed = True
-                self.player_logic.calculate_stats(self.mod_panel.items.keys())
+                self.player_logic.equip_item(item)
         
         # 2. 尝试放入背包
         if not placed:
@@ -265,13 +297,12 @@ class InventoryScreen:
             # 2. 使用原生方法 add_item 将其放回原位，确保更新 GridPanel 的查找表
             if panel.add_item(item, r, c): 
                 placed = True
+                if panel == self.mod_panel:
+                    self.player_logic.equip_item(item)
             else:
                 # 理论上，如果物品形状正确，回滚到原位不应失败。
                 # 如果这个警告出现，请检查 GridPanel 类的 remove_item 是否彻底清理了占用网格。
                 print(f"严重警告: 物品 {item} 形状恢复后，回滚到原位 ({r}, {c}) 失败。")
-
-            if panel == self.mod_panel:
-                self.player_logic.calculate_stats(self.mod_panel.items.keys())
                 
     # --- 拖动时旋转的方法 ---
     def handle_drag_rotate(self, item, mouse_x, mouse_y):
@@ -308,10 +339,7 @@ class InventoryScreen:
         else:
             # 旋转失败（超出边界），恢复旋转前的形状
             item.shape = original_shape 
-            
-        # 属性刷新
-        if panel == self.mod_panel:
-            self.player_logic.calculate_stats(self.mod_panel.items.keys())
+        # 旋转不改变词条，无需刷新属性
     # --- 结束拖动旋转方法 ---
 
     def handle_rotate(self, item):
@@ -327,6 +355,8 @@ class InventoryScreen:
             self.drag_origin_panel.add_item(item, self.drag_origin_pos[0], self.drag_origin_pos[1])
             panel = self.drag_origin_panel
             pos = self.drag_origin_pos
+            if panel == self.mod_panel:
+                self.player_logic.equip_item(item)
         
         original_shape = item.shape
         panel.remove_item(item)
@@ -337,9 +367,25 @@ class InventoryScreen:
         else:
             item.shape = original_shape
             panel.add_item(item, pos[0], pos[1])
-            
-        if panel == self.mod_panel:
-            self.player_logic.calculate_stats(self.mod_panel.items.keys())
+        # 旋转不改变词条，无需刷新属性
+
+    def handle_tidy(self):
+        """整理背包：重新排列背包面板中的所有物品（可旋转）"""
+        if self.dragging_item:
+            return
+        if not tidy_panel(self.inv_panel):
+            print("背包整理失败：无法放下所有物品，保持原布局。")
+        self.hovered_item = None
+        self.context_menu["active"] = False
+
+    def handle_loadout(self):
+        """一键装备最优配装（默认目标：DPS）"""
+        if self.dragging_item:
+            return
+        if not equip_best_loadout(self.player_logic, self.mod_panel, self.inv_panel):
+            print("最优配装失败：背包空间不足以放回卸下的模组，保持原布局。")
+        self.hovered_item = None
+        self.context_menu["active"] = False
 
     def open_context_menu(self, item, panel, pos):
         """
@@ -401,6 +447,11 @@ class InventoryScreen:
             # 只有启用且点击时才触发
             if enabled and option_rect.collidepoint(mouse_x, mouse_y):
                 
+                # 已装备的模组先增量卸下，操作后仍在面板中则按新词条重新装备
+                equipped = panel == self.mod_panel
+                if equipped:
+                    self.player_logic.unequip_item(item)
+                
                 if action == "destroy":
                     # 获得源质
                     gain = cfg.ESSENCE_GAIN.get(item.quality, 0)
@@ -420,8 +471,8 @@ class InventoryScreen:
                         item.reroll_affixes(level=2, locked_indices=[0])
                 
                 # 刷新属性
-                if panel == self.mod_panel:
-                    self.player_logic.calculate_stats(self.mod_panel.items.keys())
+                if equipped and item in panel.items:
+                    self.player_logic.equip_item(item)
                 
                 # 只要点击了有效选项，就关闭菜单
                 break
@@ -448,10 +499,13 @@ class InventoryScreen:
         self.mod_panel.draw(self.screen)
         self.inv_panel.draw(self.screen)
         
-        # 1.3 绘制属性面板 (调用 renderer)
-        self.stats_renderer.draw(self.screen, self.stats_panel_rect, self.player_logic)
+        # 1.3 绘制属性面板 (调用 renderer)，拖动到强化面板的有效位置时显示装备预览
+        self.stats_renderer.draw(self.screen, self.stats_panel_rect, self.player_logic,
+                                 self.get_drag_preview_stats(mouse_pos))
         
         self.back_button.draw(self.screen, mouse_pos)
+        self.tidy_button.draw(self.screen, mouse_pos)
+        self.loadout_button.draw(self.screen, mouse_pos)
         
         if self.dragging_item:
             item, offset_x, offset_y = self.dragging_item
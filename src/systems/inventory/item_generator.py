@@ -5,13 +5,20 @@ import pygame
 import sys
 import math
 import os
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
 
 # 添加路径以便导入
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 try:
     from systems.inventory import config as cfg
-    from systems.inventory.utils import generate_and_optimize_polyomino, get_bounding_box_dims
+    from systems.inventory.utils import generate_and_optimize_polyomino
+    from systems.inventory.shape_library import get_random_shape, get_shape_library
+    from systems.inventory.bitboard import compile_shape, compile_rotations, rotate_cells
     
     if not hasattr(cfg, 'ceil_to_nearest_ten'):
          def ceil_to_nearest_ten(n):
@@ -23,7 +30,8 @@ except ImportError as e:
     
     # 模拟导入的函数和常量，以便代码结构能通过
     def generate_and_optimize_polyomino(N): return {(0, 0)}
-    def get_bounding_box_dims(cells_set): return 1, 1
+    def get_random_shape(N, rng=random): return None
+    def get_shape_library(): return {}
     def ceil_to_nearest_ten(n): return math.ceil(n / 10.0) * 10
     
     class cfg: 
@@ -46,28 +54,400 @@ except ImportError as e:
         ceil_to_nearest_ten = ceil_to_nearest_ten
 
 
+# --- 预编译词缀池 ---
+# 每个 (品质, 掉落倾向) 的稀有池 / 主词条候选池 / 合并池在导入时编译为 Fenwick 树模板，
+# 生成物品时只需复制模板做不放回加权抽样，开销与配置规模无关。
+
+_RARE_NAMES = frozenset(cfg.RARE_AFFIX_NAMES)
+_SURVIVAL_NAMES = frozenset(cfg.SURVIVAL_AFFIXES)
+_OFFENSE_NAMES = frozenset(cfg.OFFENSE_AFFIXES)
+
+# 池内任一词条为稀有词条即视为稀有池
+_RARE_POOL_FLAGS = {
+    pool_name: any(name in _RARE_NAMES for name in pool_affixes)
+    for pool_name, pool_affixes in cfg.AFFIX_POOLS.items()
+}
+
+
+class _AffixSampler:
+    """
+    Fenwick 树上的加权不放回抽样：建树 O(n)，抽样与移除均为 O(log n)。
+    """
+    __slots__ = ("names", "index", "weights", "tree", "total", "_top")
+
+    @classmethod
+    def from_pool(cls, pool):
+        """由 {词条名: 权重} 构建"""
+        names = tuple(pool)
+        return cls(names, {name: i for i, name in enumerate(names)}, pool.values())
+
+    def __init__(self, names, index, weights):
+        n = len(names)
+        self.names = names
+        self.index = index
+        self.weights = list(weights)
+        tree = [0]
+        tree.extend(weights)
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                tree[j] += tree[i]
+        self.tree = tree
+        self.total = sum(self.weights)
+        top = 1
+        while top * 2 <= n:
+            top *= 2
+        self._top = top if n else 0
+
+    def copy(self):
+        """复制当前状态（名称与下标映射共享，权重与树独立）"""
+        other = _AffixSampler.__new__(_AffixSampler)
+        other.names = self.names
+        other.index = self.index
+        other.weights = self.weights[:]
+        other.tree = self.tree[:]
+        other.total = self.total
+        other._top = self._top
+        return other
+
+    def remove(self, name):
+        """将词条权重置零（不在池中或已移除时忽略）"""
+        i = self.index.get(name)
+        if i is None:
+            return
+        weight = self.weights[i]
+        if not weight:
+            return
+        self.weights[i] = 0
+        self.total -= weight
+        tree = self.tree
+        i += 1
+        while i < len(tree):
+            tree[i] -= weight
+            i += i & -i
+
+    def sample(self, rng=random):
+        """按当前权重抽取一个词条名（调用方需保证 total > 0）"""
+        target = rng.random() * self.total
+        tree = self.tree
+        n = len(tree) - 1
+        pos = 0
+        step = self._top
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] <= target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return self.names[min(pos, n - 1)]
+
+
+class AffixTable:
+    """单个 (品质, 掉落倾向) 的预编译词缀表：各池已建好的 Fenwick 抽样器模板"""
+    __slots__ = ("rare_names", "rare", "main", "combined")
+
+    def __init__(self, rare_pool, general_pool, main_pool):
+        self.rare_names = tuple(rare_pool)
+        self.rare = _AffixSampler.from_pool(rare_pool)
+        self.main = _AffixSampler.from_pool(main_pool)
+
+        # 副词条抽取使用的合并池：稀有池在前，通用池在后
+        combined_pool = dict(rare_pool)
+        combined_pool.update(general_pool)
+        self.combined = _AffixSampler.from_pool(combined_pool)
+
+
+def _build_weighted_pool(quality, bias_type, is_rare_pool):
+    """
+    根据词缀类型（稀有/通用）和品质门槛构建加权词缀池 {词条名: 权重}。
+    """
+    weighted_pool = {}
+    bias = cfg.MONSTER_DROP_BIAS.get(bias_type, {})
+    is_epic_or_better = quality in ["史诗", "传奇"]
+
+    for pool_name, pool_affixes in cfg.AFFIX_POOLS.items():
+        is_affix_rare = _RARE_POOL_FLAGS[pool_name]
+
+        # 过滤：只构建稀有池 或 通用池
+        if is_rare_pool != is_affix_rare: continue
+
+        # 专属稀有属性和射程的品质门槛
+        if pool_name.startswith("稀有专属_"):
+            if not is_epic_or_better or pool_name != f"稀有专属_{bias_type}":
+                continue
+        if pool_name == "独立词条_射程":
+            if quality != "传奇":
+                continue
+
+        pool_weight_bonus = bias.get(pool_name, 0)
+
+        for affix_name, base_weight in pool_affixes.items():
+            total_weight = base_weight + pool_weight_bonus
+            if total_weight > 0:
+                weighted_pool[affix_name] = total_weight
+
+    return weighted_pool
+
+def _compile_affix_table(quality, bias_type):
+    rare_pool = _build_weighted_pool(quality, bias_type, True)
+    general_pool = _build_weighted_pool(quality, bias_type, False)
+    rare_n_max = cfg.QUALITY_SETTINGS[quality]["rare_n_range"][1]
+
+    # 主词条必中池：按掉落倾向筛选
+    main_pool = {}
+    for name in list(rare_pool) + [n for n in general_pool if n not in rare_pool]:
+        # **修复：普通装备不应抽取稀有词条作为主词条**
+        if rare_n_max == 0 and name in _RARE_NAMES:
+            continue
+
+        weight = rare_pool.get(name, general_pool.get(name))
+
+        if bias_type == "铁桶" and name in _SURVIVAL_NAMES:
+            main_pool[name] = weight
+        elif bias_type == "食尸鬼" and name in _OFFENSE_NAMES:
+            main_pool[name] = weight
+        elif bias_type == "游荡者":
+            main_pool[name] = weight
+
+    return AffixTable(rare_pool, general_pool, main_pool)
+
+def get_affix_table(quality, bias_type):
+    """返回 (品质, 掉落倾向) 的预编译词缀表；未预编译的组合首次使用时编译"""
+    key = (quality, bias_type)
+    table = _AFFIX_TABLES.get(key)
+    if table is None:
+        table = _AFFIX_TABLES[key] = _compile_affix_table(quality, bias_type)
+    return table
+
+_BIAS_TYPES = set(cfg.BIAS_DISPLAY_NAMES) | set(cfg.MONSTER_DROP_BIAS)
+_AFFIX_TABLES = {
+    (quality, bias_type): _compile_affix_table(quality, bias_type)
+    for quality in cfg.QUALITY_SETTINGS
+    for bias_type in _BIAS_TYPES
+}
+
+
+def roll_affix_names(quality, bias_type, n, locked_affixes=(), rng=random):
+    """
+    抽取新词条名称（不重复、满足稀有数量、主词条必中）。
+    返回 (chosen_names, main_affix_count)：chosen_names 中前 main_affix_count 个为主词条。
+    """
+    num_to_generate = n - len(locked_affixes)
+    if num_to_generate <= 0:
+        return [], 0
+
+    rare_n_min, rare_n_max = cfg.QUALITY_SETTINGS[quality]["rare_n_range"]
+    locked_names = [a["name"] for a in locked_affixes]
+    
+    # 1. 确定主词条数量（减去已锁定的主词条数量）
+    main_affix_count = 1
+    if quality == "传奇" and n == 5:
+        main_affix_count = 2
+    
+    # 统计已锁定的主词条数量
+    locked_main_count = sum(1 for a in locked_affixes if a.get("is_main", False))
+    main_affix_count = max(0, main_affix_count - locked_main_count)
+    
+    # 2. 计算已锁定和所需稀有/通用词条数量
+    locked_rare_n = sum(1 for name in locked_names if name in _RARE_NAMES)
+    
+    rare_n_target = max(rare_n_min - locked_rare_n, 0) # 至少需要的稀有数量
+
+    # 3. 词条抽取：分为主词条和普通词条 (确保不重复)
+    chosen_names = []
+    
+    # 从预编译词缀表建立抽样器，并排除已锁定词条
+    table = get_affix_table(quality, bias_type)
+    rare_pool = table.rare.copy()
+    main_pool = table.main.copy()
+    for name in locked_names:
+        rare_pool.remove(name)
+        main_pool.remove(name)
+    
+    # A. 抽取主词条 (不重复)
+    for _ in range(main_affix_count):
+        if main_pool.total <= 0: break
+        
+        main_name = main_pool.sample(rng)
+        chosen_names.append(main_name)
+        
+        # 从所有池中移除
+        rare_pool.remove(main_name)
+        main_pool.remove(main_name)
+    
+    # B. 抽取剩余的普通词条（满足稀有数量约束）
+    
+    chosen_rare_n = sum(1 for name in chosen_names if name in _RARE_NAMES)
+    remaining_to_generate = num_to_generate - len(chosen_names)
+    
+    if remaining_to_generate > 0:
+        
+        # 确定必须是稀有/通用的数量
+        must_be_rare = max(rare_n_target - chosen_rare_n, 0)
+        
+        # 优先抽取必须满足的稀有词条
+        for _ in range(must_be_rare):
+            if rare_pool.total <= 0: break
+            
+            name = rare_pool.sample(rng)
+            chosen_names.append(name)
+            rare_pool.remove(name)
+            
+        # 抽取剩余词条 (稀有或通用皆可，但要考虑最大限制)
+        if len(chosen_names) < num_to_generate:
+            
+            # 合并池 = 稀有池（仅在未达到 rare_n_max 时并入）+ 通用池，排除已锁定和已选词条
+            combined_pool = table.combined.copy()
+            for name in locked_names:
+                combined_pool.remove(name)
+            for name in chosen_names:
+                combined_pool.remove(name)
+            current_rare_n = sum(1 for name in chosen_names if name in _RARE_NAMES)
+            rare_capped = False
+            if rare_n_max - current_rare_n <= 0:
+                for name in table.rare_names:
+                    combined_pool.remove(name)
+                rare_capped = True
+            
+            while len(chosen_names) < num_to_generate:
+                
+                # 如果当前已达到最大稀有数，则将稀有词条的权重设为0
+                if not rare_capped and current_rare_n >= rare_n_max:
+                    for name in table.rare_names:
+                        combined_pool.remove(name)
+                    rare_capped = True
+                
+                if combined_pool.total <= 0: break # 没有可抽取的词条了
+                
+                next_name = combined_pool.sample(rng)
+                chosen_names.append(next_name)
+                combined_pool.remove(next_name)
+                if next_name in _RARE_NAMES:
+                    current_rare_n += 1
+
+    return chosen_names, main_affix_count
+
+def roll_affix_value(name, b, c, monster_level, is_main_affix, rng=random):
+    """计算词缀数值 (应用 K_main 和射程/回血取整)"""
+    base_val = cfg.BASE_STAT_VALUES.get(name, 0)
+    
+    # --- 应用主词条乘数 K_main ---
+    k_main = cfg.MAIN_AFFIX_MULTIPLIER if is_main_affix else 1.0
+    
+    # --- 选择成长因子 ---
+    if name in _RARE_NAMES:
+        s_c = cfg.RARE_SPACE_GROWTH_FACTOR
+        s_a = cfg.RARE_LEVEL_GROWTH_FACTOR
+    else:
+        s_c = cfg.SPACE_GROWTH_FACTOR
+        s_a = cfg.LEVEL_GROWTH_FACTOR
+
+    value = (base_val * b * k_main) * \
+            (1 + c * s_c) * \
+            (1 + monster_level * s_a)
+    
+    value *= rng.uniform(0.9, 1.1)
+    
+    # --- 取整规则 ---
+    if name == "射程":
+        # 射程向上取整为10的倍数
+        value = cfg.ceil_to_nearest_ten(value)
+    elif name == "生命回复":
+        # 确保不超过两位小数
+        value = round(value, 2) 
+    elif base_val >= 1.0: 
+        value = int(value) # 其他整数属性取整
+    return value
+
+
+# --- 紧凑表示 ---
+
+class Affix:
+    """
+    单条词缀记录（__slots__，名称驻留）。
+    兼容旧的字典写法：affix["name"] / affix.get("is_main", False) / affix.copy()。
+    """
+    __slots__ = ("name", "value", "is_main")
+
+    def __init__(self, name, value, is_main=False):
+        self.name = sys.intern(name)
+        self.value = value
+        self.is_main = is_main
+
+    def __getitem__(self, key):
+        if key not in Affix.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in Affix.__slots__:
+            return default
+        return getattr(self, key)
+
+    def copy(self):
+        return Affix(self.name, self.value, self.is_main)
+
+    def __repr__(self):
+        return f"Affix({self.name!r}, {self.value!r}, is_main={self.is_main})"
+
+
+# 形状驻留池：相同形状的物品共享同一个 frozenset
+_SHAPE_POOL = {}
+
+def intern_shape(cells):
+    """返回与 cells 相同的共享 frozenset 形状"""
+    shape = frozenset(cells)
+    return _SHAPE_POOL.setdefault(shape, shape)
+
+@lru_cache(maxsize=4096)
+def _rotated_shape(shape):
+    """顺时针旋转 90 度后的共享形状"""
+    return intern_shape(rotate_cells(shape))
+
+
 class ModItem:
     """代表一个枪械强化模组"""
-    def __init__(self, quality, monster_level, bias_type="游荡者"):
+    __slots__ = ("quality", "monster_level", "bias_type", "bias_display_name",
+                 "n", "rare_n_min", "rare_n_max", "c", "b", "color",
+                 "shape_mode", "_shape", "affixes")
+
+    def __init__(self, quality, monster_level, bias_type="游荡者", rng=random):
         self.quality = quality
         self.monster_level = monster_level
         self.bias_type = bias_type
         self.bias_display_name = cfg.BIAS_DISPLAY_NAMES.get(bias_type, "未知")
 
         settings = cfg.QUALITY_SETTINGS[self.quality]
-        self.n = random.randint(*settings["n_range"]) # 词条数量
+        self.n = rng.randint(*settings["n_range"]) # 词条数量
         self.rare_n_min, self.rare_n_max = settings["rare_n_range"] # 稀有词条数量限制
-        self.c = random.randint(*settings["c_range"]) # 方格大小 (N)
+        self.c = rng.randint(*settings["c_range"]) # 方格大小 (N)
         self.b = settings["b"] # 品质系数
         self.color = cfg.QUALITY_COLORS[self.quality]
         
-        self.shape_mode = "Optimized" 
+        self.shape_mode = "Library" 
 
-        self.shape = self._generate_shape() 
-        self.affixes = self._generate_affixes() # 词缀列表
+        self.shape = self._generate_shape(rng) 
+        self.affixes = self._generate_affixes(rng=rng) # 词缀元组 (Affix, ...)
 
-    def _generate_shape(self):
-        """使用周长优化算法生成形状。"""
+    @property
+    def shape(self):
+        """共享的 frozenset 形状 {(r, c), ...}"""
+        return self._shape
+
+    @shape.setter
+    def shape(self, cells):
+        self._shape = intern_shape(cells)
+
+    def _generate_shape(self, rng=random):
+        """
+        从预计算的周长最优形状库中均匀抽取形状。
+        库中没有对应格数时，回退到运行时周长优化算法。
+        """
+        library_cells = get_random_shape(self.c, rng)
+        if library_cells:
+            return library_cells
+
+        self.shape_mode = "Optimized"
         optimized_cells = generate_and_optimize_polyomino(self.c)
         if not optimized_cells:
             return self._normalize_shape({(0, 0)}) 
@@ -81,237 +461,27 @@ class ModItem:
         min_c = min(c for r, c in cells)
         return set((r - min_r, c - min_c) for r, c in cells)
 
-    def _get_weighted_pool_by_type(self, is_rare_pool, is_epic_or_better, locked_names):
-        """
-        根据词缀类型（稀有/通用）和品质门槛构建加权词缀池。
-        返回的池子已排除 locked_names 中的词条。
-        """
-        weighted_pool = {}
-        bias = cfg.MONSTER_DROP_BIAS.get(self.bias_type, {})
-        
-        for pool_name, pool_affixes in cfg.AFFIX_POOLS.items():
-            
-            is_affix_rare = any(name in cfg.RARE_AFFIX_NAMES for name in pool_affixes.keys())
-
-            # 过滤：只构建稀有池 或 通用池
-            if is_rare_pool and not is_affix_rare: continue
-            if not is_rare_pool and is_affix_rare: continue
-
-            # 专属稀有属性和射程的品质门槛
-            if pool_name.startswith("稀有专属_"):
-                if not is_epic_or_better or pool_name != f"稀有专属_{self.bias_type}":
-                    continue
-            if pool_name == "独立词条_射程":
-                if self.quality != "传奇":
-                    continue
-            
-            pool_weight_bonus = bias.get(pool_name, 0)
-            
-            for affix_name, base_weight in pool_affixes.items():
-                if affix_name in locked_names: continue # 排除已锁定的词条
-                
-                total_weight = base_weight + pool_weight_bonus
-                if total_weight > 0:
-                    weighted_pool[affix_name] = total_weight
-        
-        return weighted_pool
-
-
-    def _generate_affixes(self, locked_affixes=None):
+    def _generate_affixes(self, locked_affixes=None, rng=random):
         """
         根据规则生成词缀列表：不重复、满足稀有数量、主词条必中。
         """
         if locked_affixes is None:
             locked_affixes = []
             
-        affixes = list(locked_affixes) 
-        num_to_generate = self.n - len(locked_affixes)
-        
-        if num_to_generate <= 0:
-            return affixes
+        affixes = [Affix(a["name"], a["value"], a.get("is_main", False)) for a in locked_affixes]
+        if self.n - len(locked_affixes) <= 0:
+            return tuple(affixes)
 
-        is_epic_or_better = self.quality in ["史诗", "传奇"]
-        locked_names = [a["name"] for a in locked_affixes]
-        
-        # 1. 确定主词条数量（减去已锁定的主词条数量）
-        main_affix_count = 1
-        if self.quality == "传奇" and self.n == 5:
-            main_affix_count = 2
-        
-        # 统计已锁定的主词条数量
-        locked_main_count = sum(1 for a in locked_affixes if a.get("is_main", False))
-        main_affix_count = max(0, main_affix_count - locked_main_count)
-        
-        # 2. 计算已锁定和所需稀有/通用词条数量
-        locked_rare_n = sum(1 for name in locked_names if name in cfg.RARE_AFFIX_NAMES)
-        
-        rare_n_target = max(self.rare_n_min - locked_rare_n, 0) # 至少需要的稀有数量
-        rare_n_max = self.rare_n_max - locked_rare_n           # 最多能有的稀有数量
+        chosen_names, main_affix_count = roll_affix_names(
+            self.quality, self.bias_type, self.n, locked_affixes, rng)
 
-        # 3. 词条抽取：分为主词条和普通词条 (确保不重复)
-        chosen_names = []
-        mains_to_generate = main_affix_count
-        
-        # 构建所有可用的词缀池 (不含已锁定词条)
-        full_rare_pool = self._get_weighted_pool_by_type(True, is_epic_or_better, locked_names)
-        full_general_pool = self._get_weighted_pool_by_type(False, is_epic_or_better, locked_names)
-        
-        # A. 抽取主词条 (不重复)
-        while mains_to_generate > 0:
-            
-            # 构建主词条必中池 (只包含未选和未锁定词条)
-            main_affix_candidates = {}
-            
-            # 1) 整合所有未选的词条
-            available_names = set(full_rare_pool.keys()) | set(full_general_pool.keys())
-            
-            # 2) 过滤和加权
-            for name in available_names:
-                # **修复：普通装备不应抽取稀有词条作为主词条**
-                if self.rare_n_max == 0 and name in cfg.RARE_AFFIX_NAMES:
-                    continue
-                    
-                weight = full_rare_pool.get(name, full_general_pool.get(name))
-                
-                if self.bias_type == "铁桶" and name in cfg.SURVIVAL_AFFIXES:
-                    main_affix_candidates[name] = weight
-                elif self.bias_type == "食尸鬼" and name in cfg.OFFENSE_AFFIXES:
-                    main_affix_candidates[name] = weight
-                elif self.bias_type == "游荡者":
-                    main_affix_candidates[name] = weight
-
-            if not main_affix_candidates: break
-                
-            keys = list(main_affix_candidates.keys())
-            weights = list(main_affix_candidates.values())
-            
-            if sum(weights) == 0: break
-            
-            main_name = random.choices(keys, weights=weights, k=1)[0]
-            chosen_names.append(main_name)
-            
-            # 从两个池中移除
-            full_rare_pool.pop(main_name, None)
-            full_general_pool.pop(main_name, None)
-            
-            mains_to_generate -= 1
-        
-        # B. 抽取剩余的普通词条（满足稀有数量约束）
-        
-        chosen_rare_n = sum(1 for name in chosen_names if name in cfg.RARE_AFFIX_NAMES)
-        remaining_to_generate = num_to_generate - len(chosen_names)
-        
-        if remaining_to_generate > 0:
-            
-            # 确定必须是稀有/通用的数量
-            must_be_rare = max(rare_n_target - chosen_rare_n, 0)
-            
-            # 优先抽取必须满足的稀有词条
-            for _ in range(must_be_rare):
-                if not full_rare_pool: break
-                
-                name = random.choices(list(full_rare_pool.keys()), weights=list(full_rare_pool.values()), k=1)[0]
-                chosen_names.append(name)
-                full_rare_pool.pop(name)
-                
-            # 抽取剩余词条 (稀有或通用皆可，但要考虑最大限制)
-            remaining_after_constraint = num_to_generate - len(chosen_names)
-            
-            if remaining_after_constraint > 0:
-                
-                combined_pool = {}
-                
-                # 稀有池：确保不超过 rare_n_max
-                current_rare_n = sum(1 for name in chosen_names if name in cfg.RARE_AFFIX_NAMES)
-                max_extra_rare = self.rare_n_max - current_rare_n
-                
-                if max_extra_rare > 0:
-                    rare_names = list(full_rare_pool.keys())
-                    
-                    # 按照权重排序并取前 max_extra_rare 个，防止 rare pool 数量多于 max_extra_rare 
-                    # 这里简化为将整个稀有池加入，交由 random.choices 决定
-                    combined_pool.update(full_rare_pool)
-                
-                # 通用池：直接加入
-                combined_pool.update(full_general_pool)
-                
-                if combined_pool:
-                    
-                    # 为了确保稀有词条不超过 max_extra_rare，我们手动执行加权抽取
-                    keys = list(combined_pool.keys())
-                    weights = [combined_pool[k] for k in keys]
-                    
-                    k_count = min(remaining_after_constraint, len(keys))
-                    
-                    if sum(weights) > 0:
-                        
-                        # 复杂抽取逻辑：多次抽取直到满足 k_count，并检查稀有词条限制
-                        while len(chosen_names) < num_to_generate:
-                            
-                            # 重新构建当前池（已移除已选词条）
-                            current_pool = {k:v for k,v in combined_pool.items() if k not in chosen_names}
-                            
-                            if not current_pool: break
-                            
-                            # 稀有词条超限检查
-                            current_rare_count = sum(1 for name in chosen_names if name in cfg.RARE_AFFIX_NAMES)
-                            
-                            keys_current = list(current_pool.keys())
-                            weights_current = list(current_pool.values())
-
-                            # 如果当前已达到最大稀有数，则将稀有词条的权重设为0
-                            if current_rare_count >= self.rare_n_max:
-                                weights_current = [0 if k in cfg.RARE_AFFIX_NAMES else w for k, w in zip(keys_current, weights_current)]
-                            
-                            if sum(weights_current) == 0: break # 没有可抽取的词条了
-                            
-                            next_name = random.choices(keys_current, weights=weights_current, k=1)[0]
-                            chosen_names.append(next_name)
-
-
-        # 4. 计算词缀数值 (应用 K_main 和射程/回血取整)
-        # 注意：已锁定的主词条已经在 locked_affixes 中，这里只处理新生成的词条
-        mains_generated = 0 
-        
-        for name in chosen_names:
-            base_val = cfg.BASE_STAT_VALUES.get(name, 0)
-            
-            # --- 应用主词条乘数 K_main ---
-            # 只有当还需要生成主词条时，才将新词条标记为主词条
-            is_main_affix = False
-            k_main = 1.0
-            if mains_generated < main_affix_count:
-                k_main = cfg.MAIN_AFFIX_MULTIPLIER
-                is_main_affix = True
-                mains_generated += 1
-            
-            # --- 选择成长因子 ---
-            if name in cfg.RARE_AFFIX_NAMES:
-                s_c = cfg.RARE_SPACE_GROWTH_FACTOR
-                s_a = cfg.RARE_LEVEL_GROWTH_FACTOR
-            else:
-                s_c = cfg.SPACE_GROWTH_FACTOR
-                s_a = cfg.LEVEL_GROWTH_FACTOR
-
-            value = (base_val * self.b * k_main) * \
-                    (1 + self.c * s_c) * \
-                    (1 + self.monster_level * s_a)
+        # 只有当还需要生成主词条时，才将新词条标记为主词条
+        for i, name in enumerate(chosen_names):
+            is_main_affix = i < main_affix_count
+            value = roll_affix_value(name, self.b, self.c, self.monster_level, is_main_affix, rng)
+            affixes.append(Affix(name, value, is_main_affix))
             
-            value *= random.uniform(0.9, 1.1)
-            
-            # --- 取整规则 ---
-            if name == "射程":
-                # 射程向上取整为10的倍数
-                value = cfg.ceil_to_nearest_ten(value)
-            elif name == "生命回复":
-                # 确保不超过两位小数
-                value = round(value, 2) 
-            elif base_val >= 1.0: 
-                value = int(value) # 其他整数属性取整
-
-            affixes.append({"name": name, "value": value, "is_main": is_main_affix})
-            
-        return affixes
+        return tuple(affixes)
 
     def reroll_affixes(self, level=1, locked_indices=None):
         """
@@ -336,12 +506,20 @@ class ModItem:
 
     def rotate(self):
         """顺时针旋转90度"""
-        new_shape = set((c, -r) for r, c in self.shape)
-        self.shape = self._normalize_shape(new_shape)
+        self._shape = _rotated_shape(self._shape)
 
     def get_bounds(self):
-        """获取形状的边界 (width, height) in cells"""
-        return get_bounding_box_dims(self.shape)
+        """获取形状的边界 (height, width) in cells，取自按形状缓存的 CompiledShape"""
+        compiled = compile_shape(self._shape)
+        return compiled.height, compiled.width
+
+    def get_compiled_shape(self):
+        """当前朝向的逐行位掩码 (CompiledShape)，相同形状共享缓存"""
+        return compile_shape(self.shape)
+
+    def get_compiled_rotations(self):
+        """所有不同朝向的 ((顺时针旋转次数, CompiledShape), ...)"""
+        return compile_rotations(self.shape)
 
     def draw(self, surface, x, y, cell_size):
         """在指定屏幕坐标(x, y)绘制物品"""
@@ -369,4 +547,120 @@ def create_mod_item(quality, monster_level, bias_type=None):
     """创建 ModItem 的工厂函数。"""
     if bias_type is None:
         bias_type = cfg.QUALITY_SETTINGS[quality]["bias"]
-    return ModItem(quality, monster_level, bias_type)
\ No newline at end of file
+    return ModItem(quality, monster_level, bias_type)
+
+
+# --- 批量生成 ---
+
+# 列式摘要中的词条编号：按 AFFIX_POOLS 中首次出现的顺序
+AFFIX_NAMES = tuple(dict.fromkeys(name for pool in cfg.AFFIX_POOLS.values() for name in pool))
+AFFIX_IDS = {name: i for i, name in enumerate(AFFIX_NAMES)}
+
+def generate_items_batch(quality, monster_level, bias_type=None, count=1, summary=False, seed=None):
+    """
+    批量生成 count 个同品质、同等级、同掉落倾向的模组，共享预编译词缀表与形状库。
+
+    summary=False 时返回 ModItem 列表；
+    summary=True 时不创建 ModItem，返回列式摘要（NumPy 数组，无词条处填充 -1 / NaN）：
+        "affix_names":  词条编号对应的名称元组
+        "n_affixes":    (count,) 词条数量
+        "cells":        (count,) 方格数
+        "shape_index":  (count,) 形状在形状库中该格数列表内的下标，-1 表示不在库中
+        "affix_ids":    (count, max_n) 词条编号
+        "affix_values": (count, max_n) 词条数值
+        "is_main":      (count, max_n) 是否主词条
+    seed 不为 None 时使用独立的随机数生成器（相同参数结果可复现，不影响全局 random）。
+    """
+    if bias_type is None:
+        bias_type = cfg.QUALITY_SETTINGS[quality]["bias"]
+    rng = random.Random(seed) if seed is not None else random
+
+    if not summary:
+        return [ModItem(quality, monster_level, bias_type, rng) for _ in range(count)]
+
+    settings = cfg.QUALITY_SETTINGS[quality]
+    n_range = settings["n_range"]
+    c_range = settings["c_range"]
+    b = settings["b"]
+    max_n = n_range[1]
+    library = get_shape_library()
+
+    n_affixes = np.zeros(count, dtype=np.int8)
+    cells = np.zeros(count, dtype=np.int16)
+    shape_index = np.full(count, -1, dtype=np.int32)
+    affix_ids = np.full((count, max_n), -1, dtype=np.int16)
+    affix_values = np.full((count, max_n), np.nan, dtype=np.float64)
+    is_main = np.zeros((count, max_n), dtype=bool)
+
+    # 先收集到 Python 列表再一次性写入数组，避免逐元素写 NumPy 的开销
+    flat_rows, flat_cols, flat_ids, flat_values, flat_main = [], [], [], [], []
+    n_list, c_list, shape_list = [], [], []
+
+    # 随机数消耗顺序与 ModItem 一致：词条数 -> 格数 -> 形状 -> 词条
+    for row in range(count):
+        n = rng.randint(*n_range)
+        c = rng.randint(*c_range)
+        shapes = library.get(c)
+        n_list.append(n)
+        c_list.append(c)
+        shape_list.append(rng.randrange(len(shapes)) if shapes else -1)
+
+        chosen_names, main_affix_count = roll_affix_names(quality, bias_type, n, (), rng)
+        for col, name in enumerate(chosen_names):
+            main = col < main_affix_count
+            flat_rows.append(row)
+            flat_cols.append(col)
+            flat_ids.append(AFFIX_IDS.get(name, -1))
+            flat_values.append(roll_affix_value(name, b, c, monster_level, main, rng))
+            flat_main.append(main)
+
+    n_affixes[:] = n_list
+    cells[:] = c_list
+    shape_index[:] = shape_list
+    if flat_rows:
+        affix_ids[flat_rows, flat_cols] = flat_ids
+        affix_values[flat_rows, flat_cols] = flat_values
+        is_main[flat_rows, flat_cols] = flat_main
+
+    return {
+        "affix_names": AFFIX_NAMES,
+        "n_affixes": n_affixes,
+        "cells": cells,
+        "shape_index": shape_index,
+        "affix_ids": affix_ids,
+        "affix_values": affix_values,
+        "is_main": is_main,
+    }
+
+def _generate_summary_chunk(quality, monster_level, bias_type, count, seed):
+    """进程池工作函数（需为模块级函数以便 pickle）"""
+    return generate_items_batch(quality, monster_level, bias_type, count, summary=True, seed=seed)
+
+def generate_items_batch_parallel(quality, monster_level, bias_type=None, count=1,
+                                  workers=None, chunk_size=20000, seed=None):
+    """
+    多进程批量生成列式摘要，适合数十万级的平衡性统计。
+    各分块使用 seed + 分块序号 作为种子；seed 为 None 时随机选取基准种子。
+    """
+    if bias_type is None:
+        bias_type = cfg.QUALITY_SETTINGS[quality]["bias"]
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+
+    sizes = [chunk_size] * (count // chunk_size)
+    if count % chunk_size:
+        sizes.append(count % chunk_size)
+    seeds = [seed + i for i in range(len(sizes))]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(_generate_summary_chunk, repeat(quality), repeat(monster_level),
+                                  repeat(bias_type), sizes, seeds))
+
+    if not parts:
+        return generate_items_batch(quality, monster_level, bias_type, 0, summary=True)
+
+    merged = {"affix_names": AFFIX_NAMES}
+    for key in parts[0]:
+        if key != "affix_names":
+            merged[key] = np.concatenate([part[key] for part in parts])
+    return merged
@@ -0,0 +1,300 @@
+# loadout.py
+# 最优配装求解：从候选模组中选出放入强化面板的组合，使目标属性（默认 DPS）最大。
+# 分支限界搜索（装备 / 不装备），上界为剩余空间内逐词条的分数背包。装备分支先把模组放在
+# 当前布局最靠左上的位置；放不下但面积足够时，连同已选模组回溯搜索新布局（每个朝向尝试
+# 按行优先的前几个可放置点），回溯时恢复原布局，先放下的模组不会因为贪心位置挡住更好的组合。
+# 在时间预算内返回找到的最好布局。
+
+import time
+import sys
+import os
+
+# 添加路径以便导入
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+try:
+    from systems.inventory.bitboard import Bitboard
+    from systems.inventory.packing import pack_items
+except ImportError as e:
+    print(f"错误：loadout.py 导入失败: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit()
+
+
+def _dps(stats):
+    """期望每秒伤害 = 攻击力 × 射速 × 暴击期望倍率"""
+    crit_rate = min(stats["暴击率"], 1.0)
+    return stats["攻击力"] * stats["射速"] * (1 + crit_rate * (stats["暴击伤害"] - 1))
+
+def _effective_health(stats):
+    """有效生命 = 生命 / (1 - 伤害减免)"""
+    return stats["生命"] / (1 - stats["伤害减免%"] / 100)
+
+# 可选优化目标：{名称: stats -> 分数}
+# 所有词条数值均为正，这些目标对每个词条都单调不减，上界剪枝依赖这一点
+OBJECTIVES = {
+    "DPS": _dps,
+    "攻击力": lambda stats: stats["攻击力"],
+    "生命": lambda stats: stats["生命"],
+    "有效生命": _effective_health,
+}
+
+DEFAULT_OBJECTIVE = "DPS"
+DEFAULT_TIME_BUDGET = 0.25  # 秒
+
+# 重新布局时每个朝向尝试的可放置位置数（按行优先顺序）
+_PLACEMENTS_PER_ROTATION = 3
+# 单次重新布局搜索的节点上限
+_REPACK_NODE_LIMIT = 200
+
+
+def _add_bonus(bonus, delta, sign=1):
+    for name, value in delta.items():
+        bonus[name] = bonus.get(name, 0) + sign * value
+
+
+def _best_position(board, rotations):
+    """所有朝向中最靠上、最靠左的可放置位置，返回 (turns, row, col, shape) 或 None"""
+    best = None
+    for turns, shape in rotations:
+        pos = board.find_first_fit(shape)
+        if pos is not None and (best is None or pos < best[1:3]):
+            best = (turns, pos[0], pos[1], shape)
+    return best
+
+
+def _candidate_positions(board, rotations, per_rotation=_PLACEMENTS_PER_ROTATION):
+    """
+    装备分支的候选位置：每个朝向按行优先取前 per_rotation 个可放置点，
+    合并后按 (row, col) 从左上到右下排序，返回 [(row, col, turns, shape), ...]
+    """
+    positions = []
+    for turns, shape in rotations:
+        for k, (r, c) in enumerate(board.iter_fits(shape)):
+            if k >= per_rotation:
+                break
+            positions.append((r, c, turns, shape))
+    positions.sort(key=lambda entry: entry[:3])
+    return positions
+
+
+def _search_placements(entries, rows, cols, node_limit=_REPACK_NODE_LIMIT, deadline=None):
+    """
+    回溯搜索 entries 中全部物品的布局，每个物品在 _candidate_positions 的位置中选择。
+    entries: [(item, rotations), ...]，按面积从大到小排列时搜索最快。
+    返回 (Bitboard, {item: (turns, row, col)})；放不下、超过节点上限或超过 deadline 时返回 None。
+    """
+    board = Bitboard(rows, cols)
+    layout = {}
+    nodes = [0]
+
+    def place(k):
+        if k == len(entries):
+            return True
+        nodes[0] += 1
+        if nodes[0] > node_limit:
+            return False
+        if deadline is not None and time.perf_counter() > deadline:
+            nodes[0] = node_limit  # 超时：放弃本次搜索
+            return False
+        item, rotations = entries[k]
+        for r, c, turns, shape in _candidate_positions(board, rotations):
+            board.place(shape, r, c)
+            layout[item] = (turns, r, c)
+            if place(k + 1):
+                return True
+            del layout[item]
+            board.remove(shape, r, c)
+        return False
+
+    if not place(0):
+        return None
+    return board, layout
+
+
+def solve_loadout(player_logic, items, rows, cols, objective=DEFAULT_OBJECTIVE,
+                  time_budget=DEFAULT_TIME_BUDGET):
+    """
+    在 rows x cols 面板中为 items 求解目标最大的装备组合。
+    返回 (score, {item: (顺时针旋转次数, row, col)})。
+    """
+    score_fn = OBJECTIVES[objective]
+
+    def evaluate(bonus):
+        return score_fn(player_logic.build_stats(bonus))
+
+    empty_score = evaluate({})
+
+    # 1. 候选：单独装备有收益的物品，按单位面积收益从大到小排序
+    candidates = []
+    for item in items:
+        delta = player_logic.aggregate_bonus([item])
+        gain = evaluate(delta) - empty_score
+        if gain > 0:
+            rotations = item.get_compiled_rotations()
+            candidates.append((gain / rotations[0][1].area, item, delta, rotations))
+    candidates.sort(key=lambda entry: entry[0], reverse=True)
+
+    n = len(candidates)
+    areas = [entry[3][0][1].area for entry in candidates]
+
+    # 2. 按词条的单位面积数值排序的候选表 {词条名: [(数值/面积, 数值, 面积, 候选序号), ...]}（用于乐观上界）
+    by_affix = {}
+    for idx, (_, _, delta, _) in enumerate(candidates):
+        for name, value in delta.items():
+            by_affix.setdefault(name, []).append((value / areas[idx], value, areas[idx], idx))
+    for entries in by_affix.values():
+        entries.sort(reverse=True)
+
+    def optimistic_bonus(i, free_cells):
+        """
+        剩余候选（序号 >= i）在 free_cells 格内能提供的每个词条的上限（逐词条分数背包），
+        目标对每个词条单调，所以按这些上限求值是合法上界
+        """
+        optimistic = dict(bonus)
+        for name, entries in by_affix.items():
+            room = free_cells
+            total = 0
+            for density, value, area, idx in entries:
+                if idx < i:
+                    continue
+                if area <= room:
+                    total += value
+                    room -= area
+                else:
+                    total += density * room
+                    break
+            if total:
+                optimistic[name] = optimistic.get(name, 0) + total
+        return optimistic
+
+    rotations_of = {item: rotations for _, item, _, rotations in candidates}
+    board = Bitboard(rows, cols)
+    bonus = {}
+    chosen = {}
+    best = [empty_score, {}]
+    deadline = time.perf_counter() + time_budget
+    state = {"nodes": 0, "timeout": False}
+
+    def search(i, free_cells):
+        state["nodes"] += 1
+        # 每个节点都检查时间（重新布局可能让单个节点耗时较长）
+        if time.perf_counter() > deadline:
+            state["timeout"] = True
+        if state["timeout"]:
+            return
+
+        current = evaluate(bonus)
+        if current > best[0]:
+            best[0] = current
+            best[1] = dict(chosen)
+
+        if i >= n or free_cells <= 0:
+            return
+
+        # 上界：剩余空间内每个词条都取到上限也无法超过当前最优则剪枝
+        if evaluate(optimistic_bonus(i, free_cells)) <= best[0]:
+            return
+
+        _, item, delta, rotations = candidates[i]
+
+        # 分支 1：装备该物品
+        if areas[i] <= free_cells:
+            _add_bonus(bonus, delta)
+            placement = _best_position(board, rotations)
+            if placement is not None:
+                # 当前布局中最靠左上的位置
+                turns, r, c, shape = placement
+                board.place(shape, r, c)
+                chosen[item] = (turns, r, c)
+
+                search(i + 1, free_cells - areas[i])
+
+                del chosen[item]
+                board.remove(shape, r, c)
+            else:
+                # 面积够但当前布局放不下：连同已选物品一起回溯搜索新布局，成功则在新布局上继续
+                entries = [(other, rotations_of[other]) for other in chosen] + [(item, rotations)]
+                entries.sort(key=lambda entry: entry[1][0][1].area, reverse=True)
+                repacked = _search_placements(entries, rows, cols, deadline=deadline)
+                if repacked is not None:
+                    saved_masks, saved_chosen = board.row_masks, dict(chosen)
+                    board.row_masks = repacked[0].row_masks
+                    chosen.clear()
+                    chosen.update(repacked[1])
+
+                    search(i + 1, free_cells - areas[i])
+
+                    board.row_masks = saved_masks
+                    chosen.clear()
+                    chosen.update(saved_chosen)
+            _add_bonus(bonus, delta, -1)
+
+        # 分支 2：不装备该物品
+        search(i + 1, free_cells)
+
+    search(0, rows * cols)
+    return best[0], best[1]
+
+
+def _snapshot(*panels):
+    """记录面板布局与物品形状，用于失败时回滚"""
+    return [(panel, {item: (pos, item.shape) for item, pos in panel.items.items()})
+            for panel in panels]
+
+def _restore(snapshot):
+    for panel, layout in snapshot:
+        panel.clear()
+    for panel, layout in snapshot:
+        for item, ((r, c), shape) in layout.items():
+            item.shape = shape
+            panel.add_item(item, r, c)
+
+
+def equip_best_loadout(player_logic, mod_panel, inv_panel, objective=DEFAULT_OBJECTIVE,
+                       time_budget=DEFAULT_TIME_BUDGET):
+    """
+    一键装备最优配装：候选为强化面板与背包中的全部模组。
+    未被选中的已装备模组放回背包；背包放不下时回滚并返回 False。
+    """
+    pool = list(mod_panel.items.keys()) + list(inv_panel.items.keys())
+    _, layout = solve_loadout(player_logic, pool, mod_panel.rows, mod_panel.cols,
+                              objective, time_budget)
+
+    snapshot = _snapshot(mod_panel, inv_panel)
+    unequipped = [item for item in mod_panel.items if item not in layout]
+
+    mod_panel.clear()
+    for item in layout:
+        inv_panel.remove_item(item)
+
+    for item, (turns, r, c) in layout.items():
+        for _ in range(turns):
+            item.rotate()
+        mod_panel.add_item(item, r, c)
+
+    for item in unequipped:
+        placement = _best_position(inv_panel.occupancy, item.get_compiled_rotations())
+        if placement is None:
+            # 逐个放不下时尝试整体重排背包
+            pending = [other for other in unequipped if other not in inv_panel.items]
+            rearranged = pack_items(list(inv_panel.items.keys()) + pending,
+                                    inv_panel.rows, inv_panel.cols)
+            if rearranged is None:
+                _restore(snapshot)
+                player_logic.calculate_stats(mod_panel.items.keys())
+                return False
+            inv_panel.clear()
+            for other, (turns, r, c) in rearranged.items():
+                for _ in range(turns):
+                    other.rotate()
+                inv_panel.add_item(other, r, c)
+            break
+        turns, r, c, _ = placement
+        for _ in range(turns):
+            item.rotate()
+        inv_panel.add_item(item, r, c)
+
+    player_logic.calculate_stats(mod_panel.items.keys())
+    return True
@@ -12,6 +12,7 @@ try:
     from player_stats import PlayerLogic, StatsPanelRenderer, STAT_PANEL_FIXED_WIDTH, STAT_PANEL_FIXED_HEIGHT
     from ui_elements import Button, GridPanel, render_text
     from inventory_gui import InventoryScreen
+    from glyph_atlas import load_ui_fonts
 except ImportError as e:
     print(f"错误：main.py 导入失败: {e}")
     sys.exit()
@@ -30,20 +31,9 @@ class MainMenu:
         self.clock = pygame.time.Clock()
         self.running = True
         
-        # 1.2 加载指定字体
-        font_path = cfg.FONT_PATH
-        if not os.path.exists(font_path):
-            print(f"警告：字体文件 {font_path} 不存在，尝试使用系统默认字体。")
-            font_path = None # Fallback
-            
+        # 1.2 加载字体（预栅格化的字形图集，缓存在磁盘；字体文件不存在时使用系统字体）
         try:
-            self.fonts = {
-                "main": pygame.font.Font(font_path, cfg.FONT_SIZE_MAIN) if font_path else pygame.font.SysFont("SimHei", cfg.FONT_SIZE_MAIN),
-                "small": pygame.font.Font(font_path, cfg.FONT_SIZE_SMALL) if font_path else pygame.font.SysFont("SimHei", cfg.FONT_SIZE_SMALL),
-                "affix_main": pygame.font.Font(font_path, cfg.FONT_SIZE_AFFIX_MAIN) if font_path else pygame.font.SysFont("SimHei", cfg.FONT_SIZE_AFFIX_MAIN), # Bold handled in render
-                "affix_other": pygame.font.Font(font_path, cfg.FONT_SIZE_AFFIX_OTHER) if font_path else pygame.font.SysFont("SimHei", cfg.FONT_SIZE_AFFIX_OTHER),
-                "button": pygame.font.Font(font_path, cfg.FONT_SIZE_BUTTON) if font_path else pygame.font.SysFont("SimHei", cfg.FONT_SIZE_BUTTON),
-            }
+            self.fonts = load_ui_fonts()
         except Exception as e:
             print(f"字体加载失败: {e}")
             sys.exit()
@@ -115,8 +105,7 @@ class MainMenu:
 
     def add_item_to_inventory(self, item):
         """安全地将物品添加到背包的第一个空位"""
-        self.inv_panel_logic.items = {}
-        self.inv_panel_logic.grid_data = [[None for _ in range(cfg.INV_PANEL_COLS)] for _ in range(cfg.INV_PANEL_ROWS)]
+        self.inv_panel_logic.clear()
         for i, (r, c) in self.inv_items.items():
             self.inv_panel_logic.add_item(i, r, c)
             
@@ -0,0 +1,126 @@
+# packing.py
+# 背包自动整理：带旋转的左上优先装箱（Bottom-Left-Fill，网格行优先方向为“左上”）。
+# 物品按面积从大到小依次放入，每个物品尝试所有不同朝向，取最靠上、最靠左的位置；
+# 剩余时间内用不同的排序做有限次重试，保留占用行数最少的方案。
+
+import random
+import time
+import sys
+import os
+
+# 添加路径以便导入
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+try:
+    from systems.inventory.bitboard import Bitboard
+except ImportError as e:
+    print(f"错误：packing.py 导入失败: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit()
+
+# 默认搜索时间预算（秒），首轮贪心结果总会完整计算
+DEFAULT_TIME_BUDGET = 0.03
+
+
+def _greedy_pack(entries, rows, cols):
+    """
+    按 entries 顺序贪心放置。
+    entries: [(item, ((turns, CompiledShape), ...)), ...]
+    返回 (placements, used_rows)；有物品放不下时返回 None。
+    placements: {item: (turns, row, col)}
+    """
+    board = Bitboard(rows, cols)
+    full_row = (1 << cols) - 1
+    start_row = 0
+    used_rows = 0
+    placements = {}
+
+    for item, rotations in entries:
+        best = None
+        for turns, shape in rotations:
+            pos = board.find_first_fit(shape, start_row)
+            if pos is not None and (best is None or pos < best[1]):
+                best = (turns, pos, shape)
+        if best is None:
+            return None
+
+        turns, (r, c), shape = best
+        board.place(shape, r, c)
+        placements[item] = (turns, r, c)
+        used_rows = max(used_rows, r + shape.min_r + shape.height)
+
+        # 跳过已经占满的顶部行
+        while start_row < rows and board.row_masks[start_row] == full_row:
+            start_row += 1
+
+    return placements, used_rows
+
+
+def _area_key(entry):
+    """面积优先，其次最长边，均从大到小"""
+    _, rotations = entry
+    shape = rotations[0][1]
+    return (-shape.area, -max(shape.height, shape.width))
+
+def _extent_key(entry):
+    """最长边优先，其次面积，均从大到小"""
+    _, rotations = entry
+    shape = rotations[0][1]
+    return (-max(shape.height, shape.width), -shape.area)
+
+
+def pack_items(items, rows, cols, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    计算 items 在 rows x cols 网格中的紧凑布局。
+    返回 {item: (顺时针旋转次数, row, col)}；无法全部放下时返回 None。
+    time_budget 为 0 时只做一次按面积排序的贪心。
+    """
+    entries = [(item, item.get_compiled_rotations()) for item in items]
+    if sum(rotations[0][1].area for _, rotations in entries) > rows * cols:
+        return None
+
+    deadline = time.perf_counter() + time_budget
+
+    best = None
+    for key in (_area_key, _extent_key):
+        order = sorted(entries, key=key)
+        result = _greedy_pack(order, rows, cols)
+        if result is not None and (best is None or result[1] < best[1][1]):
+            best = (order, result)
+        if time_budget <= 0:
+            break
+
+    # 有限次局部扰动：交换当前最优顺序中的相邻物品；预计下一轮会超时则停止
+    rng = random.Random(len(entries))
+    pass_time = 0.0
+    while best is not None and len(entries) > 1:
+        start = time.perf_counter()
+        if start + pass_time > deadline:
+            break
+        order = list(best[0])
+        i = rng.randrange(len(order) - 1)
+        order[i], order[i + 1] = order[i + 1], order[i]
+        result = _greedy_pack(order, rows, cols)
+        if result is not None and result[1] < best[1][1]:
+            best = (order, result)
+        pass_time = time.perf_counter() - start
+
+    return best[1][0] if best else None
+
+
+def tidy_panel(panel, time_budget=DEFAULT_TIME_BUDGET):
+    """
+    重新排列 GridPanel 中的所有物品（通过 ModItem.rotate 调整朝向）。
+    成功返回 True；无法放下全部物品时保持原布局并返回 False。
+    """
+    layout = pack_items(list(panel.items.keys()), panel.rows, panel.cols, time_budget)
+    if layout is None:
+        return False
+
+    panel.clear()
+    for item, (turns, r, c) in layout.items():
+        for _ in range(turns):
+            item.rotate()
+        panel.add_item(item, r, c)
+    return True
@@ -18,36 +18,91 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
 try:
     from systems.inventory import config as cfg
+    from systems.inventory.item_generator import AFFIX_IDS
+    # render_text 与提示框共享同一个文本缓存
+    from systems.inventory.ui_elements import render_text
 except ImportError:
-    print("错误：player_stats.py 无法导入 config.py。")
+    print("错误：player_stats.py 无法导入 config.py / item_generator.py / ui_elements.py。")
     import traceback
     traceback.print_exc()
     sys.exit()
 
-# 导入 render_text 辅助函数 (为了独立性暂时保留本地副本)
-def render_text(font, text, color, bold=False, italic=False, antialias=True):
-    font.set_bold(bold)
-    font.set_italic(italic)
-    return font.render(text, antialias, color)
+
+# --- 派生属性规则 ---
+# 每条规则为 (依赖的词条名, 计算函数)，计算函数 (base_stats, bonus) -> {属性名: 值}，
+# 其中 bonus(词条名) 返回该词条的加成总值。增量更新时只重算依赖词条发生变化的规则。
+
+def _derive_health(base, bonus):
+    # 生命值 (生命% 为乘算，生命值为加算)
+    return {"生命": base["基础生命值"] * (1 + bonus("生命%")) + bonus("生命")}
+
+def _derive_armor(base, bonus):
+    # 护甲 (基础护甲 + 词条护甲)
+    armor = base["基础护甲"] + bonus("护甲")
+    # 使用配置中的 ARMOR_CONSTANT
+    armor_const = getattr(cfg, 'ARMOR_CONSTANT', 100)
+    # 线性减伤公式: DR = Armor / (Armor + K)
+    # **[保留] 护甲减伤%计算 (用于面板显示)**
+    return {"护甲": armor, "伤害减免%": (armor / (armor + armor_const)) * 100}
+
+def _derive_fire_rate(base, bonus):
+    # 射击速度 (线性叠加，有上限)
+    fire_rate_bonus = min(bonus("射击速度%"), cfg.MAX_FIRE_RATE_BONUS)
+    # 内部使用射速，外部显示射击速度
+    return {"射击速度%": fire_rate_bonus, "射速": base["基础射击速度"] * (1 + fire_rate_bonus)}
+
+def _derive_pierce(base, bonus):
+    # 穿透数（初始值为0，表示子弹可以穿过几个敌人）
+    return {"穿透数": max(0, int(base.get("基础穿透数", 0) + bonus("穿透数")))}
+
+_STAT_RULES = (
+    # --- 1. 基础生存属性 ---
+    (("生命%", "生命"), _derive_health),
+    (("护甲",), _derive_armor),
+    (("生命回复",), lambda base, bonus: {"生命回复": bonus("生命回复")}),
+    # --- 2. 攻击属性 ---
+    (("攻击力",), lambda base, bonus: {"攻击力": base["基础攻击力"] + bonus("攻击力")}),
+    (("射击速度%",), _derive_fire_rate),
+    (("暴击率",), lambda base, bonus: {"暴击率": base["基础暴击率"] + bonus("暴击率")}),
+    (("暴击伤害",), lambda base, bonus: {"暴击伤害": base["基础暴击伤害"] + bonus("暴击伤害")}),
+    (("攻击吸血",), lambda base, bonus: {"攻击吸血": bonus("攻击吸血")}),
+    (("护甲穿透",), lambda base, bonus: {"护甲穿透": bonus("护甲穿透")}),
+    (("射程",), lambda base, bonus: {"射程": base["基础射程"] + bonus("射程")}),
+    (("穿透数",), _derive_pierce),
+    # --- 3. 移动速度 ---
+    (("移速%",), lambda base, bonus: {"移速": base["基础移速"] * (1 + bonus("移速%"))}),
+)
+
+# 词条名 -> 依赖它的规则下标
+_RULES_BY_AFFIX = {}
+for _index, (_inputs, _) in enumerate(_STAT_RULES):
+    for _name in _inputs:
+        _RULES_BY_AFFIX.setdefault(_name, []).append(_index)
 
 
 class PlayerLogic:
     """
     仅负责逻辑计算和数据存储的玩家类。
+    装备加成以按词条编号索引的向量累计，装备/卸下单个模组时增量更新。
     """
     def __init__(self):
         self.base_stats = cfg.PLAYER_BASE_STATS.copy()
         self.total_stats = {}
         self.current_health = self.base_stats["基础生命值"]
         self.current_essence = self.base_stats.get("基础源质", 0)
+
+        # 增量聚合器：词条编号 -> 加成总值 / 贡献该词条的词缀数量
+        # 贡献数量归零时将总值精确置零，避免反复装卸累积浮点误差
+        self._affix_ids = dict(AFFIX_IDS)
+        self._bonus = [0] * len(self._affix_ids)
+        self._bonus_refs = [0] * len(self._affix_ids)
+
         self.calculate_stats([]) # 初始化
 
-    def calculate_stats(self, mod_items):
-        """根据激活的模组计算总属性"""
-        stats = self.base_stats.copy()
+    @staticmethod
+    def aggregate_bonus(mod_items):
+        """统计模组词条加成 {词条名: 总值}"""
         bonus = {}
-        
-        # 统计装备加成
         for item in mod_items:
             for affix in item.affixes:
                 name = affix["name"]
@@ -55,58 +110,79 @@ class PlayerLogic:
                 # **[注意] 忽略主词条系数Kmain，计算在别处处理**
                 
                 bonus[name] = bonus.get(name, 0) + value
-        
-        # --- 1. 基础生存属性计算 ---
-        
-        # 生命值 (生命% 为乘算，生命值为加算)
-        new_max_health = self.base_stats["基础生命值"] * (1 + bonus.get("生命%", 0)) + bonus.get("生命", 0)
-        stats["生命"] = new_max_health
-        # 调整当前生命
-        self.current_health = min(self.current_health, new_max_health)
+        return bonus
 
-        # 护甲 (基础护甲 + 词条护甲)
-        stats["护甲"] = self.base_stats["基础护甲"] + bonus.get("护甲", 0) 
-        
-        # 生命回复
-        stats["生命回复"] = bonus.get("生命回复", 0)
-        
-        # --- 2. 攻击属性计算 ---
-        
-        # 攻击力
-        stats["攻击力"] = self.base_stats["基础攻击力"] + bonus.get("攻击力", 0)
-        
-        # 射击速度 (线性叠加，有上限)
-        fire_rate_bonus = min(bonus.get("射击速度%", 0), cfg.MAX_FIRE_RATE_BONUS)
-        stats["射击速度%"] = fire_rate_bonus
-        stats["射速"] = self.base_stats["基础射击速度"] * (1 + fire_rate_bonus) # 内部使用射速，外部显示射击速度
-        
-        # 其他攻击属性
-        stats["暴击率"] = self.base_stats["基础暴击率"] + bonus.get("暴击率", 0)
-        stats["暴击伤害"] = self.base_stats["基础暴击伤害"] + bonus.get("暴击伤害", 0)
-        stats["攻击吸血"] = bonus.get("攻击吸血", 0)
-        stats["护甲穿透"] = bonus.get("护甲穿透", 0)
-        stats["射程"] = self.base_stats["基础射程"] + bonus.get("射程", 0)
-        
-        # 穿透数（初始值为0，表示子弹可以穿过几个敌人）
-        stats["穿透数"] = max(0, int(self.base_stats.get("基础穿透数", 0) + bonus.get("穿透数", 0)))
-        
-        # --- 3. 移动速度计算 ---
-        stats["移速"] = self.base_stats["基础移速"] * (1 + bonus.get("移速%", 0))
-        
-        # --- 4. 护甲减伤计算 (供显示) ---
-        armor = stats["护甲"]
-        # 使用配置中的 ARMOR_CONSTANT
-        armor_const = getattr(cfg, 'ARMOR_CONSTANT', 100)
-        # 线性减伤公式: DR = Armor / (Armor + K)
-        # 这里的 K = ARMOR_CONSTANT 
-        
-        # **[保留] 护甲减伤%计算 (用于面板显示)**
-        dr_pct = (armor / (armor + armor_const)) * 100
-        stats["伤害减免%"] = dr_pct
-        
+    def build_stats(self, bonus):
+        """根据词条加成 {词条名: 总值} 计算总属性字典（不修改玩家状态，可用于配装评估）"""
+        stats = self.base_stats.copy()
+        get_bonus = lambda name: bonus.get(name, 0)
+        for _, derive in _STAT_RULES:
+            stats.update(derive(self.base_stats, get_bonus))
+        return stats
+
+    def calculate_stats(self, mod_items):
+        """根据激活的模组全量计算总属性，并重建增量聚合器"""
+        self._bonus = [0] * len(self._bonus)
+        self._bonus_refs = [0] * len(self._bonus_refs)
+        for item in mod_items:
+            self._accumulate(item, 1)
+
+        stats = self.base_stats.copy()
+        for _, derive in _STAT_RULES:
+            stats.update(derive(self.base_stats, self._bonus_of))
+        # 调整当前生命
+        self.current_health = min(self.current_health, stats["生命"])
         # 存储结果
         self.total_stats = stats
 
+    def equip_item(self, item):
+        """装备一个模组：O(词条数) 更新加成，只重算受影响的派生属性"""
+        self._refresh(self._accumulate(item, 1))
+
+    def unequip_item(self, item):
+        """卸下一个模组：O(词条数) 更新加成，只重算受影响的派生属性"""
+        self._refresh(self._accumulate(item, -1))
+
+    def preview_equip(self, item):
+        """返回装备 item 后的总属性字典（不修改当前状态），用于拖放预览"""
+        dirty = self._accumulate(item, 1)
+        preview = dict(self.total_stats)
+        for index in dirty:
+            preview.update(_STAT_RULES[index][1](self.base_stats, self._bonus_of))
+        self._accumulate(item, -1)
+        return preview
+
+    def _bonus_of(self, name):
+        i = self._affix_ids.get(name)
+        return self._bonus[i] if i is not None else 0
+
+    def _accumulate(self, item, sign):
+        """将 item 的词条按 sign (+1/-1) 计入加成向量，返回需要重算的规则下标集合"""
+        dirty = set()
+        for affix in item.affixes:
+            name = affix["name"]
+            i = self._affix_ids.get(name)
+            if i is None:
+                # 配置之外的词条：动态分配编号
+                i = self._affix_ids[name] = len(self._bonus)
+                self._bonus.append(0)
+                self._bonus_refs.append(0)
+
+            self._bonus_refs[i] += sign
+            if self._bonus_refs[i] == 0:
+                self._bonus[i] = 0
+            else:
+                self._bonus[i] += sign * affix["value"]
+            dirty.update(_RULES_BY_AFFIX.get(name, ()))
+        return dirty
+
+    def _refresh(self, dirty):
+        stats = self.total_stats
+        for index in dirty:
+            stats.update(_STAT_RULES[index][1](self.base_stats, self._bonus_of))
+        # 调整当前生命
+        self.current_health = min(self.current_health, stats["生命"])
+
     def add_essence(self, amount):
         """增加源质"""
         self.current_essence += amount
@@ -139,28 +215,48 @@ class StatsPanelRenderer:
         "原生源质": "§ 源生源质",
     }
 
+    # 面板显示依赖的属性；这些值、当前生命或源质变化时才重新合成面板
+    DISPLAY_STAT_KEYS = ("攻击力", "射击速度%", "射速", "暴击率", "暴击伤害", "护甲穿透", "射程", "穿透数",
+                         "生命", "护甲", "伤害减免%", "生命回复", "移速", "攻击吸血")
+
     def __init__(self, fonts):
         self.fonts = fonts
+        self._panel_surface = None
+        self._panel_key = None
 
-    def draw(self, surface, rect, player_logic):
+    def draw(self, surface, rect, player_logic, stats=None):
         """
         绘制属性面板
+        stats 不为 None 时显示该属性字典（如拖放预览），否则显示 player_logic.total_stats
         """
-        draw_rect = pygame.Rect(rect.x, rect.y, STAT_PANEL_FIXED_WIDTH, STAT_PANEL_FIXED_HEIGHT)
+        if stats is None:
+            stats = player_logic.total_stats
+
+        key = (tuple(stats.get(name, 0) for name in self.DISPLAY_STAT_KEYS),
+               player_logic.current_health, player_logic.current_essence, self.fonts["main"])
+        if self._panel_surface is None or key != self._panel_key:
+            self._panel_surface = self._compose(stats, player_logic)
+            self._panel_key = key
+
+        surface.blit(self._panel_surface, (rect.x, rect.y))
+
+    def _compose(self, stats, player_logic):
+        """将属性面板合成为一张 Surface"""
+        panel = pygame.Surface((STAT_PANEL_FIXED_WIDTH, STAT_PANEL_FIXED_HEIGHT))
+        draw_rect = panel.get_rect()
         
         # 背景
-        pygame.draw.rect(surface, (30, 30, 40), draw_rect)
-        pygame.draw.rect(surface, cfg.COLOR_GRID, draw_rect, 2)
+        pygame.draw.rect(panel, (30, 30, 40), draw_rect)
+        pygame.draw.rect(panel, cfg.COLOR_GRID, draw_rect, 2)
         
         y = draw_rect.y + 10
         content_start_x = draw_rect.x + 10 + CONTENT_OFFSET_X
         font = self.fonts["main"]
-        stats = player_logic.total_stats
         
         # --- 标题 ---
         title_text = render_text(font, "幸存者", cfg.COLOR_TEXT_HEADER, bold=True)
         title_x = draw_rect.x + (draw_rect.width - title_text.get_width()) // 2
-        surface.blit(title_text, (title_x, y))
+        panel.blit(title_text, (title_x, y))
         y += 40
         
         val_color = cfg.COLOR_TEXT
@@ -170,7 +266,7 @@ class StatsPanelRenderer:
         for name in offense_stats:
             display_name = self.STAT_SYMBOLS.get(name, name)
             name_text = render_text(font, display_name + ":", cfg.COLOR_STAT_OFFENSE)
-            surface.blit(name_text, (content_start_x, y))
+            panel.blit(name_text, (content_start_x, y))
             
             val_str = ""
             if name == "攻击力":
@@ -205,12 +301,12 @@ class StatsPanelRenderer:
                     val_str = f"{range_val}"
             
             val_text = render_text(font, val_str, val_color)
-            surface.blit(val_text, (content_start_x + 120, y))
+            panel.blit(val_text, (content_start_x + 120, y))
             y += 25
 
         # 分割线
         y += 5
-        pygame.draw.line(surface, cfg.COLOR_GRID, (content_start_x - 10, y), (draw_rect.right - 10, y), 1)
+        pygame.draw.line(panel, cfg.COLOR_GRID, (content_start_x - 10, y), (draw_rect.right - 10, y), 1)
         y += 15
 
         # --- 防御属性 (绿色) ---
@@ -218,7 +314,7 @@ class StatsPanelRenderer:
         for name in defense_stats:
             display_name = self.STAT_SYMBOLS.get(name, name)
             name_text = render_text(font, display_name + ":", cfg.COLOR_STAT_DEFENSE)
-            surface.blit(name_text, (content_start_x, y))
+            panel.blit(name_text, (content_start_x, y))
             
             val_str = ""
             if name == "生命":
@@ -238,20 +334,22 @@ class StatsPanelRenderer:
                 val_str = f"{stats.get('攻击吸血', 0):.1%}" # **[修改] 属性名**
 
             val_text = render_text(font, val_str, val_color)
-            surface.blit(val_text, (content_start_x + 120, y))
+            panel.blit(val_text, (content_start_x + 120, y))
             y += 25
             
         # 分割线
         y += 5
-        pygame.draw.line(surface, cfg.COLOR_GRID, (content_start_x - 10, y), (draw_rect.right - 10, y), 1)
+        pygame.draw.line(panel, cfg.COLOR_GRID, (content_start_x - 10, y), (draw_rect.right - 10, y), 1)
         y += 15
         
         # --- 源质 (紫色) ---
         name = "原生源质"
         display_name = self.STAT_SYMBOLS.get(name, name)
         name_text = render_text(font, display_name + ":", cfg.COLOR_STAT_ESSENCE)
-        surface.blit(name_text, (content_start_x, y))
+        panel.blit(name_text, (content_start_x, y))
 
         val_str = f"{int(player_logic.current_essence)}"
         val_text = render_text(font, val_str, val_color)
-        surface.blit(val_text, (content_start_x + 120, y))
\ No newline at end of file
+        panel.blit(val_text, (content_start_x + 120, y))
+
+        return panel
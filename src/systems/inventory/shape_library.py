@@ -0,0 +1,172 @@
+# shape_library.py
+# 预计算的周长最优多联骨牌形状库。
+# ModItem 从库中均匀抽取形状，替代运行时的随机生长 + 爬山优化。
+#
+# 重新生成数据文件：
+#     cd src/systems/inventory
+#     python shape_library.py
+
+import itertools
+import json
+import random
+import sys
+import os
+
+# 添加路径以便导入
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+try:
+    from systems.inventory import config as cfg
+    from systems.inventory.utils import check_dims_constraint
+except ImportError as e:
+    print(f"错误：shape_library.py 导入失败: {e}")
+    import traceback
+    traceback.print_exc()
+    sys.exit()
+
+# 数据文件与本模块放在同一目录
+SHAPE_LIBRARY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shape_library.json")
+SHAPE_LIBRARY_VERSION = 1
+
+# 库覆盖的格数范围：所有品质 c_range 的并集
+MAX_LIBRARY_CELLS = max(s["c_range"][1] for s in cfg.QUALITY_SETTINGS.values())
+
+_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+# {N: [frozenset((r, c), ...), ...]}，首次使用时加载
+_library = None
+
+
+# --- 编码 ---
+
+def encode_shape(cells):
+    """将单元格集合编码为逐行位掩码列表（第 c 位表示第 c 列）。"""
+    height = max(r for r, c in cells) + 1
+    masks = [0] * height
+    for r, c in cells:
+        masks[r] |= 1 << c
+    return masks
+
+def decode_shape(row_masks):
+    """将逐行位掩码列表解码为单元格 frozenset。"""
+    cells = []
+    for r, mask in enumerate(row_masks):
+        c = 0
+        while mask:
+            if mask & 1:
+                cells.append((r, c))
+            mask >>= 1
+            c += 1
+    return frozenset(cells)
+
+
+# --- 枚举 ---
+
+def _min_semi_perimeter(N):
+    """N 格形状可达到的最小半周长：满足 h*w >= N 的最小 h+w。"""
+    return min(h + w for h in range(1, N + 1) for w in range(1, N + 1) if h * w >= N)
+
+def _is_connected(cells):
+    start = next(iter(cells))
+    seen = {start}
+    stack = [start]
+    while stack:
+        r, c = stack.pop()
+        for dr, dc in _DIRECTIONS:
+            n = (r + dr, c + dc)
+            if n in cells and n not in seen:
+                seen.add(n)
+                stack.append(n)
+    return len(seen) == len(cells)
+
+def enumerate_optimal_shapes(N, max_dim=cfg.MOD_PANEL_ROWS):
+    """
+    枚举所有周长最优的 N 格固定多联骨牌（不同朝向视为不同形状）。
+
+    周长不小于边界框周长 2(h+w)，因此最优形状的边界框半周长必然等于
+    _min_semi_perimeter(N)，只需在这些边界框内枚举占满所有行列的连通子集。
+    """
+    s = _min_semi_perimeter(N)
+    target_perimeter = 2 * s
+    shapes = []
+
+    for h in range(1, s):
+        w = s - h
+        if h * w < N:
+            continue
+        box = [(r, c) for r in range(h) for c in range(w)]
+        for combo in itertools.combinations(box, N):
+            cells = frozenset(combo)
+            if len({r for r, c in cells}) != h or len({c for r, c in cells}) != w:
+                continue
+            perimeter = sum(1 for r, c in cells for dr, dc in _DIRECTIONS if (r + dr, c + dc) not in cells)
+            if perimeter != target_perimeter:
+                continue
+            if not _is_connected(cells):
+                continue
+            if not check_dims_constraint(cells, max_dim):
+                continue
+            shapes.append(cells)
+
+    return shapes
+
+def build_shape_library(max_cells=MAX_LIBRARY_CELLS):
+    """构建 {N: [形状, ...]}，N = 1..max_cells。"""
+    return {N: enumerate_optimal_shapes(N) for N in range(1, max_cells + 1)}
+
+
+# --- 持久化 ---
+
+def save_shape_library(library, path=SHAPE_LIBRARY_PATH):
+    """将形状库写入紧凑的 JSON 数据文件。"""
+    data = {
+        "version": SHAPE_LIBRARY_VERSION,
+        "max_dim": cfg.MOD_PANEL_ROWS,
+        "shapes": {
+            str(N): sorted(encode_shape(cells) for cells in shapes)
+            for N, shapes in sorted(library.items())
+        },
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+        f.write("\n")
+
+def load_shape_library(path=SHAPE_LIBRARY_PATH):
+    """
+    读取形状库数据文件。
+    文件缺失、版本不符或尺寸约束与当前配置不一致时，在内存中重新枚举。
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") == SHAPE_LIBRARY_VERSION and data.get("max_dim") == cfg.MOD_PANEL_ROWS:
+            return {
+                int(N): [decode_shape(masks) for masks in shapes]
+                for N, shapes in data["shapes"].items()
+            }
+        print("警告：形状库数据文件与当前配置不一致，重新枚举。")
+    except (OSError, ValueError, KeyError) as e:
+        print(f"警告：无法读取形状库 {path}: {e}，重新枚举。")
+    return build_shape_library()
+
+def get_shape_library():
+    """返回已加载的形状库（进程内只加载一次）。"""
+    global _library
+    if _library is None:
+        _library = load_shape_library()
+    return _library
+
+def get_random_shape(N, rng=random):
+    """从库中均匀抽取一个 N 格形状；库中没有该格数时返回 None。"""
+    shapes = get_shape_library().get(N)
+    if not shapes:
+        return None
+    return rng.choice(shapes)
+
+
+if __name__ == "__main__":
+    library = build_shape_library()
+    save_shape_library(library)
+    for N, shapes in sorted(library.items()):
+        print(f"N={N:2d}: {len(shapes)} 种形状")
+    print(f"已写入 {SHAPE_LIBRARY_PATH}")
@@ -3,31 +3,89 @@
 import pygame
 import sys
 import os
+from collections import OrderedDict
 
 # 添加路径以便导入
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 try:
     from systems.inventory import config as cfg
+    from systems.inventory.bitboard import Bitboard, compile_shape
 except ImportError:
-    print("错误：ui_elements.py 无法导入 config.py。")
+    print("错误：ui_elements.py 无法导入 config.py / bitboard.py。")
     import traceback
     traceback.print_exc()
     sys.exit()
 
+# --- 文本缓存 ---
+
+class TextCache:
+    """
+    已渲染文本 Surface 的 LRU 缓存，键为 (字体, 文本, 颜色, 粗体, 斜体, 抗锯齿)。
+    返回的 Surface 为共享对象，调用方只能 blit，不得修改。
+    """
+    def __init__(self, max_size=cfg.TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color, bold=False, italic=False, antialias=True):
+        key = (font, text, tuple(color), bold, italic, antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            return surf
+
+        font.set_bold(bold)
+        font.set_italic(italic)
+        surf = font.render(text, antialias, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+# 进程内共享的文本缓存
+text_cache = TextCache()
+
 # --- 辅助函数 ---
 
 def render_text(font, text, color, bold=False, italic=False, antialias=True):
-    """渲染文本"""
-    font.set_bold(bold)
-    font.set_italic(italic)
-    return font.render(text, antialias, color)
+    """渲染文本（经 LRU 缓存，返回的 Surface 只读）"""
+    return text_cache.render(font, text, color, bold, italic, antialias)
+
+# 提示框缓存：(物品, 词缀元组, 字体表, 合成好的 Surface)
+# 悬停物品变化或词缀被重新生成（精炼后为新的元组）时重新合成
+_tooltip_cache = [None, None, None, None]
 
 def draw_tooltip(surface, item, x, y, fonts):
-    """绘制物品悬停提示框"""
+    """绘制物品悬停提示框（合成结果按悬停物品缓存，每帧只做定位和一次 blit）"""
     if not item:
         return
 
+    cached_item, cached_affixes, cached_fonts, tooltip_surface = _tooltip_cache
+    if cached_item is not item or cached_affixes is not item.affixes or cached_fonts is not fonts:
+        tooltip_surface = _compose_tooltip(item, fonts)
+        _tooltip_cache[:] = [item, item.affixes, fonts, tooltip_surface]
+    if tooltip_surface is None:
+        return
+
+    # 调整位置，防止出界
+    bg_rect = tooltip_surface.get_rect(topleft=(x + 15, y + 15))
+    screen_w, screen_h = surface.get_size()
+    if bg_rect.right > screen_w:
+        bg_rect.right = x - 15
+    if bg_rect.bottom > screen_h:
+        bg_rect.bottom = y - 15
+
+    surface.blit(tooltip_surface, bg_rect.topleft)
+
+def _compose_tooltip(item, fonts):
+    """合成物品提示框 Surface（不含定位）"""
     font_main = fonts["main"]
     font_small = fonts["small"]
     font_affix_main = fonts["affix_main"]
@@ -86,7 +144,7 @@ def draw_tooltip(surface, item, x, y, fonts):
 
     # 2. 计算背景框大小
     all_texts = header_texts + main_affix_texts + other_affix_texts
-    if not all_texts: return
+    if not all_texts: return None
     
     max_w = max(t.get_width() for t in all_texts)
     
@@ -97,16 +155,8 @@ def draw_tooltip(surface, item, x, y, fonts):
     
     padding = 10
     bg_rect = pygame.Rect(0, 0, max_w + padding * 2, total_h + padding * 2)
-    
-    # 3. 调整位置，防止出界
-    bg_rect.topleft = (x + 15, y + 15)
-    screen_w, screen_h = surface.get_size()
-    if bg_rect.right > screen_w:
-        bg_rect.right = x - 15
-    if bg_rect.bottom > screen_h:
-        bg_rect.bottom = y - 15
         
-    # 4. 绘制
+    # 3. 绘制
     tooltip_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
     tooltip_surface.fill(cfg.COLOR_TOOLTIP_BG)
     pygame.draw.rect(tooltip_surface, item.color, (0, 0, bg_rect.width, bg_rect.height), 1)
@@ -136,7 +186,7 @@ def draw_tooltip(surface, item, x, y, fonts):
         tooltip_surface.blit(text, (padding, current_y))
         current_y += text.get_height() + 5
         
-    surface.blit(tooltip_surface, bg_rect.topleft)
+    return tooltip_surface
 
 def draw_context_menu(surface, menu_data, font):
     """
@@ -184,19 +234,31 @@ def draw_context_menu(surface, menu_data, font):
 
 # --- 核心UI类 (GridPanel, Button) 保持不变 ---
 class GridPanel:
-    """代表一个网格区域 (强化面板或背包)"""
+    """
+    代表一个网格区域 (强化面板或背包)
+    占用情况以逐行位掩码 (Bitboard) 存储，grid_data 仅用于按格子查找物品。
+    """
     def __init__(self, rect, rows, cols):
         self.rect = pygame.Rect(rect)
         self.rows = rows
         self.cols = cols
         self.cell_size = cfg.CELL_SIZE
         self.grid_data = [[None for _ in range(cols)] for _ in range(rows)]
+        self.occupancy = Bitboard(rows, cols)
         self.items = {} # {item: (r, c)}
+        self._placed_shapes = {} # {item: 放置时的 CompiledShape}（物品放置后可能被旋转）
 
     def update_rect(self, rect):
         """更新矩形位置 (用于缩放)"""
         self.rect = pygame.Rect(rect)
 
+    def clear(self):
+        """清空所有物品"""
+        self.items = {}
+        self._placed_shapes = {}
+        self.grid_data = [[None for _ in range(self.cols)] for _ in range(self.rows)]
+        self.occupancy.clear()
+
     def screen_to_grid(self, screen_x, screen_y):
         """将屏幕坐标转换为网格坐标 (row, col)"""
         if not self.rect.collidepoint(screen_x, screen_y):
@@ -226,14 +288,17 @@ class GridPanel:
 
     def is_valid_placement(self, item, row, col, item_to_ignore=None):
         """检查物品是否可以放置在 (row, col)"""
-        for (r, c) in item.shape:
-            grid_r, grid_c = row + r, col + c
-            if not (0 <= grid_r < self.rows and 0 <= grid_c < self.cols):
-                return False
-            existing_item = self.grid_data[grid_r][grid_c]
-            if existing_item and existing_item != item_to_ignore:
-                return False
-        return True
+        shape = compile_shape(item.shape)
+        if item_to_ignore is None or item_to_ignore not in self.items:
+            return self.occupancy.fits(shape, row, col)
+
+        # 忽略指定物品：暂时释放它放置时占用的格子（而非当前形状，物品可能已被旋转）再检查
+        placed = self._placed_shapes[item_to_ignore]
+        ignore_r, ignore_c = self.items[item_to_ignore]
+        self.occupancy.remove(placed, ignore_r, ignore_c)
+        valid = self.occupancy.fits(shape, row, col)
+        self.occupancy.place(placed, ignore_r, ignore_c)
+        return valid
 
     def add_item(self, item, row, col):
         """在 (row, col) 放置物品"""
@@ -243,28 +308,27 @@ class GridPanel:
         if item in self.items:
             self.remove_item(item)
             
+        shape = compile_shape(item.shape)
         self.items[item] = (row, col)
+        self._placed_shapes[item] = shape
+        self.occupancy.place(shape, row, col)
         for (r, c) in item.shape:
             self.grid_data[row + r][col + c] = item
         return True
     
     def find_first_empty_slot(self, item):
-        """查找第一个能放下物品的空位"""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.is_valid_placement(item, r, c):
-                    return (r, c)
-        return None
+        """查找第一个能放下物品的空位（行优先，逐行位运算扫描）"""
+        return self.occupancy.find_first_fit(compile_shape(item.shape))
 
     def remove_item(self, item):
         """从网格中移除物品"""
         if item in self.items:
             base_r, base_c = self.items[item]
-            for (r, c) in item.shape:
-                grid_r, grid_c = base_r + r, base_c + c
-                if 0 <= grid_r < self.rows and 0 <= grid_c < self.cols:
-                    if self.grid_data[grid_r][grid_c] == item:
-                        self.grid_data[grid_r][grid_c] = None
+            # 按放置时的形状清理（物品放置后可能被旋转）
+            placed = self._placed_shapes.pop(item)
+            for (r, c) in placed.cells:
+                self.grid_data[base_r + r][base_c + c] = None
+            self.occupancy.remove(placed, base_r, base_c)
             del self.items[item]
             return True
         return False
@@ -83,9 +83,34 @@ def calculate_perimeter_for_set(cells_set):
 
 # --- 周长优化算法核心 ---
 
+def _count_neighbors(cell, cells_set):
+    """统计 cell 的四邻域中属于 cells_set 的格子数。"""
+    r, c = cell
+    return ((r - 1, c) in cells_set) + ((r + 1, c) in cells_set) + \
+           ((r, c - 1) in cells_set) + ((r, c + 1) in cells_set)
+
+def _axis_extent_after_move(counts, sorted_keys, remove_key, add_key):
+    """
+    计算在某一轴上移除 remove_key、加入 add_key 之后的跨度 (max - min + 1)。
+    counts 为该轴上每个坐标的格子数，sorted_keys 为其升序坐标列表。
+    """
+    lo = sorted_keys[0]
+    hi = sorted_keys[-1]
+    if counts[remove_key] == 1:
+        if remove_key == lo:
+            lo = sorted_keys[1] if len(sorted_keys) > 1 else add_key
+        if remove_key == hi:
+            hi = sorted_keys[-2] if len(sorted_keys) > 1 else add_key
+    return max(hi, add_key) - min(lo, add_key) + 1
+
 def optimize_polyomino(initial_cells, max_moves=100):
     """
     通过局部移动优化 N-omino 的形状，最小化其周长，并检查尺寸约束。
+
+    每个候选移动 (移除 a, 加入相邻的 b) 的周长变化只取决于 a、b 的四邻域：
+    周长 = 4N - 2 * 相邻对数，因此 新周长 - 旧周长 = 2 * (n_a - n_b + 1)，
+    其中 n_a、n_b 为 a、b 在当前形状中的邻居数（b 与 a 相邻，n_b 含 a）。
+    边界框尺寸同样由逐行/逐列计数增量得到，无需复制集合。
     """
     current_cells = initial_cells.copy()
     current_perimeter = calculate_perimeter_for_set(current_cells) 
@@ -98,8 +123,18 @@ def optimize_polyomino(initial_cells, max_moves=100):
         
         removable_cells = list(current_cells)
         random.shuffle(removable_cells)
+
+        # 本轮不变的统计量：每行/每列格子数及排序后的坐标
+        row_counts = {}
+        col_counts = {}
+        for r, c in current_cells:
+            row_counts[r] = row_counts.get(r, 0) + 1
+            col_counts[c] = col_counts.get(c, 0) + 1
+        sorted_rows = sorted(row_counts)
+        sorted_cols = sorted(col_counts)
         
         for r_remove, c_remove in removable_cells:
+            n_remove = _count_neighbors((r_remove, c_remove), current_cells)
             
             for dr, dc in directions:
                 r_add, c_add = r_remove + dr, c_remove + dc
@@ -107,17 +142,15 @@ def optimize_polyomino(initial_cells, max_moves=100):
                 if (0 <= r_add < GRID_SIZE and 0 <= c_add < GRID_SIZE and 
                     (r_add, c_add) not in current_cells):
 
-                    new_cells = current_cells.copy()
-                    new_cells.remove((r_remove, c_remove))
-                    new_cells.add((r_add, c_add))
-                    
                     # 关键检查 1: 确保新形状满足尺寸限制
-                    if not check_dims_constraint(new_cells):
+                    height = _axis_extent_after_move(row_counts, sorted_rows, r_remove, r_add)
+                    width = _axis_extent_after_move(col_counts, sorted_cols, c_remove, c_add)
+                    if not (height <= MOD_PANEL_ROWS or width <= MOD_PANEL_ROWS):
                         continue
                         
-                    # 优化检查：新周长是否更好
-                    new_perimeter = calculate_perimeter_for_set(new_cells)
-                    reduction = current_perimeter - new_perimeter
+                    # 优化检查：新周长是否更好（由局部邻域增量计算）
+                    n_add = _count_neighbors((r_add, c_add), current_cells)
+                    reduction = 2 * (n_add - 1 - n_remove)
                     
                     if reduction > best_perimeter_reduction:
                         best_perimeter_reduction = reduction
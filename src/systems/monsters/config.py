@@ -34,6 +34,7 @@ MONSTER_SKILL_PARAMS = {
     "Wanderer_Summoner_Cooldown": 20.0,  # 呼唤者：召唤冷却 (秒)
     "Wanderer_Summoner_Count_Min": 3,  # 呼唤者：最少召唤数量
     "Wanderer_Summoner_Count_Max": 5,  # 呼唤者：最多召唤数量
+    "Wanderer_Summoner_Check_Interval": 0.25,  # 呼唤者：冷却就绪但玩家不在范围内时的复查间隔 (秒)
     "Wanderer_Undying_Duration": 10.0, # 不死者：残躯持续时间 (秒)
     
     # 铁桶 (Bucket)
@@ -0,0 +1,43 @@
+# damage_result.py
+"""
+怪物受伤结果记录。每个怪物持有一份 DamageResult，每次 take_damage 时重置并返回，
+受伤过程不再分配字典；调用方需在该怪物下一次受伤前读取完毕。
+"""
+
+
+class DamageResult:
+    """
+    单次受伤的结果（__slots__，按怪物复用）。
+    兼容旧的字典写法：result['died'] / result.get('reflected_damage', 0)。
+    """
+    __slots__ = ("blocked", "evaded", "actual_damage", "died", "will_revive",
+                 "reflected_damage", "reflect_source", "undying_triggered", "undying_active")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.blocked = False            # 是否被格挡
+        self.evaded = False             # 是否被闪避
+        self.actual_damage = 0          # 实际伤害
+        self.died = False               # 是否死亡
+        self.will_revive = False        # 是否会复活（游荡者重生）
+        self.reflected_damage = 0       # 荆棘守卫反弹的伤害
+        self.reflect_source = None      # 反弹来源位置
+        self.undying_triggered = False  # 本次受伤触发了不死者
+        self.undying_active = False     # 处于残躯状态（不受伤害）
+        return self
+
+    def __getitem__(self, key):
+        if key not in DamageResult.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        if key not in DamageResult.__slots__:
+            return default
+        return getattr(self, key)
+
+    def __repr__(self):
+        return (f"DamageResult(actual_damage={self.actual_damage!r}, blocked={self.blocked}, "
+                f"evaded={self.evaded}, died={self.died}, will_revive={self.will_revive})")
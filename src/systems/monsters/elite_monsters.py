@@ -5,6 +5,8 @@
 """
 import random
 import pygame
+import config as game_config
+from systems.combat_log import combat_log, MONSTER_HIT, REFLECT, UNDYING, UNDYING_END
 from systems.monsters.monster_types import Wanderer, Bucket, Ghoul
 from systems.monsters import config as mcfg
 
@@ -26,7 +28,6 @@ class EliteWanderer(Wanderer):
             self.summon_cooldown = mcfg.MONSTER_SKILL_PARAMS['Wanderer_Summoner_Cooldown']
         elif elite_type == 'undying':
             self.undying_active = False
-            self.undying_start_time = 0.0
             self.undying_duration = mcfg.MONSTER_SKILL_PARAMS['Wanderer_Undying_Duration']
     
     def _get_elite_skills(self):
@@ -69,52 +70,40 @@ class EliteWanderer(Wanderer):
         """
         # 如果已经在残躯状态，不受伤害
         if self.elite_type == 'undying' and self.undying_active:
-            return {
-                'blocked': False,
-                'evaded': False,
-                'actual_damage': 0,
-                'died': False,
-                'will_revive': False,
-                'undying_active': True
-            }
+            result = self.new_damage_result()
+            result.undying_active = True
+            return result
         
         # 调用基类处理（包括重生逻辑）
         result = super().take_damage(damage, damage_source)
         
         # 如果死亡且没有触发重生，检查不死者技能
-        if result['died'] and not result.get('will_revive', False):
+        if result.died and not result.will_revive:
             if self.elite_type == 'undying' and not self.undying_active:
                 # 激活残躯状态
-                self.undying_active = True
-                self.undying_start_time = pygame.time.get_ticks() / 1000.0
+                self.undying_active = True  # 结束时间由 Game 的定时器登记
                 self.is_alive = True  # 保持存活
                 self.current_hp = 1  # 保持1点血
-                result['died'] = False
-                result['undying_triggered'] = True
+                result.died = False
+                result.undying_triggered = True
                 
-                import config as game_config
                 if game_config.DEBUG_COMBAT_LOG:
-                    print(f"[COMBAT] {self.name} 触发不死者！进入残躯状态 {self.undying_duration}秒", flush=True)
+                    combat_log.emit(UNDYING, self.name, self.undying_duration)
         
         return result
     
-    def update_undying(self, current_time):
-        """更新残躯状态，返回是否应该死亡"""
+    def end_undying(self):
+        """残躯时间结束，真正死亡（由定时器在 undying_duration 秒后调用），返回是否应该移除"""
         if not self.undying_active:
             return False
         
-        # 检查残躯时间是否结束
-        if current_time - self.undying_start_time >= self.undying_duration:
-            self.undying_active = False
-            self.is_alive = False
-            self.current_hp = 0
-            
-            import config as game_config
-            if game_config.DEBUG_COMBAT_LOG:
-                print(f"[COMBAT] {self.name} 残躯时间结束，真正死亡", flush=True)
-            return True
+        self.undying_active = False
+        self.is_alive = False
+        self.current_hp = 0
         
-        return False
+        if game_config.DEBUG_COMBAT_LOG:
+            combat_log.emit(UNDYING_END, self.name)
+        return True
 
 
 class EliteBucket(Bucket):
@@ -205,14 +194,7 @@ class EliteBucket(Bucket):
         - 荆棘守卫：取消格挡，改为反弹伤害
         """
         if not self.is_alive or self.is_reviving:
-            return {
-                'blocked': False,
-                'evaded': False,
-                'actual_damage': 0,
-                'died': False,
-                'will_revive': False,
-                'reflected_damage': 0
-            }
+            return self.new_damage_result()
         
         current_time = pygame.time.get_ticks() / 1000.0
         
@@ -224,33 +206,26 @@ class EliteBucket(Bucket):
                 reflected_damage = damage * reflect_factor
                 self.activate_thornguard(current_time)
                 
-                import config as game_config
                 if game_config.DEBUG_COMBAT_LOG:
-                    print(f"[COMBAT] {self.name} 荆棘守卫反弹 {reflected_damage:.1f} 伤害！", flush=True)
+                    combat_log.emit(REFLECT, self.name, reflected_damage)
             
             # 受到全额伤害
             self.current_hp -= damage
             
-            import config as game_config
             if game_config.DEBUG_COMBAT_LOG:
-                print(f"[COMBAT] {self.name} 受到 {damage:.1f} 伤害 - HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+                combat_log.emit(MONSTER_HIT, self.name, damage, self.current_hp, self.max_hp)
             
             # 判定死亡
-            died = False
+            result = self.new_damage_result()
+            result.actual_damage = damage
+            result.reflected_damage = reflected_damage
+            result.reflect_source = self.position if reflected_damage > 0 else None
             if self.current_hp <= 0:
                 self.current_hp = 0
                 self.is_alive = False
-                died = True
+                result.died = True
             
-            return {
-                'blocked': False,
-                'evaded': False,
-                'actual_damage': damage,
-                'died': died,
-                'will_revive': False,
-                'reflected_damage': reflected_damage,
-                'reflect_source': self.position if reflected_damage > 0 else None
-            }
+            return result
         
         # 庞然或普通：使用基类的格挡逻辑
         return super().take_damage(damage, damage_source)
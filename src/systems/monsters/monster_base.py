@@ -10,6 +10,9 @@ import os
 # 添加父目录到路径以便导入config
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+import config as game_config
+from systems.combat_log import combat_log, MONSTER_HIT
+from systems.monsters.damage_result import DamageResult
 # 导入自身目录下的配置
 from systems.monsters import config as mcfg 
 
@@ -45,6 +48,7 @@ class MonsterBase:
         # 防御技能冷却
         self.last_block_time = -999  # 铁桶格挡冷却
         self.cached_armor_bonus = 0  # 铁甲光环缓存的护甲加成
+        self._damage_result = DamageResult()  # 受伤结果（每次受伤重置复用）
         
     def _get_display_name(self):
         """返回更友好的名称 - 子类可以重写"""
@@ -93,13 +97,11 @@ class MonsterBase:
     
     def _get_attack_range(self):
         """获取怪物的攻击范围"""
-        import config
-        return config.MONSTER_ATTACK_RANGE.get(self.type, 50)
+        return game_config.MONSTER_ATTACK_RANGE.get(self.type, 50)
     
     def _get_attack_cooldown(self):
         """获取怪物的攻击冷却时间"""
-        import config
-        return config.MONSTER_ATTACK_COOLDOWN.get(self.type, 1.5)
+        return game_config.MONSTER_ATTACK_COOLDOWN.get(self.type, 1.5)
     
     def can_attack(self, monster_world_pos, target_pos, current_time, last_attack_time):
         """
@@ -184,6 +186,10 @@ class MonsterBase:
         
         return attack_info
     
+    def new_damage_result(self):
+        """重置并返回本怪物复用的 DamageResult"""
+        return self._damage_result.reset()
+    
     def take_damage(self, damage, damage_source="未知"):
         """
         怪物受到伤害，触发防御技能判定
@@ -194,47 +200,29 @@ class MonsterBase:
             damage_source: 伤害来源
         
         Returns:
-            dict: {
-                'blocked': bool,  # 是否被格挡
-                'evaded': bool,   # 是否被闪避
-                'actual_damage': float,  # 实际伤害
-                'died': bool,  # 是否死亡
-                'will_revive': bool  # 是否会复活
-            }
+            DamageResult: 本怪物复用的结果记录（blocked / evaded / actual_damage / died / will_revive 等），
+            在下一次受伤时会被重置
         """
+        result = self.new_damage_result()
         if not self.is_alive or self.is_reviving:
-            return {
-                'blocked': False,
-                'evaded': False,
-                'actual_damage': 0,
-                'died': False,
-                'will_revive': False
-            }
+            return result
         
         # 扣除生命值
         actual_damage = damage
         self.current_hp -= actual_damage
         
         # Debug日志
-        import config as game_config
         if game_config.DEBUG_COMBAT_LOG:
-            print(f"[COMBAT] {self.name} 受到 {actual_damage:.1f} 伤害 - HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+            combat_log.emit(MONSTER_HIT, self.name, actual_damage, self.current_hp, self.max_hp)
         
         # 判定死亡
-        died = False
-        will_revive = False
+        result.actual_damage = actual_damage
         if self.current_hp <= 0:
             self.current_hp = 0
             self.is_alive = False
-            died = True
+            result.died = True
         
-        return {
-            'blocked': False,
-            'evaded': False,
-            'actual_damage': actual_damage,
-            'died': died,
-            'will_revive': will_revive
-        }
+        return result
     
     # --- 信息查询接口 ---
     def get_info(self):
@@ -7,6 +7,11 @@ import os
 # 添加父目录到路径以便导入config
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+import pygame
+
+import config as game_config
+from systems.combat_log import combat_log, MONSTER_HIT, MONSTER_BLOCK, MONSTER_EVADE
+from systems.monsters.damage_result import DamageResult
 # 导入自身目录下的配置
 from systems.monsters import config as mcfg 
 
@@ -42,6 +47,7 @@ class Monster:
         # 防御技能冷却
         self.last_block_time = -999  # 铁桶格挡冷却
         self.cached_armor_bonus = 0  # 铁甲光环缓存的护甲加成
+        self._damage_result = DamageResult()  # 受伤结果（每次受伤重置复用）
         
     def _get_display_name(self):
         """返回更友好的名称"""
@@ -160,19 +166,11 @@ class Monster:
     
     def _get_attack_range(self):
         """获取怪物的攻击范围"""
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-        import config
-        return config.MONSTER_ATTACK_RANGE.get(self.type, 50)
+        return game_config.MONSTER_ATTACK_RANGE.get(self.type, 50)
     
     def _get_attack_cooldown(self):
         """获取怪物的攻击冷却时间"""
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-        import config
-        return config.MONSTER_ATTACK_COOLDOWN.get(self.type, 1.5)
+        return game_config.MONSTER_ATTACK_COOLDOWN.get(self.type, 1.5)
     
     def can_attack(self, monster_world_pos, target_pos, current_time, last_attack_time):
         """
@@ -195,7 +193,6 @@ class Monster:
             return False
         
         # 检查距离（使用世界坐标）
-        import math
         dx = target_pos[0] - monster_world_pos[0]
         dy = target_pos[1] - monster_world_pos[1]
         distance = math.sqrt(dx*dx + dy*dy)
@@ -292,25 +289,12 @@ class Monster:
             damage_source: 伤害来源
         
         Returns:
-            dict: {
-                'blocked': bool,  # 是否被格挡
-                'evaded': bool,   # 是否被闪避
-                'actual_damage': float,  # 实际伤害
-                'died': bool,  # 是否死亡
-                'will_revive': bool  # 是否会复活
-            }
+            DamageResult: 本怪物复用的结果记录（blocked / evaded / actual_damage / died / will_revive），
+            在下一次受伤时会被重置
         """
+        result = self._damage_result.reset()
         if not self.is_alive or self.is_reviving:
-            return {
-                'blocked': False,
-                'evaded': False,
-                'actual_damage': 0,
-                'died': False,
-                'will_revive': False
-            }
-        
-        import random
-        import pygame
+            return result
         
         blocked = False
         evaded = False
@@ -339,40 +323,31 @@ class Monster:
         self.current_hp -= actual_damage
         
         # Debug日志
-        import sys
-        import os
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-        import config as game_config
         if game_config.DEBUG_COMBAT_LOG:
             if blocked:
-                print(f"[COMBAT] {self.name} 格挡！受到 {actual_damage:.1f} 伤害（原始：{damage:.1f}，减免90%）- HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+                combat_log.emit(MONSTER_BLOCK, self.name, actual_damage, damage, self.current_hp, self.max_hp)
             elif evaded:
-                print(f"[COMBAT] {self.name} 闪避！完全躲开攻击 - HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+                combat_log.emit(MONSTER_EVADE, self.name, self.current_hp, self.max_hp)
             else:
-                print(f"[COMBAT] {self.name} 受到 {actual_damage:.1f} 伤害 - HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+                combat_log.emit(MONSTER_HIT, self.name, actual_damage, self.current_hp, self.max_hp)
         
         # 判定死亡
-        died = False
-        will_revive = False
+        result.blocked = blocked
+        result.evaded = evaded
+        result.actual_damage = actual_damage
         if self.current_hp <= 0:
             self.current_hp = 0
             self.is_alive = False
-            died = True
+            result.died = True
             
             # 游荡者：复活判定
             if self.type == "Wanderer" and not self.has_revived:
-                will_revive = True
+                result.will_revive = True
                 self.is_reviving = True
                 self.revive_timer = mcfg.MONSTER_SKILL_PARAMS['Wanderer_Revive_Delay']
                 self.has_revived = True  # 标记已使用复活
         
-        return {
-            'blocked': blocked,
-            'evaded': evaded,
-            'actual_damage': actual_damage,
-            'died': died,
-            'will_revive': will_revive
-        }
+        return result
 
 # --- 怪物生成核心函数 ---
 
@@ -5,6 +5,8 @@
 """
 import random
 import pygame
+import config as game_config
+from systems.combat_log import combat_log, MONSTER_HIT, MONSTER_BLOCK, MONSTER_EVADE
 from systems.monsters.monster_base import MonsterBase
 from systems.monsters import config as mcfg
 
@@ -49,8 +51,8 @@ class Wanderer(MonsterBase):
         result = super().take_damage(damage, damage_source)
         
         # 游荡者：复活判定
-        if result['died'] and not self.has_revived:
-            result['will_revive'] = True
+        if result.died and not self.has_revived:
+            result.will_revive = True
             self.is_reviving = True
             self.revive_timer = mcfg.MONSTER_SKILL_PARAMS['Wanderer_Revive_Delay']
             self.has_revived = True  # 标记已使用复活
@@ -103,14 +105,9 @@ class Bucket(MonsterBase):
     
     def take_damage(self, damage, damage_source="未知"):
         """铁桶受伤：15%概率格挡，减少90%伤害"""
+        result = self.new_damage_result()
         if not self.is_alive or self.is_reviving:
-            return {
-                'blocked': False,
-                'evaded': False,
-                'actual_damage': 0,
-                'died': False,
-                'will_revive': False
-            }
+            return result
         
         blocked = False
         actual_damage = damage
@@ -130,27 +127,21 @@ class Bucket(MonsterBase):
         self.current_hp -= actual_damage
         
         # Debug日志
-        import config as game_config
         if game_config.DEBUG_COMBAT_LOG:
             if blocked:
-                print(f"[COMBAT] {self.name} 格挡！受到 {actual_damage:.1f} 伤害（原始：{damage:.1f}，减免90%）- HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+                combat_log.emit(MONSTER_BLOCK, self.name, actual_damage, damage, self.current_hp, self.max_hp)
             else:
-                print(f"[COMBAT] {self.name} 受到 {actual_damage:.1f} 伤害 - HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+                combat_log.emit(MONSTER_HIT, self.name, actual_damage, self.current_hp, self.max_hp)
         
         # 判定死亡
-        died = False
+        result.blocked = blocked
+        result.actual_damage = actual_damage
         if self.current_hp <= 0:
             self.current_hp = 0
             self.is_alive = False
-            died = True
+            result.died = True
         
-        return {
-            'blocked': blocked,
-            'evaded': False,
-            'actual_damage': actual_damage,
-            'died': died,
-            'will_revive': False
-        }
+        return result
     
     def get_base_skill_info(self):
         """返回先天技能信息"""
@@ -212,14 +203,9 @@ class Ghoul(MonsterBase):
     
     def take_damage(self, damage, damage_source="未知"):
         """食尸鬼受伤：20%概率完全闪避"""
+        result = self.new_damage_result()
         if not self.is_alive or self.is_reviving:
-            return {
-                'blocked': False,
-                'evaded': False,
-                'actual_damage': 0,
-                'died': False,
-                'will_revive': False
-            }
+            return result
         
         evaded = False
         actual_damage = damage
@@ -234,27 +220,21 @@ class Ghoul(MonsterBase):
         self.current_hp -= actual_damage
         
         # Debug日志
-        import config as game_config
         if game_config.DEBUG_COMBAT_LOG:
             if evaded:
-                print(f"[COMBAT] {self.name} 闪避！完全躲开攻击 - HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+                combat_log.emit(MONSTER_EVADE, self.name, self.current_hp, self.max_hp)
             else:
-                print(f"[COMBAT] {self.name} 受到 {actual_damage:.1f} 伤害 - HP: {self.current_hp:.1f}/{self.max_hp}", flush=True)
+                combat_log.emit(MONSTER_HIT, self.name, actual_damage, self.current_hp, self.max_hp)
         
         # 判定死亡
-        died = False
+        result.evaded = evaded
+        result.actual_damage = actual_damage
         if self.current_hp <= 0:
             self.current_hp = 0
             self.is_alive = False
-            died = True
+            result.died = True
         
-        return {
-            'blocked': False,
-            'evaded': evaded,
-            'actual_damage': actual_damage,
-            'died': died,
-            'will_revive': False
-        }
+        return result
     
     def get_base_skill_info(self):
         """返回先天技能信息"""
@@ -0,0 +1,79 @@
+# scheduler.py
+# 游戏内定时器：各系统登记 (到期时间, 回调)，由 Game 每帧推进游戏时间并只执行已到期的回调。
+# 复活倒计时、不死者残躯、召唤冷却、尸爆延迟不再每帧遍历全部怪物轮询，
+# 每帧开销只取决于实际到期的定时器数量（堆顶检查 O(1)，每个到期回调 O(log n)）。
+
+import heapq
+
+
+class Timer:
+    """一个已登记的定时器（schedule 的返回值，可用于 cancel）"""
+    __slots__ = ("due", "callback", "args", "cancelled")
+
+    def __init__(self, due, callback, args):
+        self.due = due              # 到期的游戏时间（秒）
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+
+class Scheduler:
+    """
+    基于最小堆的定时器调度器，时间单位为秒，使用游戏时间（由 advance(dt) 推进，暂停 / 结束时不走）。
+    同一时刻到期的定时器按登记顺序执行；回调中新登记的、本次已到期的定时器留到下一次 advance。
+    """
+    def __init__(self):
+        self.now = 0.0
+        self._heap = []   # (due, seq, Timer)
+        self._seq = 0
+        self._live = 0    # 未取消的定时器数量
+
+    def schedule(self, delay, callback, *args):
+        """delay 秒后调用 callback(*args)，返回 Timer"""
+        return self.schedule_at(self.now + max(0.0, delay), callback, *args)
+
+    def schedule_at(self, due, callback, *args):
+        """在游戏时间 due 调用 callback(*args)，返回 Timer"""
+        timer = Timer(due, callback, args)
+        heapq.heappush(self._heap, (due, self._seq, timer))
+        self._seq += 1
+        self._live += 1
+        return timer
+
+    def cancel(self, timer):
+        """取消定时器（惰性删除：留在堆中，到期时跳过）"""
+        if timer is not None and not timer.cancelled:
+            timer.cancelled = True
+            self._live -= 1
+
+    def time_left(self, timer):
+        """定时器剩余时间（秒），已到期为 0"""
+        return max(0.0, timer.due - self.now)
+
+    def advance(self, dt):
+        """推进游戏时间并执行所有到期的回调，返回执行的回调数"""
+        self.now += dt
+        now = self.now
+        heap = self._heap
+        seq_limit = self._seq  # 本次 advance 期间新登记的定时器不在本次执行
+        fired = 0
+        while heap and heap[0][0] <= now and heap[0][1] < seq_limit:
+            timer = heapq.heappop(heap)[2]
+            if timer.cancelled:
+                continue
+            timer.cancelled = True  # 已执行，之后 cancel 无效果
+            self._live -= 1
+            timer.callback(*timer.args)
+            fired += 1
+        return fired
+
+    def clear(self):
+        """丢弃全部定时器并把时间归零（重新开始游戏时调用）"""
+        for _, _, timer in self._heap:
+            timer.cancelled = True
+        self._heap.clear()
+        self._live = 0
+        self.now = 0.0
+
+    def __len__(self):
+        return self._live
@@ -0,0 +1,61 @@
+# test_sys_path.py
+# 导入路径守护测试：无界面运行若干帧（射击、受击、怪物攻击、召唤等热路径），
+# 检查 sys.path 长度在热身之后保持不变（热路径中不得修改 sys.path 或在函数内导入模块）
+import sys
+import os
+import random
+
+# 无窗口运行
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# 添加父目录到路径以便导入
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import config
+from core.game import Game
+from tests.test_game import TEST_MAP_10x10, test_monster_generator
+
+WARMUP_TICKS = 30
+TEST_TICKS = 600
+DT = 1 / 60
+
+
+def tick(game, i):
+    """模拟一帧：定期射击、让怪物发动攻击、玩家受击，然后更新并绘制"""
+    game.dt = DT
+    if not game.game_over:
+        monster = next(iter(game.monsters), None)
+        if i % 5 == 0:
+            target = (monster.pos.x, monster.pos.y) if monster else (0, 0)
+            game.player.last_shot_time = -10**9
+            shot = game.player.fire(target)
+            if shot is not None:
+                game.bullets.spawn(*shot)
+        if i % 20 == 0 and monster is not None:
+            monster.start_attack(game.player.pos, game.monsters, game)
+        if i % 30 == 0:
+            game.player.take_damage(1, "守护测试")
+    game.update()
+    game.draw()
+
+
+def main():
+    config.DEBUG_COMBAT_LOG = False
+    config.DEBUG_STARTUP_TIMING = False
+    random.seed(1)
+    game = Game(custom_map=TEST_MAP_10x10, monster_generator=test_monster_generator)
+
+    for i in range(WARMUP_TICKS):
+        tick(game, i)
+    baseline = len(sys.path)
+
+    for i in range(WARMUP_TICKS, WARMUP_TICKS + TEST_TICKS):
+        tick(game, i)
+        assert len(sys.path) == baseline, f"第 {i} 帧 sys.path 长度从 {baseline} 变为 {len(sys.path)}"
+
+    print(f"通过：{TEST_TICKS} 帧后 sys.path 长度保持 {baseline}")
+
+
+if __name__ == "__main__":
+    main()